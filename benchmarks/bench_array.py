@@ -0,0 +1,64 @@
+"""Benchmarks of batch distance computations in location_api.array.
+
+Compares a pure Python loop over :meth:`Point3D.distance_to` with
+:class:`PointArray` on the NumPy and the :class:`array.array` storage.
+
+Run from the repo root: ``python benchmarks/bench_array.py``
+"""
+
+import random
+from unittest.mock import patch
+
+from harness import bench, compare
+
+import location_api.array as array_module
+from location_api import Point3D
+from location_api.array import PointArray
+
+random.seed(0)
+WAYPOINTS = [
+    Point3D.trusted(
+        random.uniform(-5000, 5000),
+        random.uniform(-64, 320),
+        random.uniform(-5000, 5000),
+    )
+    for _ in range(10_000)
+]
+PLAYERS = WAYPOINTS[:20]
+
+
+def run() -> list[dict]:
+    loop = bench(
+        "distance_to loop (20 x 10000)",
+        lambda: [[p.distance_to(w) for w in WAYPOINTS] for p in PLAYERS],
+        repeat=3,
+    )
+    results = [loop]
+    with patch("location_api.array.np", None):
+        waypoints = PointArray.from_points(WAYPOINTS)
+        fallback = bench(
+            "PointArray.distances_to array('d')",
+            lambda: [waypoints.distances_to(p) for p in PLAYERS],
+            repeat=3,
+        )
+    compare(loop, fallback)
+    results.append(fallback)
+    if array_module.np is None:
+        return results
+    waypoints = PointArray.from_points(WAYPOINTS)
+    vectorized = bench(
+        "PointArray.distances_to numpy",
+        lambda: [waypoints.distances_to(p) for p in PLAYERS],
+    )
+    compare(loop, vectorized)
+    players = PointArray.from_points(PLAYERS)
+    matrix = bench(
+        "PointArray.distance_matrix numpy",
+        lambda: players.distance_matrix(waypoints),
+    )
+    compare(loop, matrix)
+    return results + [vectorized, matrix]
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,77 @@
+"""Benchmarks of the binary archive format in location_api.binary.
+
+Compares the file size, the time to open and the time of random access of an
+archive with a JSON file of :meth:`MCPosition.asdict` records.
+
+Run from the repo root: ``python benchmarks/bench_binary.py``
+"""
+
+import json
+import os
+import random
+import tempfile
+
+from harness import bench, compare
+
+from location_api import MCPosition, Point3D
+from location_api.binary import LocationArchive, dump_positions
+
+COUNT = 1_000_000
+
+random.seed(0)
+POSITIONS = [
+    MCPosition(
+        Point3D.trusted(
+            random.uniform(-10000, 10000),
+            random.uniform(-64, 320),
+            random.uniform(-10000, 10000),
+        ),
+        random.choice(["minecraft:overworld", "minecraft:the_nether"]),
+    )
+    for _ in range(COUNT)
+]
+INDEXES = [random.randrange(COUNT) for _ in range(1000)]
+
+
+def open_json(path: str) -> list[MCPosition]:
+    with open(path, encoding="utf-8") as file:
+        return MCPosition.from_dicts(json.load(file))
+
+
+def random_access(path: str) -> list[MCPosition]:
+    with LocationArchive(path) as archive:
+        return [archive[i] for i in INDEXES]
+
+
+def run() -> list[dict]:
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "positions.json")
+        binary_path = os.path.join(directory, "positions.locb")
+        with open(json_path, "w", encoding="utf-8") as file:
+            file.write(json.dumps([p.asdict() for p in POSITIONS]))
+        dump_positions(binary_path, POSITIONS)
+        json_size = os.path.getsize(json_path)
+        binary_size = os.path.getsize(binary_path)
+        print(f"{'JSON file size':<48} {json_size / 2**20:>12.1f} MiB")
+        print(f"{'archive file size':<48} {binary_size / 2**20:>12.1f} MiB")
+
+        load_json = bench(
+            f"load JSON and from_dicts ({COUNT})",
+            lambda: open_json(json_path),
+            repeat=1,
+        )
+        open_archive = bench(
+            f"open archive ({COUNT})",
+            lambda: LocationArchive(binary_path).close(),
+        )
+        compare(load_json, open_archive)
+        access = bench(
+            "open archive and read 1000 random records",
+            lambda: random_access(binary_path),
+        )
+        compare(load_json, access)
+    return [load_json, open_archive, access]
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,62 @@
+"""Benchmarks of the interned dimensions in location_api.dimension.
+
+Measures the memory held by the dimension strings of positions decoded from
+JSON, where every record carries its own copy of the string, and the cost of
+comparing two equal dimensions.
+
+Run from the repo root: ``python benchmarks/bench_dimension.py``
+"""
+
+import gc
+import json
+import tracemalloc
+
+from harness import bench, compare
+
+from location_api.dimension import Dimension
+
+COUNT = 100_000
+LINES = [
+    json.dumps(
+        {
+            "x": float(i),
+            "y": 64.0,
+            "z": float(-i),
+            "dimension": "minecraft:the_nether",
+        }
+    )
+    for i in range(COUNT)
+]
+
+
+def dimension_bytes(normalize: bool) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    dimensions = [json.loads(line)["dimension"] for line in LINES]
+    if normalize:
+        dimensions = [Dimension(d) for d in dimensions]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (after - before - dimensions.__sizeof__()) / COUNT
+
+
+def run() -> list[dict]:
+    results = []
+    for name, normalize in (("decoded strings", False), ("Dimension", True)):
+        size = dimension_bytes(normalize)
+        print(f"{name:<48} {size:>8.1f} B/position")
+        results.append({"name": name, "bytes_per_position": size})
+
+    first, second = (json.loads(line)["dimension"] for line in LINES[:2])
+    strings = bench("compare equal decoded strings", lambda: first == second)
+    first_dimension, second_dimension = Dimension(first), Dimension(second)
+    dimensions = bench(
+        "compare equal Dimension", lambda: first_dimension == second_dimension
+    )
+    compare(strings, dimensions)
+    return results + [strings, dimensions]
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,72 @@
+"""Benchmarks of the dict serialization of the core data types.
+
+Compares calling ``from_dict`` on every record with one ``from_dicts`` call,
+for flat and nested records, and measures ``asdict`` on the results.
+
+Run from the repo root: ``python benchmarks/bench_from_dicts.py``
+"""
+
+from harness import bench, compare
+
+from location_api import Location, MCPosition
+
+COUNT = 10_000
+FLAT = [
+    {
+        "x": i * 1.5,
+        "y": 64.0,
+        "z": -i * 0.5,
+        "dimension": "minecraft:overworld",
+        "name": f"warp{i}",
+        "description": None,
+        "other": {"owner": f"player{i % 100}"},
+    }
+    for i in range(COUNT)
+]
+NESTED = [
+    {
+        "position": {
+            "point": {"x": i * 1.5, "y": 64.0, "z": -i * 0.5},
+            "dimension": "minecraft:overworld",
+        },
+        "name": f"warp{i}",
+    }
+    for i in range(COUNT)
+]
+POSITIONS = [
+    {"x": i * 1.5, "y": 64, "z": -i * 0.5, "dimension": "minecraft:overworld"}
+    for i in range(COUNT)
+]
+
+
+def run() -> list[dict]:
+    results = []
+    cases = [
+        ("MCPosition flat", MCPosition, POSITIONS),
+        ("Location flat", Location, FLAT),
+        ("Location nested", Location, NESTED),
+    ]
+    for name, cls, records in cases:
+        per_record = bench(
+            f"{name} from_dict x {COUNT}",
+            lambda: [cls.from_dict(data) for data in records],
+            repeat=3,
+        )
+        batch = bench(
+            f"{name} from_dicts ({COUNT})",
+            lambda: cls.from_dicts(records),
+            repeat=3,
+        )
+        compare(per_record, batch)
+        objects = cls.from_dicts(records)
+        serialize = bench(
+            f"{name} asdict x {COUNT}",
+            lambda: [obj.asdict() for obj in objects],
+            repeat=3,
+        )
+        results += [per_record, batch, serialize]
+    return results
+
+
+if __name__ == "__main__":
+    run()
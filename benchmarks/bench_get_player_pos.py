@@ -0,0 +1,112 @@
+"""End-to-end benchmarks of get_player_pos, get_players_pos and snapshot_all_positions.
+
+``rcon_get`` is replaced by a stub answering realistic replies after an injected
+latency, so the whole lookup runs without a Minecraft server: command
+formatting, reply promotion, parsing and the position cache.
+
+Run from the repo root: ``python benchmarks/bench_get_player_pos.py``
+"""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+from returns.maybe import Some
+from returns.result import Success
+
+from harness import bench, compare
+from replies import dimension_reply, entity_reply, pos_reply
+
+from location_api.pos import (
+    get_player_pos,
+    get_players_pos,
+    invalidate_player_pos,
+    snapshot_all_positions,
+)
+
+PLAYERS = [f"Player{i}" for i in range(50)]
+SELECTOR_PREFIX = "execute as @a run data get entity @s "
+
+
+def stub_rcon_get(latency: float):
+    """Make a stub of ``rcon_get`` answering after ``latency`` seconds."""
+
+    async def rcon_get(_psi, command: str):
+        if latency:
+            await asyncio.sleep(latency)
+        if command.startswith(SELECTOR_PREFIX):
+            path = command.removeprefix(SELECTOR_PREFIX)
+            return Success(Some("".join(reply_to(p, path) for p in PLAYERS)))
+        _, _, rest = command.partition("data get entity ")
+        player, _, path = rest.partition(" ")
+        return Success(Some(reply_to(player, path)))
+
+    return rcon_get
+
+
+def reply_to(player: str, path: str) -> str:
+    if path == "Pos":
+        return pos_reply(player, -524.5, 71.0, -66.5)
+    if path == "Dimension":
+        return dimension_reply(player, "minecraft:overworld")
+    return entity_reply(player, -524.5, 71.0, -66.5, "minecraft:the_nether")
+
+
+def run_in(loop: asyncio.AbstractEventLoop, factory):
+    return lambda: loop.run_until_complete(factory())
+
+
+def run() -> list[dict]:
+    results = []
+    loop = asyncio.new_event_loop()
+    # Keep the lookups from resolving the interface from MCDR at every query.
+    psi = patch("location_api.runtime.psi", Mock(), create=True)
+    psi.start()
+    try:
+        with patch("location_api.pos.rcon_get", stub_rcon_get(0.0)):
+            two = bench(
+                "get_player_pos 2 queries, no latency",
+                run_in(loop, lambda: get_player_pos("Steve")),
+            )
+            single = bench(
+                "get_player_pos single query, no latency",
+                run_in(loop, lambda: get_player_pos("Steve", True)),
+            )
+            compare(two, single)
+            cached = bench(
+                "get_player_pos max_age hit",
+                run_in(loop, lambda: get_player_pos("Steve", max_age=60)),
+            )
+            compare(two, cached)
+            results += [two, single, cached]
+        invalidate_player_pos()
+
+        with patch("location_api.pos.rcon_get", stub_rcon_get(0.005)):
+            for concurrency in (1, 8, 50):
+                case = bench(
+                    f"get_players_pos 50 players, 5ms, concurrency {concurrency}",
+                    run_in(
+                        loop,
+                        lambda: get_players_pos(
+                            PLAYERS, concurrency=concurrency, single_query=True
+                        ),
+                    ),
+                    repeat=3,
+                )
+                if concurrency > 1:
+                    compare(results[3], case)
+                results.append(case)
+            snapshot = bench(
+                "snapshot_all_positions 50 players, 5ms",
+                run_in(loop, snapshot_all_positions),
+                repeat=3,
+            )
+            compare(results[4], snapshot)
+            results.append(snapshot)
+    finally:
+        psi.stop()
+        loop.close()
+    return results
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,102 @@
+"""Benchmarks of the position history in location_api.history.
+
+Measures the memory held by a full history of a player, kept as a list of
+:class:`TrackedPosition` or in :class:`PositionHistory`, and the cost of asking
+where the player was at a time.
+
+Run from the repo root: ``python benchmarks/bench_history.py``
+"""
+
+import gc
+import tracemalloc
+from bisect import bisect_right
+
+from harness import bench, compare
+
+from location_api import MCPosition, Point3D
+from location_api.history import PositionHistory, TrackedPosition
+
+CAPACITY = 600
+PLAYERS = 50
+
+
+def sample(player: int, t: int) -> tuple[MCPosition, float]:
+    position = MCPosition(
+        Point3D(float(player * 100 + t), 64.0, float(-t)),
+        "minecraft:overworld",
+    )
+    return position, float(t)
+
+
+def history_bytes(ring: bool) -> float:
+    # Build the positions first, so that only the history is measured.
+    samples = [
+        [sample(p, t) for t in range(CAPACITY * 2)] for p in range(PLAYERS)
+    ]
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    if ring:
+        history = PositionHistory(CAPACITY)
+        for p, player_samples in enumerate(samples):
+            for position, timestamp in player_samples:
+                history.record(f"Player{p}", position, timestamp)
+    else:
+        # Copy the positions, as the tracker gets a new one at every poll.
+        history = {
+            f"Player{p}": [
+                TrackedPosition(
+                    MCPosition(
+                        Point3D.trusted(position.x, position.y, position.z),
+                        position.dimension,
+                    ),
+                    timestamp,
+                )
+                for position, timestamp in player_samples[-CAPACITY:]
+            ]
+            for p, player_samples in enumerate(samples)
+        }
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del history
+    return (after - before) / (PLAYERS * CAPACITY)
+
+
+def run() -> list[dict]:
+    results = []
+    for name, ring in (
+        ("list of TrackedPosition", False),
+        ("PositionHistory", True),
+    ):
+        size = history_bytes(ring)
+        print(f"{name:<48} {size:>8.1f} B/position")
+        results.append({"name": name, "bytes_per_position": size})
+
+    samples = [TrackedPosition(*sample(0, t)) for t in range(CAPACITY)]
+    times = [s.timestamp for s in samples]
+    history = PositionHistory(CAPACITY)
+    for s in samples:
+        history.record("Player0", s.position, s.timestamp)
+    at = CAPACITY / 2 + 0.5
+    lookup = bench(
+        "list bisect nearest sample",
+        lambda: samples[bisect_right(times, at) - 1].position,
+    )
+    interpolated = bench(
+        "PositionHistory.position_at",
+        lambda: history.position_at("Player0", at),
+    )
+    compare(lookup, interpolated)
+    window = bench(
+        "PositionHistory.between (10 s)",
+        lambda: history.between("Player0", at - 10, at),
+    )
+    speed = bench(
+        "PositionHistory.speed (5 s window)",
+        lambda: history.speed("Player0", window=5.0),
+    )
+    return results + [lookup, interpolated, window, speed]
+
+
+if __name__ == "__main__":
+    run()
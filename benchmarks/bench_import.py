@@ -0,0 +1,63 @@
+"""Benchmarks of the import time of location_api.
+
+Every case imports modules in a fresh interpreter with ``-X importtime`` and
+reads the cumulative time of the imported modules, so the data model alone
+can be compared with the position lookups and MCDR.
+
+Run from the repo root: ``python benchmarks/bench_import.py``
+"""
+
+import os
+import subprocess
+import sys
+
+import harness  # noqa: F401
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CASES = {
+    "import location_api": "import location_api",
+    "import location_api.api": "import location_api.api",
+    "location_api.api.get_player_pos": (
+        "import location_api.api; location_api.api.get_player_pos"
+    ),
+    "import mcdreforged.api.all": "import mcdreforged.api.all",
+}
+
+
+def import_seconds(code: str) -> float:
+    """Import in a fresh interpreter and sum the cumulative time of top-level imports."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    total = 0
+    for line in stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = line.removeprefix("import time:").split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2]
+        if not name.startswith("  "):
+            total += int(parts[1])
+    return total / 1e6
+
+
+def bench_import(name: str, code: str, repeat: int = 5) -> dict:
+    seconds = min(import_seconds(code) for _ in range(repeat))
+    print(f"{name:<48} {seconds * 1e3:>10.1f} ms")
+    return {"name": name, "seconds": seconds, "repeat": repeat}
+
+
+def run() -> list[dict]:
+    results = [bench_import(name, code) for name, code in CASES.items()]
+    full, data_model = results[2], results[0]
+    ratio = full["seconds"] / data_model["seconds"]
+    print(f"{full['name']} takes {ratio:.2f}x {data_model['name']}")
+    return results
+
+
+if __name__ == "__main__":
+    run()
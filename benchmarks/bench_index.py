@@ -0,0 +1,72 @@
+"""Benchmarks of nearest and radius queries in location_api.index.
+
+Compares a linear scan calling :meth:`Point3D.distance_to` on every location
+with :class:`LocationIndex`.
+
+Run from the repo root: ``python benchmarks/bench_index.py``
+"""
+
+import random
+
+from harness import bench, compare
+
+from location_api import Location, MCPosition, Point3D
+from location_api.index import LocationIndex
+
+random.seed(0)
+LOCATIONS = [
+    Location(
+        MCPosition(
+            Point3D.trusted(
+                random.uniform(-10000, 10000),
+                random.uniform(-64, 320),
+                random.uniform(-10000, 10000),
+            ),
+            random.choice(["overworld", "the_nether", "the_end"]),
+        ),
+        f"warp{i}",
+    )
+    for i in range(50_000)
+]
+QUERY = MCPosition(Point3D.trusted(123.0, 64.0, -456.0), "overworld")
+
+
+def linear_nearest() -> Location:
+    return min(
+        (loc for loc in LOCATIONS if loc.dimension == QUERY.dimension),
+        key=lambda loc: loc.position.point.distance_to(QUERY.point),
+    )
+
+
+def linear_within_radius() -> list[Location]:
+    return [
+        loc
+        for loc in LOCATIONS
+        if loc.dimension == QUERY.dimension
+        and loc.position.point.distance_to(QUERY.point) <= 500.0
+    ]
+
+
+def run() -> list[dict]:
+    index = LocationIndex(LOCATIONS)
+    scan = bench("linear nearest (50000)", linear_nearest, repeat=3)
+    nearest = bench("LocationIndex.nearest", lambda: index.nearest(QUERY))
+    compare(scan, nearest)
+    scan_radius = bench(
+        "linear within 500 (50000)", linear_within_radius, repeat=3
+    )
+    radius = bench(
+        "LocationIndex.within_radius",
+        lambda: index.within_radius(QUERY, 500.0),
+    )
+    compare(scan_radius, radius)
+    build = bench(
+        "LocationIndex build (50000)",
+        lambda: LocationIndex(LOCATIONS),
+        repeat=3,
+    )
+    return [scan, nearest, scan_radius, radius, build]
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,81 @@
+"""Benchmark of streaming conversion in location_api.jsonl.
+
+Filters a dump of locations into another file, once by loading every record
+into a list first and once with :func:`iter_locations` and
+:func:`write_locations`, and reports the time and the peak memory of both.
+
+Run from the repo root: ``python benchmarks/bench_jsonl.py``
+"""
+
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+import harness  # noqa: F401
+
+from location_api import Location
+from location_api.jsonl import iter_locations, write_locations
+
+COUNT = 100_000
+
+
+def make_dump(path: str) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        for i in range(COUNT):
+            record = {
+                "x": i * 1.5,
+                "y": 64.0,
+                "z": -i * 0.5,
+                "dimension": ("overworld", "the_nether")[i % 2],
+                "name": f"warp{i}",
+                "description": None,
+                "other": {"owner": f"player{i % 100}"},
+            }
+            file.write(json.dumps(record) + "\n")
+
+
+def convert_in_memory(source: str, target: str) -> None:
+    with open(source, encoding="utf-8") as file:
+        locations = [Location.from_dict(json.loads(line)) for line in file]
+    kept = [loc.asdict() for loc in locations if loc.dimension == "the_nether"]
+    with open(target, "w", encoding="utf-8") as file:
+        file.writelines(json.dumps(record) + "\n" for record in kept)
+
+
+def convert_streaming(source: str, target: str) -> None:
+    write_locations(
+        target,
+        (
+            result.unwrap()
+            for result in iter_locations(source)
+            if result.unwrap().dimension == "the_nether"
+        ),
+    )
+
+
+def measure(name: str, func, source: str, target: str) -> dict:
+    tracemalloc.start()
+    started = time.perf_counter()
+    func(source, target)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<48} {elapsed:>8.2f} s {peak / 2**20:>10.1f} MiB peak")
+    return {"name": name, "seconds": elapsed, "peak_bytes": peak}
+
+
+def run() -> list[dict]:
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "dump.jsonl")
+        target = os.path.join(directory, "nether.jsonl")
+        make_dump(source)
+        return [
+            measure(f"in memory ({COUNT})", convert_in_memory, source, target),
+            measure(f"streaming ({COUNT})", convert_streaming, source, target),
+        ]
+
+
+if __name__ == "__main__":
+    run()
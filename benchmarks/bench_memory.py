@@ -0,0 +1,120 @@
+"""Memory benchmark of the core data types in location_api.
+
+Measures the bytes allocated per instance with :mod:`tracemalloc`, comparing
+the current slotted classes with ``__dict__`` based replicas of the classes
+before they were slotted.
+
+Run from the repo root: ``python benchmarks/bench_memory.py``
+"""
+
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable
+
+import harness  # noqa: F401
+
+from location_api import (
+    FrozenLocation,
+    FrozenMCPosition,
+    FrozenPoint3D,
+    Location,
+    MCPosition,
+    Point3D,
+)
+
+COUNT = 100_000
+
+
+@dataclass
+class LegacyPoint3D:
+    x: float
+    y: float
+    z: float
+
+
+@dataclass
+class LegacyMCPosition:
+    point: LegacyPoint3D
+    dimension: str
+
+
+@dataclass
+class LegacyLocation:
+    position: LegacyMCPosition
+    name: str
+    description: str | None = None
+    other: dict | None = None
+
+
+def bytes_per_instance(factory: Callable[..., object]) -> float:
+    """Measure the average bytes allocated by ``factory(i, x, y, z)`` over ``COUNT`` calls."""
+    # Build the coordinates first, so that only the objects are measured.
+    coords = [(float(i), 64.0, float(-i)) for i in range(COUNT)]
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    objects = [factory(i, *coords[i]) for i in range(COUNT)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # The list holding the objects is not part of their size.
+    list_size = objects.__sizeof__()
+    del objects
+    return (after - before - list_size) / COUNT
+
+
+CASES = {
+    "Point3D": {
+        "legacy": lambda i, x, y, z: LegacyPoint3D(x, y, z),
+        "slotted": lambda i, x, y, z: Point3D(x, y, z),
+        "frozen": lambda i, x, y, z: FrozenPoint3D(x, y, z),
+    },
+    "MCPosition": {
+        "legacy": lambda i, x, y, z: LegacyMCPosition(
+            LegacyPoint3D(x, y, z), "minecraft:overworld"
+        ),
+        "slotted": lambda i, x, y, z: MCPosition(
+            Point3D(x, y, z), "minecraft:overworld"
+        ),
+        "frozen": lambda i, x, y, z: FrozenMCPosition(
+            FrozenPoint3D(x, y, z), "minecraft:overworld"
+        ),
+    },
+    "Location": {
+        "legacy": lambda i, x, y, z: LegacyLocation(
+            LegacyMCPosition(LegacyPoint3D(x, y, z), "minecraft:overworld"),
+            "home",
+        ),
+        "slotted": lambda i, x, y, z: Location(
+            MCPosition(Point3D(x, y, z), "minecraft:overworld"), "home"
+        ),
+        "frozen": lambda i, x, y, z: FrozenLocation(
+            FrozenMCPosition(FrozenPoint3D(x, y, z), "minecraft:overworld"),
+            "home",
+        ),
+    },
+}
+
+
+def run() -> list[dict]:
+    results = []
+    for type_name, variants in CASES.items():
+        legacy = None
+        for variant, factory in variants.items():
+            size = bytes_per_instance(factory)
+            legacy = legacy or size
+            results.append(
+                {
+                    "name": f"{type_name} {variant}",
+                    "bytes_per_instance": size,
+                }
+            )
+            print(
+                f"{type_name + ' ' + variant:<48} {size:>8.1f} B/instance"
+                f" {size / legacy:>8.2f}x of legacy"
+            )
+    return results
+
+
+if __name__ == "__main__":
+    run()
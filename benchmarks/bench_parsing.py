@@ -0,0 +1,78 @@
+"""Micro-benchmarks of the server reply parsers in location_api.pos.
+
+The ``legacy`` cases reproduce the parsers before patterns were precompiled
+and the non-regex dimension fast path was added.
+
+Run from the repo root: ``python benchmarks/bench_parsing.py``
+"""
+
+import re
+
+from harness import bench, compare
+from replies import entity_reply
+
+from location_api import Point3D
+from location_api.pos import (
+    get_dimension_from_server_reply,
+    get_entity_data_from_server_reply,
+    get_point3d_from_server_reply,
+)
+
+POS_REPLY = (
+    "CleMooling has the following entity data: [-524.5d, 71.0d, -66.5d]"
+)
+DIM_REPLY = 'CleMooling has the following entity data: "minecraft:overworld"'
+ENTITY_REPLY = entity_reply(
+    "CleMooling", -524.5, 71.0, -66.5, "minecraft:overworld"
+)
+CUSTOM_REGEX = (
+    r"\[(-?\d+(?:\.\d+)?)d?,\s*(-?\d+(?:\.\d+)?)d?,\s*(-?\d+(?:\.\d+)?)d?\]"
+)
+
+
+def legacy_point3d(content: str, regex: str = CUSTOM_REGEX) -> Point3D:
+    match = re.compile(regex).search(content)
+    return Point3D(
+        x=float(match.group(1)),  # ty: ignore[possibly-missing-attribute]
+        y=float(match.group(2)),  # ty: ignore[possibly-missing-attribute]
+        z=float(match.group(3)),  # ty: ignore[possibly-missing-attribute]
+    )
+
+
+def legacy_dimension(content: str) -> str:
+    return re.search(r"minecraft:(\w+)", content).group(1)  # ty: ignore[possibly-missing-attribute]
+
+
+def run() -> list[dict]:
+    results = []
+    legacy = bench("point3d legacy", lambda: legacy_point3d(POS_REPLY))
+    default = bench(
+        "point3d default pattern",
+        lambda: get_point3d_from_server_reply(POS_REPLY, "CleMooling"),
+    )
+    compare(legacy, default)
+    custom = bench(
+        "point3d custom regex (cached)",
+        lambda: get_point3d_from_server_reply(POS_REPLY, regex=CUSTOM_REGEX),
+    )
+    compare(legacy, custom)
+    results += [legacy, default, custom]
+
+    legacy = bench("dimension legacy", lambda: legacy_dimension(DIM_REPLY))
+    fast = bench(
+        "dimension fast path",
+        lambda: get_dimension_from_server_reply(DIM_REPLY, "CleMooling"),
+    )
+    compare(legacy, fast)
+    results += [legacy, fast]
+
+    entity = bench(
+        "entity data of a survival player",
+        lambda: get_entity_data_from_server_reply(ENTITY_REPLY, "CleMooling"),
+    )
+    results.append(entity)
+    return results
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,53 @@
+"""Benchmarks of containment lookups in location_api.region.
+
+Compares testing every box with :meth:`BoundingBox.contains` with the
+chunk-bucketed :meth:`RegionSet.regions_at`.
+
+Run from the repo root: ``python benchmarks/bench_region.py``
+"""
+
+import random
+
+from harness import bench, compare
+
+from location_api import MCPosition, Point3D
+from location_api.region import BoundingBox, RegionSet
+
+random.seed(0)
+REGIONS = []
+for i in range(10_000):
+    corner = Point3D.trusted(
+        random.uniform(-10000, 10000),
+        random.uniform(-64, 200),
+        random.uniform(-10000, 10000),
+    )
+    size = random.choice((8.0, 32.0, 128.0))
+    box = BoundingBox.from_corners(
+        corner,
+        Point3D.trusted(corner.x + size, corner.y + 64, corner.z + size),
+    )
+    REGIONS.append((f"claim{i}", box, "overworld"))
+QUERY = MCPosition(Point3D.trusted(123.0, 64.0, -456.0), "overworld")
+
+
+def linear_regions_at() -> list[str]:
+    return [
+        name
+        for name, box, dimension in REGIONS
+        if dimension == QUERY.dimension and box.contains(QUERY)
+    ]
+
+
+def run() -> list[dict]:
+    regions = RegionSet(REGIONS)
+    scan = bench("linear containment (10000)", linear_regions_at, repeat=3)
+    lookup = bench("RegionSet.regions_at", lambda: regions.regions_at(QUERY))
+    compare(scan, lookup)
+    build = bench(
+        "RegionSet build (10000)", lambda: RegionSet(REGIONS), repeat=3
+    )
+    return [scan, lookup, build]
+
+
+if __name__ == "__main__":
+    run()
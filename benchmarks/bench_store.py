@@ -0,0 +1,70 @@
+"""Benchmarks of location_api.store on 100k locations.
+
+Measures loading and saving the file, and compares name lookups and dimension
+filters with a scan of the location list.
+
+Run from the repo root: ``python benchmarks/bench_store.py``
+"""
+
+import os
+import random
+import tempfile
+
+from harness import bench, compare
+
+from location_api import Location, MCPosition, Point3D
+from location_api.store import LocationStore
+
+random.seed(0)
+LOCATIONS = [
+    Location(
+        MCPosition(
+            Point3D.trusted(
+                random.uniform(-10000, 10000),
+                random.uniform(-64, 320),
+                random.uniform(-10000, 10000),
+            ),
+            random.choice(["overworld", "the_nether", "the_end"]),
+        ),
+        f"warp{i}",
+        None,
+        {"owner": f"player{i % 100}"},
+    )
+    for i in range(100_000)
+]
+
+
+def run() -> list[dict]:
+    store = LocationStore(LOCATIONS)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "locations.json")
+        save = bench(
+            "LocationStore.save_many (100000)",
+            lambda: store.save_many(path),
+            repeat=3,
+        )
+        load = bench(
+            "LocationStore.load (100000)",
+            lambda: LocationStore.load(path),
+            repeat=3,
+        )
+    scan = bench(
+        "scan by name",
+        lambda: next(loc for loc in LOCATIONS if loc.name == "warp99999"),
+    )
+    lookup = bench("LocationStore.get", lambda: store.get("warp99999"))
+    compare(scan, lookup)
+    scan_dimension = bench(
+        "scan by dimension",
+        lambda: [loc for loc in LOCATIONS if loc.dimension == "the_end"],
+    )
+    in_dimension = bench(
+        "LocationStore.in_dimension",
+        lambda: store.in_dimension("the_end"),
+    )
+    compare(scan_dimension, in_dimension)
+    return [save, load, scan, lookup, scan_dimension, in_dimension]
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,40 @@
+"""Benchmarks of the runtime type checking modes in location_api.validation.
+
+Run from the repo root: ``python benchmarks/bench_validation.py``
+"""
+
+from harness import bench, compare
+
+from location_api import Point3D
+from location_api.validation import ValidationMode, validation_mode
+
+A = Point3D(1.0, 2.0, 3.0)
+B = Point3D(4.0, 6.0, 3.0)
+
+
+def run() -> list[dict]:
+    results = []
+    baseline = {}
+    for mode in ValidationMode:
+        with validation_mode(mode):
+            construct = bench(
+                f"Point3D() {mode}", lambda: Point3D(1.0, 2.0, 3.0)
+            )
+            distance = bench(
+                f"Point3D.distance_to() {mode}", lambda: A.distance_to(B)
+            )
+        baseline.setdefault("construct", construct)
+        baseline.setdefault("distance", distance)
+        compare(baseline["construct"], construct)
+        compare(baseline["distance"], distance)
+        results += [construct, distance]
+    trusted = bench(
+        "Point3D.trusted()", lambda: Point3D.trusted(1.0, 2.0, 3.0)
+    )
+    compare(baseline["construct"], trusted)
+    results.append(trusted)
+    return results
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,260 @@
+"""A stand-in Minecraft RCON server for load-testing position lookups.
+
+The server speaks the Source RCON protocol and answers ``data get entity`` for
+synthetic players, each moving along its own circle around a random center.
+The latency, jitter and error rate of the answers are configurable.
+
+Like a Minecraft server, it handles the commands of one connection one after
+another, splits a response into packets of 4096 bytes, and answers other packet
+types with ``Unknown request``.
+
+Serve it on its own with:
+
+.. code-block:: bash
+
+    python benchmarks/fake_rcon.py --port 25575 --players 100 --latency 0.005
+
+or use :class:`FakeRconServer` in a script with
+:class:`~location_api.rcon.PooledRconTransport`, like ``benchmarks/load_test.py`` does.
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import time
+from typing import Self
+
+import harness  # noqa: F401
+from replies import dimension_reply, entity_reply, pos_reply
+
+from location_api.rcon import (
+    MAX_RESPONSE_BODY,
+    SERVERDATA_AUTH,
+    SERVERDATA_AUTH_RESPONSE,
+    SERVERDATA_EXECCOMMAND,
+    SERVERDATA_RESPONSE_VALUE,
+    encode_packet,
+    read_packet,
+)
+
+ERROR_REPLY = "An unexpected error occurred trying to execute that command"
+NOT_FOUND_REPLY = "No entity was found"
+SELECTOR_PREFIX = "execute as @a run data get entity @s"
+
+
+class SyntheticPlayer:
+    """A player walking along a circle at a constant speed."""
+
+    def __init__(self, name: str, rng: random.Random):
+        self.name = name
+        self.center = (rng.uniform(-5000, 5000), rng.uniform(-5000, 5000))
+        self.radius = rng.uniform(5, 200)
+        self.speed = rng.uniform(1.0, 8.0)  # blocks per second
+        self.phase = rng.uniform(0, math.tau)
+        self.dimension = "minecraft:overworld"
+        if rng.random() < 0.1:
+            self.dimension = "minecraft:the_nether"
+
+    def position(self, now: float) -> tuple[float, float, float]:
+        angle = self.phase + now * self.speed / self.radius
+        x = self.center[0] + self.radius * math.cos(angle)
+        z = self.center[1] + self.radius * math.sin(angle)
+        y = 64.0 + 4.0 * math.sin(angle * 3)
+        return round(x, 6), round(y, 6), round(z, 6)
+
+
+class FakeRconServer:
+    """An asyncio RCON server answering position queries of synthetic players."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        password: str = "password",
+        players: int = 100,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        """
+        :param host: The host to listen on. Defaults to ``"127.0.0.1"``.
+        :param port: The port to listen on. Defaults to ``0`` as any free port.
+        :param password: The RCON password. Defaults to ``"password"``.
+        :param players: The number of synthetic players, named ``Player0`` and so on.
+        :param latency: Seconds before answering a command. Defaults to ``0.0``.
+        :param jitter: The maximum seconds added to or removed from the latency at random.
+        :param error_rate: The probability of answering a command with an error.
+        :param seed: The seed of the players and the randomness.
+        """
+        self.host = host
+        self.port = port
+        self.password = password
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self._rng = random.Random(seed)
+        self.players = {
+            f"Player{i}": SyntheticPlayer(f"Player{i}", self._rng)
+            for i in range(players)
+        }
+        self.commands = 0
+        """The number of commands answered.
+        """
+        self.errors = 0
+        """The number of commands answered with an injected error.
+        """
+        self._server: asyncio.Server | None = None
+        self._writers: set[asyncio.StreamWriter] = set()
+        self._started = time.monotonic()
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_exc) -> None:
+        await self.stop()
+
+    async def start(self) -> None:
+        """Start listening, :attr:`port` is the actual port afterward."""
+        self._server = await asyncio.start_server(
+            self._handle, self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Stop listening and close the connections."""
+        if self._server is not None:
+            self._server.close()
+            for writer in self._writers:
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        await self._server.serve_forever()  # ty: ignore[possibly-missing-attribute]
+
+    def answer(self, command: str) -> str:
+        """Answer a command as a Minecraft server does."""
+        words = command.split()
+        if command.startswith(SELECTOR_PREFIX):
+            # Like vanilla RCON, the messages are joined without a separator.
+            path = command[len(SELECTOR_PREFIX) :]
+            return "".join(
+                self.answer(f"data get entity {name}{path}")
+                for name in self.players
+            )
+        if words[:3] == ["data", "get", "entity"] and len(words) in (4, 5):
+            player = self.players.get(words[3])
+            if player is None:
+                return NOT_FOUND_REPLY
+            x, y, z = player.position(time.monotonic() - self._started)
+            path = words[4] if len(words) == 5 else None
+            if path == "Pos":
+                return pos_reply(player.name, x, y, z)
+            if path == "Dimension":
+                return dimension_reply(player.name, player.dimension)
+            if path is None:
+                return entity_reply(player.name, x, y, z, player.dimension)
+            return f"Found no elements matching {path}"
+        if words == ["list"]:
+            names = ", ".join(self.players)
+            return (
+                f"There are {len(self.players)} of a max of "
+                f"{len(self.players)} players online: {names}"
+            )
+        return "Unknown or incomplete command, see below for error"
+
+    async def _delay(self) -> None:
+        delay = self.latency + self._rng.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _respond(
+        writer: asyncio.StreamWriter, request_id: int, reply: str
+    ) -> None:
+        data = reply.encode("utf-8")
+        for start in range(0, max(len(data), 1), MAX_RESPONSE_BODY):
+            chunk = data[start : start + MAX_RESPONSE_BODY]
+            writer.write(
+                encode_packet(
+                    request_id,
+                    SERVERDATA_RESPONSE_VALUE,
+                    chunk.decode("utf-8", "replace"),
+                )
+            )
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        authenticated = False
+        self._writers.add(writer)
+        try:
+            while True:
+                request_id, packet_type, raw = await read_packet(reader)
+                body = raw.decode("utf-8")
+                if packet_type == SERVERDATA_AUTH:
+                    authenticated = body == self.password
+                    writer.write(
+                        encode_packet(
+                            request_id if authenticated else -1,
+                            SERVERDATA_AUTH_RESPONSE,
+                            "",
+                        )
+                    )
+                elif not authenticated:
+                    break
+                elif packet_type == SERVERDATA_EXECCOMMAND:
+                    await self._delay()
+                    self.commands += 1
+                    if self._rng.random() < self.error_rate:
+                        self.errors += 1
+                        reply = ERROR_REPLY
+                    else:
+                        reply = self.answer(body)
+                    self._respond(writer, request_id, reply)
+                else:
+                    self._respond(
+                        writer, request_id, f"Unknown request {packet_type:x}"
+                    )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve a fake RCON server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=25575)
+    parser.add_argument("--password", default="password")
+    parser.add_argument("--players", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    server = FakeRconServer(
+        args.host,
+        args.port,
+        args.password,
+        args.players,
+        args.latency,
+        args.jitter,
+        args.error_rate,
+        args.seed,
+    )
+    print(f"Serving {args.players} players on {args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
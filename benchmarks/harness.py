@@ -0,0 +1,33 @@
+"""Tiny timing helpers shared by the benchmark scripts."""
+
+import os
+import sys
+import timeit
+from typing import Callable
+
+# Make location_api importable when running a script from the repo root.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def bench(name: str, func: Callable[[], object], repeat: int = 5) -> dict:
+    """Time a callable and print the best time per call.
+
+    :param name: The name of the benchmark case.
+    :param func: The callable to time, called without arguments.
+    :param repeat: How many rounds to run, the fastest round is reported.
+
+    :return: A dict with the case name, calls per round and nanoseconds per call.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+    result = {"name": name, "number": number, "ns_per_call": best * 1e9}
+    print(f"{name:<48} {best * 1e9:>12.1f} ns/call")
+    return result
+
+
+def compare(baseline: dict, candidate: dict) -> float:
+    """Print and return how many times faster ``candidate`` is than ``baseline``."""
+    speedup = baseline["ns_per_call"] / candidate["ns_per_call"]
+    print(f"{'':<48} {speedup:>12.2f}x vs {baseline['name']}")
+    return speedup
@@ -0,0 +1,167 @@
+"""Load-test get_player_pos against the fake RCON server.
+
+Lookups go through :class:`~location_api.rcon.PooledRconTransport` talking to
+:mod:`fake_rcon` over TCP, so every lookup goes through the network, the server
+latency and the parsers. The driver keeps ``--concurrency`` lookups in flight over
+``--connections`` RCON connections for ``--duration`` seconds, then reports the
+throughput and the latency percentiles:
+
+.. code-block:: bash
+
+    python benchmarks/load_test.py --players 200 --latency 0.002 --jitter 0.001
+
+The server is started in the same process, unless ``--port`` points to one
+already running.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import statistics
+import time
+
+import harness  # noqa: F401
+from fake_rcon import FakeRconServer
+from returns.result import Success
+
+from location_api.pos import get_player_pos, set_transport
+from location_api.rcon import PooledRconTransport
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return float("nan")
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+async def drive(
+    players: list[str],
+    duration: float,
+    concurrency: int,
+    single_query: bool,
+) -> tuple[list[float], int, float]:
+    """Look up the players round-robin until ``duration`` seconds passed.
+
+    :return: The latencies of the successful lookups, the number of failures
+        and the elapsed seconds.
+    """
+    latencies: list[float] = []
+    failures = 0
+    turns = itertools.cycle(players)
+    deadline = time.perf_counter() + duration
+
+    async def worker() -> None:
+        nonlocal failures
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            result = await get_player_pos(next(turns), single_query)
+            if isinstance(result, Success):
+                latencies.append(time.perf_counter() - start)
+            else:
+                failures += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, failures, time.perf_counter() - start
+
+
+async def load_test(args: argparse.Namespace) -> dict:
+    server = None
+    port = args.port
+    if port is None:
+        server = FakeRconServer(
+            password=args.password,
+            players=args.players,
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            seed=args.seed,
+        )
+        await server.start()
+        port = server.port
+    transport = PooledRconTransport(
+        args.host,
+        port,
+        args.password,
+        connections=args.connections,
+        pipeline=args.pipeline,
+    )
+    set_transport(transport)
+    try:
+        latencies, failures, elapsed = await drive(
+            [f"Player{i}" for i in range(args.players)],
+            args.duration,
+            args.concurrency,
+            args.single_query,
+        )
+    finally:
+        set_transport()
+        transport.close()
+        if server is not None:
+            await server.stop()
+
+    latencies.sort()
+    lookups = len(latencies) + failures
+    return {
+        "players": args.players,
+        "concurrency": args.concurrency,
+        "connections": args.connections,
+        "pipeline": args.pipeline,
+        "single_query": args.single_query,
+        "latency": args.latency,
+        "jitter": args.jitter,
+        "error_rate": args.error_rate,
+        "lookups": lookups,
+        "failures": failures,
+        "lookups_per_second": lookups / elapsed,
+        "mean_ms": statistics.fmean(latencies) * 1e3 if latencies else None,
+        "p50_ms": percentile(latencies, 0.50) * 1e3,
+        "p95_ms": percentile(latencies, 0.95) * 1e3,
+        "p99_ms": percentile(latencies, 0.99) * 1e3,
+        "max_ms": latencies[-1] * 1e3 if latencies else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=100)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--connections", type=int, default=1)
+    parser.add_argument("--pipeline", type=int, default=1)
+    parser.add_argument("--single-query", action="store_true")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument(
+        "--port",
+        type=int,
+        help="The port of a running fake_rcon.py. Defaults to starting one.",
+    )
+    parser.add_argument("--password", default="password")
+    parser.add_argument(
+        "-o", "--output", help="The JSON file to write the report to."
+    )
+    args = parser.parse_args()
+
+    report = asyncio.run(load_test(args))
+    print(
+        f"{report['lookups']} lookups, {report['failures']} failed, "
+        f"{report['lookups_per_second']:.0f}/s"
+    )
+    print(
+        "latency ms: "
+        f"p50 {report['p50_ms']:.2f}  p95 {report['p95_ms']:.2f}  "
+        f"p99 {report['p99_ms']:.2f}  max {report['max_ms']:.2f}"
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
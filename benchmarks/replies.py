@@ -0,0 +1,55 @@
+"""Realistic server replies of ``data get entity`` shared by the benchmarks.
+
+The full entity data is modeled on a survival player with a few items, so the
+parsers skip over nested compounds and lists as they do on a real server.
+"""
+
+
+def pos_reply(player: str, x: float, y: float, z: float) -> str:
+    """The reply of ``data get entity <player> Pos``."""
+    return f"{player} has the following entity data: [{x}d, {y}d, {z}d]"
+
+
+def dimension_reply(player: str, dimension: str) -> str:
+    """The reply of ``data get entity <player> Dimension``."""
+    return f'{player} has the following entity data: "{dimension}"'
+
+
+def entity_reply(
+    player: str, x: float, y: float, z: float, dimension: str
+) -> str:
+    """The reply of ``data get entity <player>``."""
+    inventory = ", ".join(
+        f'{{Slot: {slot}b, id: "minecraft:{item}", count: {count}}}'
+        for slot, (item, count) in enumerate(
+            [
+                ("diamond_sword", 1),
+                ("cooked_beef", 48),
+                ("torch", 64),
+                ("oak_planks", 37),
+                ("water_bucket", 1),
+                ("iron_pickaxe", 1),
+            ]
+        )
+    )
+    return (
+        f"{player} has the following entity data: {{"
+        "AbsorptionAmount: 0.0f, Air: 300s, Attributes: [{base: 0.1d, "
+        'id: "minecraft:movement_speed"}, {base: 4.0d, '
+        'id: "minecraft:attack_speed"}], Brain: {memories: {}}, '
+        "DataVersion: 3955, DeathTime: 0s, "
+        f'Dimension: "{dimension}", EnderItems: [], FallDistance: 0.0f, '
+        "FallFlying: 0b, Fire: -20s, FoodExhaustionLevel: 1.2f, "
+        "FoodLevel: 20, FoodSaturationLevel: 5.0f, Health: 20.0f, "
+        f"HurtByTimestamp: 0, HurtTime: 0s, Inventory: [{inventory}], "
+        "Invulnerable: 0b, Motion: [0.0d, -0.0784000015258789d, 0.0d], "
+        "OnGround: 1b, PortalCooldown: 0, "
+        f"Pos: [{x}d, {y}d, {z}d], "
+        "Rotation: [-92.4f, 18.3f], Score: 0, SelectedItemSlot: 0, "
+        "SleepTimer: 0s, UUID: [I; 1, 2, 3, 4], XpLevel: 7, XpP: 0.25f, "
+        "XpSeed: 0, XpTotal: 100, abilities: {flySpeed: 0.05f, flying: 0b, "
+        "instabuild: 0b, invulnerable: 0b, mayBuild: 1b, mayfly: 0b, "
+        "walkSpeed: 0.1f}, playerGameType: 0, "
+        'recipeBook: {recipes: ["minecraft:crafting_table"], '
+        "toBeDisplayed: []}, seenCredits: 0b}"
+    )
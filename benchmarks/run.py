@@ -0,0 +1,147 @@
+"""Run the benchmark suite and write the results as JSON.
+
+Every ``bench_*.py`` script next to this one is imported and its ``run()`` is
+called. The results are written with the environment they were measured in, and
+can be compared with the results of another version:
+
+.. code-block:: bash
+
+    python benchmarks/run.py --output before.json
+    # switch to another version
+    python benchmarks/run.py --output after.json --compare before.json
+
+A case whose metric grew more than ``--threshold`` times is reported as a
+regression, and the exit code is ``1`` if any case regressed.
+"""
+
+import argparse
+import datetime
+import importlib
+import json
+import os
+import platform
+import subprocess
+import sys
+
+import harness  # noqa: F401
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+# The metrics where lower is better, in the order they are looked up.
+METRICS = (
+    "ns_per_call",
+    "bytes_per_instance",
+    "bytes_per_position",
+    "seconds",
+)
+
+
+def discover() -> list[str]:
+    """List the benchmark scripts by module name."""
+    return sorted(
+        name.removesuffix(".py")
+        for name in os.listdir(BENCHMARKS_DIR)
+        if name.startswith("bench_") and name.endswith(".py")
+    )
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=BENCHMARKS_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment() -> dict:
+    from location_api.api import version
+
+    return {
+        "location_api": version,
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "time": datetime.datetime.now(datetime.UTC).isoformat(),
+    }
+
+
+def metric(result: dict) -> tuple[str, float] | None:
+    for name in METRICS:
+        if name in result:
+            return name, result[name]
+    return None
+
+
+def compare_results(baseline: dict, current: dict, threshold: float) -> int:
+    """Print the ratio of every case found in both results.
+
+    :return: The number of regressions.
+    """
+    regressions = 0
+    for suite, results in current["suites"].items():
+        previous = {r["name"]: r for r in baseline["suites"].get(suite, [])}
+        for result in results:
+            old = previous.get(result["name"])
+            new_metric = metric(result)
+            if old is None or new_metric is None:
+                continue
+            name, value = new_metric
+            if name not in old or not old[name]:
+                continue
+            ratio = value / old[name]
+            flag = "REGRESSION" if ratio > threshold else ""
+            regressions += bool(flag)
+            print(f"{suite:<24} {result['name']:<52} {ratio:>7.2f}x {flag}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "suites",
+        nargs="*",
+        help="Benchmark scripts to run, such as bench_parsing. Defaults to all.",
+    )
+    parser.add_argument(
+        "-o", "--output", help="The JSON file to write the results to."
+    )
+    parser.add_argument(
+        "-c", "--compare", help="The JSON file of results to compare with."
+    )
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="The ratio above which a case is a regression. Defaults to 1.2.",
+    )
+    args = parser.parse_args(argv)
+
+    suites = args.suites or discover()
+    output = {"environment": environment(), "suites": {}}
+    for suite in suites:
+        print(f"== {suite}")
+        module = importlib.import_module(suite)
+        output["suites"][suite] = module.run()
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(output, file, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+        print(f"== compared with {args.compare}")
+        if compare_results(baseline, output, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
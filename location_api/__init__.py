@@ -4,10 +4,11 @@ This module provides a set of dataclasses to represent points in 2D and 3D space
 Minecraft positions (point + dimension), and named locations with metadata.
 """
 
-from dataclasses import dataclass, fields
+import math
+from collections.abc import Iterable
+from dataclasses import FrozenInstanceError, dataclass, fields
 from typing import Self
 
-from beartype import beartype
 from primitive_type import (
     PrimitiveMap,
     get_str_object,
@@ -15,9 +16,12 @@ from primitive_type import (
     is_nested_dict,
 )
 
+from location_api.dimension import Dimension, as_dimension
+from location_api.validation import validated
 
-@dataclass
-@beartype
+
+@validated(skip=("trusted",))
+@dataclass(slots=True)
 class Point3D:
     """Define a 3D point with x, y, z coordinates.
 
@@ -38,6 +42,24 @@ class Point3D:
     def __str__(self) -> str:
         return "[{}, {}, {}]".format(self.x, self.y, self.z)
 
+    @classmethod
+    def trusted(cls, x: float, y: float, z: float) -> Self:
+        """Create a 3D point without runtime type checking, whatever the validation mode is.
+
+        Only use it with values known to be floats, such as those just returned by :func:`float`.
+
+        :param x: The x-coordinate of the point.
+        :param y: The y-coordinate of the point.
+        :param z: The z-coordinate of the point.
+
+        :return: The 3D point instance.
+        """
+        point = object.__new__(cls)
+        point.x = x
+        point.y = y
+        point.z = z
+        return point
+
     def distance_to(self, point: Self) -> float:
         """Calculate the Euclidean distance between this point and another point.
 
@@ -60,6 +82,56 @@ class Point3D:
         """
         return ((self.x - point.x) ** 2 + (self.z - point.z) ** 2) ** 0.5
 
+    def distance_squared_to(self, point: Self) -> float:
+        """Calculate the squared Euclidean distance between this point and another point.
+
+        It's cheaper than :meth:`distance_to` and orders points the same way.
+
+        :param point: The other 3D point to calculate the distance to.
+
+        :return: The squared Euclidean distance between this point and another point.
+        """
+        dx = self.x - point.x
+        dy = self.y - point.y
+        dz = self.z - point.z
+        return dx * dx + dy * dy + dz * dz
+
+    def distance2d_squared_to(self, point: "Point3D | Point2D") -> float:
+        """Calculate the squared 2D Euclidean distance between this point and another point.
+
+        :param point: The other 2D or 3D point to calculate the distance to.
+
+        :return: The squared 2D Euclidean distance between this point and another point.
+        """
+        dx = self.x - point.x
+        dz = self.z - point.z
+        return dx * dx + dz * dz
+
+    def within(self, point: Self, radius: float) -> bool:
+        """Check whether another point is within a distance of this point, without a square root.
+
+        :param point: The other 3D point.
+        :param radius: The maximum distance, inclusive.
+
+        :return: :obj:`True` if the distance is at most ``radius``.
+        """
+        dx = self.x - point.x
+        dy = self.y - point.y
+        dz = self.z - point.z
+        return radius >= 0 and dx * dx + dy * dy + dz * dz <= radius * radius
+
+    def within2d(self, point: "Point3D | Point2D", radius: float) -> bool:
+        """Check whether another point is within a 2D distance of this point, ignoring the y coordinate.
+
+        :param point: The other 2D or 3D point.
+        :param radius: The maximum 2D distance, inclusive.
+
+        :return: :obj:`True` if the 2D distance is at most ``radius``.
+        """
+        dx = self.x - point.x
+        dz = self.z - point.z
+        return radius >= 0 and dx * dx + dz * dz <= radius * radius
+
     def height_to(self, point: Self) -> float:
         """Calculate the height difference between this point and another point.
 
@@ -78,18 +150,18 @@ class Point3D:
 
         :return: The 3D point instance.
         """
-        return cls(x=point.x, y=y, z=point.z)
+        return cls.trusted(point.x, y, point.z)
 
     def to_point2d(self) -> "Point2D":
         """Create a 2D point from a 3D point.
 
         :return: The 2D point instance.
         """
-        return Point2D(x=self.x, z=self.z)
+        return Point2D.trusted(self.x, self.z)
 
 
-@dataclass
-@beartype
+@validated(skip=("trusted",))
+@dataclass(slots=True)
 class Point2D:
     """Define a 2D point with x and z coordinates.
 
@@ -107,6 +179,22 @@ class Point2D:
     def __str__(self) -> str:
         return "[{}, {}]".format(self.x, self.z)
 
+    @classmethod
+    def trusted(cls, x: float, z: float) -> Self:
+        """Create a 2D point without runtime type checking, whatever the validation mode is.
+
+        Only use it with values known to be floats, such as those just returned by :func:`float`.
+
+        :param x: The x-coordinate of the point.
+        :param z: The z-coordinate of the point.
+
+        :return: The 2D point instance.
+        """
+        point = object.__new__(cls)
+        point.x = x
+        point.z = z
+        return point
+
     def distance_to(self, point: Self) -> float:
         """Calculate the Euclidean distance between this point and another point.
 
@@ -125,6 +213,54 @@ class Point2D:
         """
         return ((self.x - point.x) ** 2 + (self.z - point.z) ** 2) ** 0.5
 
+    def distance_squared_to(self, point: Self) -> float:
+        """Calculate the squared Euclidean distance between this point and another point.
+
+        It's cheaper than :meth:`distance_to` and orders points the same way.
+
+        :param point: The other 2D point to calculate the distance to.
+
+        :return: The squared Euclidean distance between this point and another point.
+        """
+        dx = self.x - point.x
+        dz = self.z - point.z
+        return dx * dx + dz * dz
+
+    def distance2d_squared_to(self, point: "Point2D | Point3D") -> float:
+        """Calculate the squared 2D Euclidean distance between this point and another point.
+
+        :param point: The other 2D or 3D point to calculate the distance to.
+
+        :return: The squared 2D Euclidean distance between this point and another point.
+        """
+        dx = self.x - point.x
+        dz = self.z - point.z
+        return dx * dx + dz * dz
+
+    def within(self, point: Self, radius: float) -> bool:
+        """Check whether another point is within a distance of this point, without a square root.
+
+        :param point: The other 2D point.
+        :param radius: The maximum distance, inclusive.
+
+        :return: :obj:`True` if the distance is at most ``radius``.
+        """
+        dx = self.x - point.x
+        dz = self.z - point.z
+        return radius >= 0 and dx * dx + dz * dz <= radius * radius
+
+    def within2d(self, point: "Point2D | Point3D", radius: float) -> bool:
+        """Check whether another point is within a 2D distance of this point.
+
+        :param point: The other 2D or 3D point.
+        :param radius: The maximum 2D distance, inclusive.
+
+        :return: :obj:`True` if the 2D distance is at most ``radius``.
+        """
+        dx = self.x - point.x
+        dz = self.z - point.z
+        return radius >= 0 and dx * dx + dz * dz <= radius * radius
+
     @classmethod
     def from_point3d(cls, point: "Point3D") -> Self:
         """Create a 2D point from a 3D point.
@@ -133,7 +269,7 @@ class Point2D:
 
         :return: The 2D point instance.
         """
-        return cls(x=point.x, z=point.z)
+        return cls.trusted(point.x, point.z)
 
     def to_point3d(self, y: float) -> "Point3D":
         """Create a 3d point from a 2d point and a height as y coordinate.
@@ -142,10 +278,147 @@ class Point2D:
 
         :return: The 3d point instance.
         """
-        return Point3D(x=self.x, y=y, z=self.z)
+        return Point3D.trusted(self.x, y, self.z)
+
+
+_NUMBERS = (float, int)
+
 
+def _has_coords_and_point(keys: Iterable[str]) -> bool:
+    return any(
+        ("x" in k or "y" in k or "z" in k) and "point" in k for k in keys
+    )
 
-@dataclass
+
+class _PositionShape:
+    """The shape of position dicts, detected once by the batch deserializers.
+
+    :meth:`read` returns :obj:`None` for a dict of another shape or holding values
+    to be converted, which should be deserialized by ``from_dict`` instead.
+    """
+
+    __slots__ = ("keys", "point_keys", "dimension_key")
+
+    def __init__(
+        self,
+        keys: frozenset,
+        point_keys: frozenset | None,
+        dimension_key: str | None,
+    ):
+        self.keys = keys
+        self.point_keys = point_keys
+        self.dimension_key = dimension_key
+
+    @classmethod
+    def detect(cls, data: object) -> "_PositionShape | None":
+        if type(data) is not dict:
+            return None
+        keys = frozenset(data)
+        if not all(type(k) is str for k in keys) or _has_coords_and_point(
+            keys
+        ):
+            return None
+        if "dimension" in keys:
+            dimension_key = "dimension"
+        elif "dim" in keys:
+            dimension_key = "dim"
+        else:
+            dimension_key = None
+        point = data.get("point")
+        if point:
+            if type(point) is not dict:
+                return None
+            return cls(keys, frozenset(point), dimension_key)
+        if "point" in keys:
+            return None
+        return cls(keys, None, dimension_key)
+
+    def read(self, data: object) -> tuple | None:
+        if type(data) is not dict or data.keys() != self.keys:
+            return None
+        coords = data
+        if self.point_keys is not None:
+            coords = data["point"]
+            if type(coords) is not dict or coords.keys() != self.point_keys:
+                return None
+        x = coords.get("x")
+        y = coords.get("y")
+        z = coords.get("z")
+        if not (
+            type(x) in _NUMBERS and type(y) in _NUMBERS and type(z) in _NUMBERS
+        ):
+            return None
+        dimension = data[self.dimension_key] if self.dimension_key else None
+        return float(x), float(y), float(z), dimension
+
+
+class _LocationShape:
+    """The shape of location dicts, detected once by :meth:`Location.from_dicts`."""
+
+    __slots__ = ("keys", "position", "nested", "description_key")
+
+    def __init__(
+        self,
+        keys: frozenset,
+        position: _PositionShape,
+        nested: bool,
+        description_key: str | None,
+    ):
+        self.keys = keys
+        self.position = position
+        self.nested = nested
+        self.description_key = description_key
+
+    @classmethod
+    def detect(cls, data: object) -> "_LocationShape | None":
+        if type(data) is not dict or "name" not in data:
+            return None
+        keys = frozenset(data)
+        if "description" in keys:
+            description_key = "description"
+        elif "desc" in keys:
+            description_key = "desc"
+        else:
+            description_key = None
+        nested = bool(data.get("position"))
+        if nested:
+            position = _PositionShape.detect(data["position"])
+            if position is None or _has_coords_and_point(keys):
+                return None
+        else:
+            position = _PositionShape.detect(data)
+            if position is None or "point" in keys:
+                return None
+        return cls(keys, position, nested, description_key)
+
+    def read(self, data: object) -> tuple | None:
+        if type(data) is not dict or data.keys() != self.keys:
+            return None
+        if self.nested:
+            position = self.position.read(data["position"])
+            if position is None or type(position[3]) is not str:
+                return None
+        else:
+            if data.get("position"):
+                return None
+            position = self.position.read(data)
+            if position is None or not (
+                position[3] is None or type(position[3]) is str
+            ):
+                return None
+        name = data["name"]
+        description = (
+            data[self.description_key] if self.description_key else None
+        )
+        if type(name) is not str or not (
+            description is None or type(description) is str
+        ):
+            return None
+        return position, name, description, data.get("other")
+
+
+@validated(boundary=("from_dict", "from_dicts"), boundary_only=True)
+@dataclass(slots=True)
 class MCPosition:
     """Define a Minecraft position with a 3D point and a dimension.
 
@@ -158,8 +431,16 @@ class MCPosition:
     """
     dimension: str  # e.g. minecraft:overworld
     """The dimension string of the position.
+
+    A valid identifier is normalized to an interned :class:`~location_api.dimension.Dimension`
+    when the position is created, so ``"overworld"`` becomes ``"minecraft:overworld"``.
+    Other strings are kept as they are.
     """
 
+    def __post_init__(self):
+        if type(self.dimension) is not Dimension:
+            object.__setattr__(self, "dimension", as_dimension(self.dimension))
+
     @property
     def x(self) -> float:
         """The x coordinate of the position."""
@@ -180,6 +461,59 @@ class MCPosition:
         values = [f"{_name}={getattr(self, _name)}" for _name in field_names]
         return f"{self.__class__.__name__}({', '.join(values)})"
 
+    def distance_squared_to(self, position: "MCPosition") -> float:
+        """Calculate the squared Euclidean distance between this position and another position.
+
+        :param position: The other position.
+
+        :return: The squared distance, or ``math.inf`` if the positions are in different dimensions.
+        """
+        if position.dimension != self.dimension:
+            return math.inf
+        return self.point.distance_squared_to(position.point)
+
+    def distance2d_squared_to(self, position: "MCPosition") -> float:
+        """Calculate the squared 2D Euclidean distance between this position and another position.
+
+        :param position: The other position.
+
+        :return: The squared 2D distance, or ``math.inf`` if the positions are in different dimensions.
+        """
+        if position.dimension != self.dimension:
+            return math.inf
+        return self.point.distance2d_squared_to(position.point)
+
+    def within(self, position: "MCPosition", radius: float) -> bool:
+        """Check whether another position is in the same dimension and within a distance of this position.
+
+        :param position: The other position.
+        :param radius: The maximum distance, inclusive.
+
+        :return: :obj:`True` if the dimensions match and the distance is at most ``radius``.
+        """
+        if position.dimension != self.dimension or radius < 0:
+            return False
+        a, b = self.point, position.point
+        dx = a.x - b.x
+        dy = a.y - b.y
+        dz = a.z - b.z
+        return dx * dx + dy * dy + dz * dz <= radius * radius
+
+    def within2d(self, position: "MCPosition", radius: float) -> bool:
+        """Check whether another position is in the same dimension and within a 2D distance of this position.
+
+        :param position: The other position.
+        :param radius: The maximum 2D distance, inclusive.
+
+        :return: :obj:`True` if the dimensions match and the 2D distance is at most ``radius``.
+        """
+        if position.dimension != self.dimension or radius < 0:
+            return False
+        a, b = self.point, position.point
+        dx = a.x - b.x
+        dz = a.z - b.z
+        return dx * dx + dz * dz <= radius * radius
+
     def asdict(self) -> dict:
         """Serialize :data:`MCPosition` object into a dict.
 
@@ -217,8 +551,37 @@ class MCPosition:
             z = get_float_object(data.get("z"))
         return cls(point=Point3D(x, y, z), dimension=dimension)
 
+    @classmethod
+    def from_dicts(cls, records: Iterable[dict]) -> list[Self]:
+        """Deserialize many :data:`MCPosition` objects from dicts.
+
+        The shape of the first dict, flat coordinates or a nested point, is detected once.
+        The dicts of that shape holding numbers and strings are then deserialized
+        without the checks of :meth:`from_dict` on every key, and the others fall back
+        to :meth:`from_dict`.
 
-@dataclass
+        :param records: The dicts to deserialize.
+        :returns: The deserialized :data:`MCPosition` objects, in the order of the dicts.
+        """
+        positions = []
+        shape = None
+        detected = False
+        trusted = Point3D.trusted
+        for data in records:
+            if not detected:
+                shape = _PositionShape.detect(data)
+                detected = True
+            fields = shape.read(data) if shape is not None else None
+            if fields is None or type(fields[3]) is not str:
+                positions.append(cls.from_dict(data))
+                continue
+            x, y, z, dimension = fields
+            positions.append(cls(trusted(x, y, z), dimension))
+        return positions
+
+
+@validated(boundary=("from_dict", "from_dicts"), boundary_only=True)
+@dataclass(slots=True)
 class Location:
     """Define a location with a name, description, and other fields.
 
@@ -242,20 +605,20 @@ class Location:
     @property
     def x(self) -> float:
         """The x-coordinate of the location."""
-        return self.position.x
+        return self.position.point.x
 
     @property
     def y(self) -> float:
         """The y-coordinate of the location."""
-        return self.position.y
+        return self.position.point.y
 
     @property
     def z(self) -> float:
         """The z-coordinate of the location."""
-        return self.position.z
+        return self.position.point.z
 
     @property
-    def dimension(self) -> str:
+    def dimension(self) -> str | None:
         """The dimension of the location."""
         return self.position.dimension
 
@@ -319,7 +682,7 @@ class Location:
             description = get_str_object(description)
         other = data.get("other", None)
         if other:
-            if not is_nested_dict(other):
+            if is_nested_dict(other):
                 raise TypeError(
                     "Nested structures are not allowed in other field."
                 )
@@ -327,5 +690,113 @@ class Location:
             MCPosition(Point3D(x, y, z), dimension), name, description, other
         )
 
+    @classmethod
+    def from_dicts(cls, records: Iterable[dict]) -> list[Self]:
+        """Deserialize many :data:`Location` objects from dicts.
+
+        The shape of the first dict, flat coordinates or a nested position, is detected once.
+        The dicts of that shape holding numbers and strings are then deserialized
+        without the checks of :meth:`from_dict` on every key, and the others fall back
+        to :meth:`from_dict`. The ``other`` field is still checked once per dict.
+
+        :param records: The dicts to deserialize.
+        :returns: The deserialized :data:`Location` objects, in the order of the dicts.
+        """
+        locations = []
+        shape = None
+        detected = False
+        trusted = Point3D.trusted
+        for data in records:
+            if not detected:
+                shape = _LocationShape.detect(data)
+                detected = True
+            fields = shape.read(data) if shape is not None else None
+            if fields is None:
+                locations.append(cls.from_dict(data))
+                continue
+            (x, y, z, dimension), name, description, other = fields
+            locations.append(
+                cls(
+                    MCPosition(trusted(x, y, z), dimension),
+                    name,
+                    description,
+                    other,
+                )
+            )
+        return locations
+
+
+class _Frozen:
+    """Make a slotted dataclass immutable after its fields are initialized."""
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if hasattr(self, name):
+            raise FrozenInstanceError(f"cannot assign to field {name!r}")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+
+class FrozenPoint3D(_Frozen, Point3D):
+    """An immutable and hashable :class:`Point3D`."""
+
+    __slots__ = ()
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.y, self.z))
+
+
+class FrozenPoint2D(_Frozen, Point2D):
+    """An immutable and hashable :class:`Point2D`."""
+
+    __slots__ = ()
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.z))
+
+
+@dataclass(slots=True)
+class FrozenMCPosition(_Frozen, MCPosition):
+    """An immutable and hashable :class:`MCPosition`.
+
+    The point is converted to :class:`FrozenPoint3D` if needed.
+    """
+
+    def __post_init__(self):
+        MCPosition.__post_init__(self)
+        if not isinstance(self.point, FrozenPoint3D):
+            object.__setattr__(
+                self,
+                "point",
+                FrozenPoint3D(self.point.x, self.point.y, self.point.z),
+            )
+
+    def __hash__(self) -> int:
+        return hash((self.point, self.dimension))
+
+
+@dataclass(slots=True)
+class FrozenLocation(_Frozen, Location):
+    """An immutable and hashable :class:`Location`.
+
+    The position is converted to :class:`FrozenMCPosition` if needed,
+    the ``other`` field is not included in the hash.
+    """
+
+    def __post_init__(self):
+        Location.__post_init__(self)
+        if not isinstance(self.position, FrozenMCPosition):
+            object.__setattr__(
+                self,
+                "position",
+                FrozenMCPosition(self.position.point, self.position.dimension),
+            )
+
+    def __hash__(self) -> int:
+        return hash((self.position, self.name, self.description))
+
 
 # if __name__ == "__main__":
@@ -1,7 +1,67 @@
-"""Publish stable APIs"""
+"""Publish stable APIs
 
-from location_api import Point2D, Point3D, MCPosition, Location
-from location_api.pos import get_player_pos
+The position lookups, the tracker and the optional containers and file formats
+are imported on first access, so importing this module for the data model doesn't
+import asyncio, MCDR, the RCON API or NumPy.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+from location_api import (
+    Point2D,
+    Point3D,
+    MCPosition,
+    Location,
+    FrozenPoint2D,
+    FrozenPoint3D,
+    FrozenMCPosition,
+    FrozenLocation,
+)
+from location_api.dimension import Dimension
+from location_api.region import BoundingBox, ChunkPos, RegionPos, RegionSet
+from location_api.history import PositionHistory, TrackedPosition
+from location_api.metrics import metrics
+from location_api.validation import (
+    ValidationMode,
+    get_validation_mode,
+    set_validation_mode,
+    validation_mode,
+)
+
+if TYPE_CHECKING:
+    from location_api.array import PointArray, PositionArray
+    from location_api.binary import (
+        LocationArchive,
+        dump_locations,
+        dump_positions,
+    )
+    from location_api.index import LocationIndex
+    from location_api.jsonl import iter_locations, write_locations
+    from location_api.store import LocationStore
+    from location_api.pos import (
+        get_player_pos,
+        get_players_pos,
+        snapshot_all_positions,
+    )
+    from location_api.tracker import PositionTracker, tracker
+
+_LAZY = {
+    "PointArray": "location_api.array",
+    "PositionArray": "location_api.array",
+    "LocationIndex": "location_api.index",
+    "LocationStore": "location_api.store",
+    "iter_locations": "location_api.jsonl",
+    "write_locations": "location_api.jsonl",
+    "LocationArchive": "location_api.binary",
+    "dump_positions": "location_api.binary",
+    "dump_locations": "location_api.binary",
+    "get_player_pos": "location_api.pos",
+    "get_players_pos": "location_api.pos",
+    "snapshot_all_positions": "location_api.pos",
+    "PositionTracker": "location_api.tracker",
+    "tracker": "location_api.tracker",
+}
 
 __version__ = "0.4.4"
 VERSION = __version__
@@ -15,5 +75,47 @@ __all__ = [
     "Point3D",
     "MCPosition",
     "Location",
+    "FrozenPoint2D",
+    "FrozenPoint3D",
+    "FrozenMCPosition",
+    "FrozenLocation",
+    "Dimension",
+    "PointArray",
+    "PositionArray",
+    "LocationIndex",
+    "BoundingBox",
+    "ChunkPos",
+    "RegionPos",
+    "RegionSet",
+    "LocationStore",
+    "PositionHistory",
+    "iter_locations",
+    "write_locations",
+    "LocationArchive",
+    "dump_positions",
+    "dump_locations",
     "get_player_pos",
+    "get_players_pos",
+    "snapshot_all_positions",
+    "metrics",
+    "PositionTracker",
+    "TrackedPosition",
+    "tracker",
+    "ValidationMode",
+    "get_validation_mode",
+    "set_validation_mode",
+    "validation_mode",
 ]
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,364 @@
+"""This module provides column-based arrays of points and positions for batch computations.
+
+The coordinates are stored in `NumPy <https://numpy.org>`__ arrays if NumPy is installed,
+otherwise in :class:`array.array` of doubles. Batch results are returned in the same kind of
+container, that is :class:`numpy.ndarray` with NumPy and :class:`array.array` (or :class:`list`) without.
+"""
+
+import math
+from array import array
+from typing import Iterable, Self
+
+from location_api import MCPosition, Point2D, Point3D
+from location_api.dimension import as_dimension
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+
+def _column(values: Iterable[float]):
+    if np is None:
+        return array("d", values)
+    if isinstance(values, np.ndarray):
+        return values.astype(float, copy=False)
+    return np.fromiter(values, dtype=float)
+
+
+class PointArray:
+    """Define an array of 3D points, stored as x, y and z columns."""
+
+    __slots__ = ("xs", "ys", "zs")
+
+    def __init__(
+        self,
+        xs: Iterable[float],
+        ys: Iterable[float],
+        zs: Iterable[float],
+    ):
+        """
+        :param xs: The x-coordinates of the points.
+        :param ys: The y-coordinates of the points.
+        :param zs: The z-coordinates of the points.
+
+        :raises ValueError: If the columns have different lengths.
+        """
+        self.xs = _column(xs)
+        self.ys = _column(ys)
+        self.zs = _column(zs)
+        if not len(self.xs) == len(self.ys) == len(self.zs):
+            raise ValueError("All columns must have the same length!")
+
+    @classmethod
+    def from_points(cls, points: Iterable[Point3D | MCPosition]) -> Self:
+        """Create an array from 3D points or positions.
+
+        :param points: The points or positions.
+
+        :return: The array instance.
+        """
+        points = list(points)
+        return cls(
+            [p.x for p in points], [p.y for p in points], [p.z for p in points]
+        )
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def __getitem__(self, index: int) -> Point3D:
+        return Point3D.trusted(
+            float(self.xs[index]), float(self.ys[index]), float(self.zs[index])
+        )
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def translated(
+        self, dx: float = 0.0, dy: float = 0.0, dz: float = 0.0
+    ) -> Self:
+        """Create a new array with every point moved by the same offset.
+
+        :param dx: The offset on x-axis.
+        :param dy: The offset on y-axis.
+        :param dz: The offset on z-axis.
+
+        :return: The moved array, of the same type as this one.
+        """
+        if np is not None:
+            return self._with_columns(self.xs + dx, self.ys + dy, self.zs + dz)
+        return self._with_columns(
+            (x + dx for x in self.xs),
+            (y + dy for y in self.ys),
+            (z + dz for z in self.zs),
+        )
+
+    def _with_columns(self, xs, ys, zs) -> Self:
+        return type(self)(xs, ys, zs)
+
+    def distances_to(self, point: Point3D | MCPosition):
+        """Calculate the Euclidean distances from every point to a point.
+
+        :param point: The point to calculate the distances to.
+
+        :return: The distances, in the order of the points.
+        """
+        px, py, pz = point.x, point.y, point.z
+        if np is not None:
+            return np.sqrt(
+                (self.xs - px) ** 2 + (self.ys - py) ** 2 + (self.zs - pz) ** 2
+            )
+        hypot = math.hypot
+        return array(
+            "d",
+            (
+                hypot(x - px, y - py, z - pz)
+                for x, y, z in zip(self.xs, self.ys, self.zs)
+            ),
+        )
+
+    def distances2d_to(self, point: Point2D | Point3D | MCPosition):
+        """Calculate the 2D Euclidean distances (ignoring y) from every point to a point.
+
+        :param point: The point to calculate the distances to.
+
+        :return: The distances, in the order of the points.
+        """
+        px, pz = point.x, point.z
+        if np is not None:
+            return np.hypot(self.xs - px, self.zs - pz)
+        hypot = math.hypot
+        return array(
+            "d", (hypot(x - px, z - pz) for x, z in zip(self.xs, self.zs))
+        )
+
+    def distance_matrix(self, other: "PointArray | None" = None):
+        """Calculate the Euclidean distances between every pair of points.
+
+        :param other: The other array, defaults to :obj:`None` as this array itself.
+
+        :return: A matrix whose item ``[i][j]`` is the distance from the ``i``-th point
+            of this array to the ``j``-th point of ``other``, as a 2D :class:`numpy.ndarray`
+            with NumPy or a :class:`list` of rows without.
+        """
+        other = self if other is None else other
+        if np is not None:
+            return np.sqrt(
+                (self.xs[:, None] - other.xs[None, :]) ** 2
+                + (self.ys[:, None] - other.ys[None, :]) ** 2
+                + (self.zs[:, None] - other.zs[None, :]) ** 2
+            )
+        hypot = math.hypot
+        columns = list(zip(other.xs, other.ys, other.zs))
+        return [
+            array(
+                "d",
+                (hypot(x - ox, y - oy, z - oz) for ox, oy, oz in columns),
+            )
+            for x, y, z in zip(self.xs, self.ys, self.zs)
+        ]
+
+    def distance2d_matrix(self, other: "PointArray | None" = None):
+        """Calculate the 2D Euclidean distances (ignoring y) between every pair of points.
+
+        :param other: The other array, defaults to :obj:`None` as this array itself.
+
+        :return: The same kind of matrix as :meth:`distance_matrix`.
+        """
+        other = self if other is None else other
+        if np is not None:
+            return np.hypot(
+                self.xs[:, None] - other.xs[None, :],
+                self.zs[:, None] - other.zs[None, :],
+            )
+        hypot = math.hypot
+        columns = list(zip(other.xs, other.zs))
+        return [
+            array("d", (hypot(x - ox, z - oz) for ox, oz in columns))
+            for x, z in zip(self.xs, self.zs)
+        ]
+
+
+class PositionArray(PointArray):
+    """Define an array of Minecraft positions, stored as x, y, z and dimension columns."""
+
+    __slots__ = ("dimensions",)
+
+    def __init__(
+        self,
+        xs: Iterable[float],
+        ys: Iterable[float],
+        zs: Iterable[float],
+        dimensions: Iterable[str],
+    ):
+        """
+        :param xs: The x-coordinates of the positions.
+        :param ys: The y-coordinates of the positions.
+        :param zs: The z-coordinates of the positions.
+        :param dimensions: The dimensions of the positions.
+
+        :raises ValueError: If the columns have different lengths.
+        """
+        super().__init__(xs, ys, zs)
+        self.dimensions = [as_dimension(d) for d in dimensions]
+        if len(self.dimensions) != len(self.xs):
+            raise ValueError("All columns must have the same length!")
+
+    @classmethod
+    def from_positions(cls, positions: Iterable[MCPosition]) -> Self:
+        """Create an array from positions.
+
+        :param positions: The positions.
+
+        :return: The array instance.
+        """
+        positions = list(positions)
+        return cls(
+            [p.x for p in positions],
+            [p.y for p in positions],
+            [p.z for p in positions],
+            [p.dimension for p in positions],
+        )
+
+    def __getitem__(self, index: int) -> MCPosition:
+        return MCPosition(super().__getitem__(index), self.dimensions[index])
+
+    def _with_columns(self, xs, ys, zs) -> Self:
+        return type(self)(xs, ys, zs, self.dimensions)
+
+    def dimension_mask(self, dimension: str):
+        """Mark the positions in a dimension.
+
+        :param dimension: The dimension, with or without a namespace.
+
+        :return: A boolean for every position, as :class:`numpy.ndarray` with NumPy
+            or :class:`list` without.
+        """
+        dimension = as_dimension(dimension)
+        if np is not None:
+            return np.fromiter(
+                (d == dimension for d in self.dimensions),
+                dtype=bool,
+                count=len(self.dimensions),
+            )
+        return [d == dimension for d in self.dimensions]
+
+    def select(self, indexes: Iterable[int]) -> Self:
+        """Create a new array from the positions at the given indexes.
+
+        :param indexes: The indexes of the positions to keep.
+
+        :return: The array instance.
+        """
+        indexes = list(indexes)
+        if np is not None:
+            index_array = np.asarray(indexes, dtype=np.intp)
+            return type(self)(
+                self.xs[index_array],
+                self.ys[index_array],
+                self.zs[index_array],
+                [self.dimensions[i] for i in indexes],
+            )
+        return type(self)(
+            [self.xs[i] for i in indexes],
+            [self.ys[i] for i in indexes],
+            [self.zs[i] for i in indexes],
+            [self.dimensions[i] for i in indexes],
+        )
+
+    def split_by_dimension(self) -> dict[str, Self]:
+        """Split the positions into one array for each dimension.
+
+        :return: A dict maps dimensions to the arrays of positions in them.
+        """
+        groups: dict[str, list[int]] = {}
+        for i, dimension in enumerate(self.dimensions):
+            groups.setdefault(dimension, []).append(i)
+        return {
+            dimension: self.select(indexes)
+            for dimension, indexes in groups.items()
+        }
+
+    def distances_to(self, point: Point3D | MCPosition):
+        """Calculate the Euclidean distances from every position to a point.
+
+        If ``point`` is a :class:`~location_api.MCPosition`, the distances of
+        positions in other dimensions are :data:`math.inf`.
+
+        :param point: The point or position to calculate the distances to.
+
+        :return: The distances, in the order of the positions.
+        """
+        distances = super().distances_to(point)
+        if isinstance(point, MCPosition):
+            self._mask_other_dimensions(distances, point.dimension)
+        return distances
+
+    def distances2d_to(self, point: Point2D | Point3D | MCPosition):
+        """Calculate the 2D Euclidean distances (ignoring y) from every position to a point.
+
+        If ``point`` is a :class:`~location_api.MCPosition`, the distances of
+        positions in other dimensions are :data:`math.inf`.
+
+        :param point: The point or position to calculate the distances to.
+
+        :return: The distances, in the order of the positions.
+        """
+        distances = super().distances2d_to(point)
+        if isinstance(point, MCPosition):
+            self._mask_other_dimensions(distances, point.dimension)
+        return distances
+
+    def distance_matrix(self, other: "PointArray | None" = None):
+        """Calculate the Euclidean distances between every pair of positions.
+
+        If ``other`` is also a :class:`PositionArray`, the distances between
+        positions in different dimensions are :data:`math.inf`.
+
+        :param other: The other array, defaults to :obj:`None` as this array itself.
+
+        :return: The same kind of matrix as :meth:`PointArray.distance_matrix`.
+        """
+        other = self if other is None else other
+        matrix = super().distance_matrix(other)
+        if isinstance(other, PositionArray):
+            self._mask_other_dimension_pairs(matrix, other)
+        return matrix
+
+    def distance2d_matrix(self, other: "PointArray | None" = None):
+        """Calculate the 2D Euclidean distances (ignoring y) between every pair of positions.
+
+        If ``other`` is also a :class:`PositionArray`, the distances between
+        positions in different dimensions are :data:`math.inf`.
+
+        :param other: The other array, defaults to :obj:`None` as this array itself.
+
+        :return: The same kind of matrix as :meth:`PointArray.distance_matrix`.
+        """
+        other = self if other is None else other
+        matrix = super().distance2d_matrix(other)
+        if isinstance(other, PositionArray):
+            self._mask_other_dimension_pairs(matrix, other)
+        return matrix
+
+    def _mask_other_dimension_pairs(
+        self, matrix, other: "PositionArray"
+    ) -> None:
+        if np is not None:
+            rows = np.array(self.dimensions, dtype=object)
+            columns = np.array(other.dimensions, dtype=object)
+            matrix[rows[:, None] != columns[None, :]] = math.inf
+            return
+        for row, dimension in zip(matrix, self.dimensions):
+            for j, other_dimension in enumerate(other.dimensions):
+                if other_dimension != dimension:
+                    row[j] = math.inf
+
+    def _mask_other_dimensions(self, distances, dimension: str) -> None:
+        if np is not None:
+            distances[~self.dimension_mask(dimension)] = math.inf
+            return
+        for i, d in enumerate(self.dimensions):
+            if d != dimension:
+                distances[i] = math.inf
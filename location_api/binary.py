@@ -0,0 +1,311 @@
+"""This module provides a compact binary format for archives of positions and locations.
+
+An archive is written in one pass by :func:`dump_positions` or :func:`dump_locations`,
+and opened by :class:`LocationArchive`, which maps the file into memory and only
+decodes the records accessed, so opening an archive of any size takes constant time.
+
+All integers and doubles are little-endian. An archive is made of four parts:
+
+.. list-table::
+    :header-rows: 1
+
+    * - Part
+      - Layout
+    * - Header, 32 bytes
+      - ``4s`` magic ``b"LOCB"``, ``H`` version ``1``, ``H`` kind (``1`` for
+        :class:`~location_api.MCPosition`, ``2`` for :class:`~location_api.Location`),
+        ``Q`` record count, ``Q`` offset of the dimension table, ``Q`` offset of the string table.
+    * - Records, from offset 32
+      - Fixed-width records. A position is ``ddd`` x, y, z and ``I`` dimension index,
+        28 bytes. A location is ``ddd`` x, y, z and ``IIII`` indexes of the dimension,
+        name, description and other field, 40 bytes.
+    * - Dimension table
+      - ``I`` count, then for each dimension ``H`` length and the UTF-8 bytes.
+    * - String table
+      - ``I`` count, ``count + 1`` ``Q`` offsets into the data, then the UTF-8 data.
+        The other field of a location is stored as a JSON string.
+
+The index ``0xFFFFFFFF`` stands for :obj:`None`. Equal strings are stored once.
+"""
+
+import json
+import mmap
+import os
+import struct
+from typing import Iterable, Iterator, Self
+
+from location_api import Location, MCPosition, Point3D
+from location_api.utils import atomic_write
+
+MAGIC = b"LOCB"
+VERSION = 1
+KIND_POSITION = 1
+KIND_LOCATION = 2
+
+_HEADER = struct.Struct("<4sHHQQQ")
+_POSITION = struct.Struct("<dddI")
+_LOCATION = struct.Struct("<dddIIII")
+_RECORDS = {KIND_POSITION: _POSITION, KIND_LOCATION: _LOCATION}
+_COUNT = struct.Struct("<I")
+_LENGTH = struct.Struct("<H")
+_OFFSET = struct.Struct("<Q")
+_NONE = 0xFFFFFFFF
+
+
+class BinaryFormatError(ValueError):
+    """An exception raised when a file is not a valid archive."""
+
+    pass
+
+
+class _Table:
+    """Assign indexes to strings in the order they are first added."""
+
+    def __init__(self):
+        self.indexes: dict[str, int] = {}
+
+    def add(self, value: str | None) -> int:
+        if value is None:
+            return _NONE
+        index = self.indexes.get(value)
+        if index is None:
+            index = self.indexes[value] = len(self.indexes)
+        return index
+
+
+def _dump(
+    path: str | os.PathLike, kind: int, records: Iterable, pack_record
+) -> int:
+    dimensions = _Table()
+    strings = _Table()
+    count = 0
+    with atomic_write(path, "wb") as file:
+        file.write(b"\0" * _HEADER.size)
+        for record in records:
+            file.write(pack_record(record, dimensions, strings))
+            count += 1
+
+        dimensions_offset = file.tell()
+        file.write(_COUNT.pack(len(dimensions.indexes)))
+        for dimension in dimensions.indexes:
+            data = dimension.encode()
+            file.write(_LENGTH.pack(len(data)))
+            file.write(data)
+
+        strings_offset = file.tell()
+        encoded = [value.encode() for value in strings.indexes]
+        file.write(_COUNT.pack(len(encoded)))
+        offset = 0
+        offsets = bytearray(_OFFSET.pack(offset))
+        for data in encoded:
+            offset += len(data)
+            offsets += _OFFSET.pack(offset)
+        file.write(offsets)
+        file.writelines(encoded)
+
+        file.seek(0)
+        file.write(
+            _HEADER.pack(
+                MAGIC, VERSION, kind, count, dimensions_offset, strings_offset
+            )
+        )
+    return count
+
+
+def _pack_position(
+    position: MCPosition, dimensions: _Table, _strings: _Table
+) -> bytes:
+    point = position.point
+    return _POSITION.pack(
+        point.x, point.y, point.z, dimensions.add(position.dimension)
+    )
+
+
+def _pack_location(
+    location: Location, dimensions: _Table, strings: _Table
+) -> bytes:
+    point = location.position.point
+    other = location.other
+    return _LOCATION.pack(
+        point.x,
+        point.y,
+        point.z,
+        dimensions.add(location.position.dimension),
+        strings.add(location.name),
+        strings.add(location.description),
+        strings.add(
+            None if other is None else json.dumps(other, ensure_ascii=False)
+        ),
+    )
+
+
+def dump_positions(
+    path: str | os.PathLike, positions: Iterable[MCPosition]
+) -> int:
+    """Write positions to an archive, replacing the file atomically.
+
+    :param path: The path of the archive.
+    :param positions: The positions, which are consumed one by one.
+
+    :return: The number of positions written.
+    """
+    return _dump(path, KIND_POSITION, positions, _pack_position)
+
+
+def dump_locations(
+    path: str | os.PathLike, locations: Iterable[Location]
+) -> int:
+    """Write locations to an archive, replacing the file atomically.
+
+    :param path: The path of the archive.
+    :param locations: The locations, which are consumed one by one.
+
+    :return: The number of locations written.
+    """
+    return _dump(path, KIND_LOCATION, locations, _pack_location)
+
+
+class LocationArchive:
+    """Read an archive written by :func:`dump_positions` or :func:`dump_locations`.
+
+    The file is memory-mapped, and a record is only decoded when it is accessed.
+    Use it in a ``with`` block, or call :meth:`close` when done.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        """
+        :param path: The path of the archive.
+
+        :raises BinaryFormatError: If the file is not a valid archive.
+        :raises OSError: If the file could not be opened.
+        """
+        with open(path, "rb") as file:
+            try:
+                self._map = mmap.mmap(
+                    file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            except ValueError:
+                raise BinaryFormatError(f"Empty archive: {path}") from None
+        try:
+            self._read_tables()
+        except (BinaryFormatError, struct.error) as e:
+            self._map.close()
+            if isinstance(e, BinaryFormatError):
+                raise
+            raise BinaryFormatError(f"Truncated archive: {path}") from e
+
+    def _read_tables(self) -> None:
+        buffer = self._map
+        magic, version, kind, count, dimensions_offset, strings_offset = (
+            _HEADER.unpack_from(buffer, 0)
+        )
+        if magic != MAGIC:
+            raise BinaryFormatError("Not a location archive!")
+        if version != VERSION:
+            raise BinaryFormatError(f"Unsupported version {version}!")
+        if kind not in _RECORDS:
+            raise BinaryFormatError(f"Unknown record kind {kind}!")
+        self._kind = kind
+        self._record = _RECORDS[kind]
+        self._count = count
+        if _HEADER.size + count * self._record.size > dimensions_offset:
+            raise BinaryFormatError("Records overlap the dimension table!")
+
+        (dimension_count,) = _COUNT.unpack_from(buffer, dimensions_offset)
+        offset = dimensions_offset + _COUNT.size
+        dimensions = []
+        for _ in range(dimension_count):
+            (length,) = _LENGTH.unpack_from(buffer, offset)
+            offset += _LENGTH.size
+            dimensions.append(buffer[offset : offset + length].decode())
+            offset += length
+        self._dimensions = dimensions
+
+        (self._string_count,) = _COUNT.unpack_from(buffer, strings_offset)
+        self._string_offsets = strings_offset + _COUNT.size
+        self._string_data = (
+            self._string_offsets + (self._string_count + 1) * _OFFSET.size
+        )
+        (end,) = _OFFSET.unpack_from(
+            buffer, self._string_offsets + self._string_count * _OFFSET.size
+        )
+        if self._string_data + end > len(buffer):
+            raise BinaryFormatError("String table is truncated!")
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self._map.close()
+
+    @property
+    def kind(self) -> int:
+        """The kind of the records, :data:`KIND_POSITION` or :data:`KIND_LOCATION`."""
+        return self._kind
+
+    @property
+    def dimensions(self) -> list[str]:
+        """The dimensions in the dimension table."""
+        return list(self._dimensions)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _string(self, index: int) -> str | None:
+        if index == _NONE:
+            return None
+        start, end = struct.unpack_from(
+            "<QQ", self._map, self._string_offsets + index * _OFFSET.size
+        )
+        base = self._string_data
+        return self._map[base + start : base + end].decode()
+
+    def _dimension(self, index: int) -> str | None:
+        return None if index == _NONE else self._dimensions[index]
+
+    def _decode(self, index: int) -> MCPosition | Location:
+        fields = self._record.unpack_from(
+            self._map, _HEADER.size + index * self._record.size
+        )
+        point = Point3D.trusted(fields[0], fields[1], fields[2])
+        position = MCPosition(point, self._dimension(fields[3]))
+        if self._kind == KIND_POSITION:
+            return position
+        other = self._string(fields[6])
+        return Location(
+            position,
+            self._string(fields[4]),
+            self._string(fields[5]),
+            None if other is None else json.loads(other),
+        )
+
+    def __getitem__(self, index: int) -> MCPosition | Location:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Archive index out of range!")
+        return self._decode(index)
+
+    def __iter__(self) -> Iterator[MCPosition | Location]:
+        for index in range(self._count):
+            yield self._decode(index)
+
+    def point(self, index: int) -> Point3D:
+        """Get only the point of a record, without decoding its strings.
+
+        :param index: The index of the record.
+
+        :return: The point.
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Archive index out of range!")
+        x, y, z = struct.unpack_from(
+            "<ddd", self._map, _HEADER.size + index * self._record.size
+        )
+        return Point3D.trusted(x, y, z)
@@ -0,0 +1,150 @@
+"""This module provides a transport running position queries through the server console.
+
+Servers with RCON disabled can still be queried: :class:`ConsoleTransport` sends
+``data get entity`` commands to the console and resolves them with the replies the
+server logs, which the plugin feeds from the ``on_info`` event of MCDR. The replies
+are parsed by :mod:`location_api.pos` like the replies of RCON.
+
+Enable it in the config of the plugin::
+
+    transport:
+      backend: console
+      timeout: 5.0
+"""
+
+import asyncio
+import threading
+from collections import deque
+from typing import TypeAlias
+
+from returns.result import Failure, Result, Success
+
+import location_api.runtime as rt
+
+_COMMAND_PREFIX = "data get entity "
+_ENTITY_DATA = " has the following entity data: "
+_NOT_FOUND = "No entity was found"
+
+_Pending: TypeAlias = tuple[str, asyncio.Future[str]]
+
+
+class ConsoleTransport:
+    """Run ``data get entity`` commands through the server console.
+
+    A reply naming a player resolves the oldest pending query of that player, and
+    ``No entity was found``, which names no player, resolves the oldest pending query.
+    The server runs console commands in order, so replies match their queries as long
+    as nothing else prints the same messages meanwhile. A query without a reply fails
+    after ``timeout`` seconds.
+
+    :meth:`feed` can be called from any thread.
+    """
+
+    def __init__(self, psi=None, timeout: float = 5.0):
+        """
+        :param psi: The server interface to execute commands with.
+            Defaults to :obj:`None` as :data:`location_api.runtime.psi`.
+        :param timeout: Seconds to wait for a reply. Defaults to ``5.0``.
+        """
+        self.psi = psi
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._pending: deque[_Pending] = deque()
+
+    @property
+    def pending(self) -> int:
+        """The number of queries waiting for a reply."""
+        return len(self._pending)
+
+    async def query(self, command: str) -> Result[str, Exception]:
+        """Run a ``data get entity`` command and wait for its reply.
+
+        :param command: The command to run, without the leading slash.
+
+        :return: The reply of the server, or an exception if the command is not
+            supported, can't be sent, or gets no reply in time.
+        """
+        if not command.startswith(_COMMAND_PREFIX):
+            return Failure(
+                ValueError(f"Unsupported command for the console: {command}")
+            )
+        player = command[len(_COMMAND_PREFIX) :].partition(" ")[0]
+        entry = (player, asyncio.get_running_loop().create_future())
+        with self._lock:
+            self._pending.append(entry)
+        try:
+            (self.psi or rt.psi).execute(command)
+            return Success(await asyncio.wait_for(entry[1], self.timeout))
+        except TimeoutError:
+            return Failure(
+                TimeoutError(f"No reply to {command} in {self.timeout}s!")
+            )
+        except Exception as e:
+            return Failure(e)
+        finally:
+            with self._lock:
+                if entry in self._pending:
+                    self._pending.remove(entry)
+
+    def feed(self, content: str) -> bool:
+        """Resolve a pending query with a line logged by the server.
+
+        :param content: The content of the line, like
+            ``Steve has the following entity data: [0.5d, 64.0d, 0.5d]``.
+
+        :return: :obj:`True` if the line resolved a query.
+        """
+        if not self._pending:
+            return False
+        if content.startswith(_NOT_FOUND):
+            name = None
+        else:
+            name, found, _ = content.partition(_ENTITY_DATA)
+            if not found:
+                return False
+        with self._lock:
+            entry = self._take(name)
+        if entry is None:
+            return False
+        _resolve_threadsafe(entry[1], content)
+        return True
+
+    def close(self) -> None:
+        """Fail all pending queries, such as when the plugin unloads."""
+        with self._lock:
+            pending = list(self._pending)
+            self._pending.clear()
+        for _, future in pending:
+            _resolve_threadsafe(
+                future, ConnectionError("The console transport was closed!")
+            )
+
+    def _take(self, name: str | None) -> _Pending | None:
+        # The exact name first, then the last word after a team prefix.
+        if name is None:
+            return self._pending.popleft() if self._pending else None
+        words = name.split()
+        candidates = (name, words[-1]) if words else (name,)
+        for candidate in candidates:
+            for entry in self._pending:
+                if entry[0] == candidate:
+                    self._pending.remove(entry)
+                    return entry
+        return None
+
+
+def _resolve_threadsafe(
+    future: asyncio.Future[str], result: str | Exception
+) -> None:
+    loop = future.get_loop()
+    if not loop.is_closed():
+        loop.call_soon_threadsafe(_resolve, future, result)
+
+
+def _resolve(future: asyncio.Future[str], result: str | Exception) -> None:
+    if future.done():
+        return
+    if isinstance(result, Exception):
+        future.set_exception(result)
+    else:
+        future.set_result(result)
@@ -0,0 +1,125 @@
+"""This module provides the registry of interned dimension identifiers.
+
+Servers and data files name dimensions both with a namespace (``minecraft:overworld``)
+and without one (``overworld``). :class:`Dimension` normalizes both to the namespaced
+identifier, and returns one shared object for each identifier, so all positions in
+a dimension share the same string and comparing two dimensions is an identity check.
+"""
+
+import threading
+from typing import ClassVar, TypeVar
+
+_T = TypeVar("_T")
+
+DEFAULT_NAMESPACE = "minecraft"
+"""The namespace of the identifiers without one.
+"""
+
+# The number of other spellings, such as ``overworld``, remembered for the fast path.
+# Other spellings are normalized again on every call once the cache is full, so data
+# with many distinct spellings can't grow the registry without bound.
+_MAX_ALIASES = 256
+
+
+class Dimension(str):
+    """Define an interned dimension identifier, such as ``minecraft:overworld``.
+
+    ``Dimension("overworld")`` and ``Dimension("minecraft:overworld")`` are the same
+    object, which is still a :class:`str` equal to ``"minecraft:overworld"``.
+    """
+
+    _registry: ClassVar[dict[str, "Dimension"]] = {}
+    _by_id: ClassVar[list["Dimension"]] = []
+    _aliases: ClassVar[int] = 0
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    id: int
+    """The number of the dimension, in the order the dimensions are registered.
+    """
+
+    def __new__(cls, value: str) -> "Dimension":
+        """
+        :param value: The identifier, with or without a namespace.
+
+        :raises TypeError: If ``value`` is not a string.
+        :raises ValueError: If ``value`` is not a valid identifier.
+        """
+        dimension = cls._registry.get(value)
+        if dimension is not None:
+            return dimension
+        if not isinstance(value, str):
+            raise TypeError(f"Invalid dimension: {value!r}")
+        namespace, separator, path = value.partition(":")
+        if not separator:
+            namespace, path = DEFAULT_NAMESPACE, value
+        if not namespace or not path or ":" in path:
+            raise ValueError(f"Invalid dimension: {value!r}")
+        identifier = f"{namespace}:{path}"
+        with cls._lock:
+            dimension = cls._registry.get(identifier)
+            if dimension is None:
+                dimension = super().__new__(cls, identifier)
+                dimension.id = len(cls._by_id)
+                cls._by_id.append(dimension)
+                cls._registry[identifier] = dimension
+            if value not in cls._registry and cls._aliases < _MAX_ALIASES:
+                cls._registry[value] = dimension
+                cls._aliases += 1
+        return dimension
+
+    @classmethod
+    def from_id(cls, id: int) -> "Dimension":
+        """Get a registered dimension by its number.
+
+        :param id: The number of the dimension.
+
+        :return: The dimension.
+
+        :raises IndexError: If no dimension has the number.
+        """
+        if id < 0:
+            raise IndexError(f"Unknown dimension id {id}!")
+        return cls._by_id[id]
+
+    @property
+    def namespace(self) -> str:
+        """The namespace of the identifier, such as ``minecraft``."""
+        return self.partition(":")[0]
+
+    @property
+    def path(self) -> str:
+        """The identifier without the namespace, such as ``overworld``."""
+        return self.partition(":")[2]
+
+    def __repr__(self) -> str:
+        return f"Dimension({str.__repr__(self)})"
+
+    def __reduce__(self):
+        return Dimension, (str(self),)
+
+    def __copy__(self) -> "Dimension":
+        return self
+
+    def __deepcopy__(self, _memo) -> "Dimension":
+        return self
+
+
+def as_dimension(value: str | _T) -> "Dimension | _T":
+    """Normalize a dimension identifier, leaving other values unchanged.
+
+    :param value: A dimension identifier, or any other value such as :obj:`None` or an
+        invalid identifier.
+
+    :return: The :class:`Dimension` if ``value`` is a valid identifier, otherwise ``value``.
+    """
+    if type(value) is Dimension or not value or not isinstance(value, str):
+        return value
+    try:
+        return Dimension(value)
+    except ValueError:
+        return value
+
+
+OVERWORLD = Dimension("minecraft:overworld")
+THE_NETHER = Dimension("minecraft:the_nether")
+THE_END = Dimension("minecraft:the_end")
@@ -0,0 +1,365 @@
+"""This module provides a bounded history of player positions, with time-window queries and movement.
+
+Every player gets a ring buffer of a fixed number of samples, stored as columns of
+:class:`array.array` instead of a list of objects: 36 bytes per sample for the
+timestamp, the coordinates and the :attr:`~location_api.dimension.Dimension.id`
+of the dimension. When the buffer is full, a new sample overwrites the oldest one,
+so the memory of a player never grows past its capacity. A position without a
+valid dimension is kept without one, and comes back with :obj:`None` as its
+dimension.
+
+:class:`~location_api.tracker.PositionTracker` records every poll into its
+:attr:`~location_api.tracker.PositionTracker.history`.
+"""
+
+import math
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Iterator
+
+from location_api import MCPosition, Point3D
+from location_api.dimension import Dimension, as_dimension
+
+# The timestamp and coordinates, and the dimension id.
+_SAMPLE_BYTES = 4 * 8 + 4
+# The dimension id of the samples without a valid dimension.
+_NO_DIMENSION = 0xFFFFFFFF
+
+
+@dataclass
+class TrackedPosition:
+    """Define a position sampled at a time."""
+
+    position: MCPosition
+    """The sampled position of the player.
+    """
+    timestamp: float
+    """The :func:`time.monotonic` time the position was sampled at.
+    """
+
+    @property
+    def age(self) -> float:
+        """Seconds elapsed since the position was sampled."""
+        return time.monotonic() - self.timestamp
+
+
+def _dimension(dim: int) -> Dimension | None:
+    return None if dim == _NO_DIMENSION else Dimension.from_id(dim)
+
+
+class _Ring:
+    __slots__ = ("dims", "size", "start", "times", "xs", "ys", "zs")
+
+    def __init__(self, capacity: int):
+        zeros = array("d", bytes(8 * capacity))
+        self.times = zeros
+        self.xs = array("d", zeros)
+        self.ys = array("d", zeros)
+        self.zs = array("d", zeros)
+        self.dims = array("I", bytes(4 * capacity))
+        self.start = 0
+        self.size = 0
+
+    def append(
+        self, timestamp: float, x: float, y: float, z: float, dim: int
+    ) -> None:
+        capacity = len(self.times)
+        if self.size < capacity:
+            i = (self.start + self.size) % capacity
+            self.size += 1
+        else:
+            i = self.start
+            self.start = (self.start + 1) % capacity
+        self.times[i] = timestamp
+        self.xs[i] = x
+        self.ys[i] = y
+        self.zs[i] = z
+        self.dims[i] = dim
+
+    def slot(self, index: int) -> int:
+        # The slot of the index-th oldest sample.
+        return (self.start + index) % len(self.times)
+
+    def time(self, index: int) -> float:
+        return self.times[self.slot(index)]
+
+    # The samples are sorted in times[start:] followed by times[:start] once the
+    # buffer wraps around, so a bisection only looks into one of the two runs.
+    def _bisect(self, search, timestamp: float, in_first: bool) -> int:
+        times, start = self.times, self.start
+        capacity = len(times)
+        end = start + self.size
+        if end <= capacity or in_first:
+            return search(times, timestamp, start, min(end, capacity)) - start
+        return capacity - start + search(times, timestamp, 0, end - capacity)
+
+    def bisect_left(self, timestamp: float) -> int:
+        return self._bisect(bisect_left, timestamp, timestamp <= self.times[0])
+
+    def bisect_right(self, timestamp: float) -> int:
+        return self._bisect(bisect_right, timestamp, timestamp < self.times[0])
+
+    def sample(self, index: int) -> TrackedPosition:
+        i = self.slot(index)
+        return TrackedPosition(
+            MCPosition(
+                Point3D.trusted(self.xs[i], self.ys[i], self.zs[i]),
+                _dimension(self.dims[i]),
+            ),
+            self.times[i],
+        )
+
+
+class PositionHistory:
+    """Keep the recent positions of players in fixed-capacity ring buffers.
+
+    Samples of a player must be recorded in time order. All methods can be called
+    from any thread.
+    """
+
+    def __init__(self, capacity: int = 600):
+        """
+        :param capacity: The number of samples kept for each player. Defaults to ``600``,
+            ten minutes at one sample per second.
+
+        :raises ValueError: If ``capacity`` is less than ``2``.
+        """
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2!")
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._rings: dict[str, _Ring] = {}
+
+    def __len__(self) -> int:
+        return len(self._rings)
+
+    def __contains__(self, player: object) -> bool:
+        return player in self._rings
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._rings))
+
+    @property
+    def nbytes(self) -> int:
+        """The bytes taken by the sample buffers of all players."""
+        return len(self._rings) * self.capacity * _SAMPLE_BYTES
+
+    def record(
+        self,
+        player: str,
+        position: MCPosition,
+        timestamp: float | None = None,
+    ) -> None:
+        """Record a position of a player, overwriting its oldest sample if its buffer is full.
+
+        :param player: The name of the player.
+        :param position: The position of the player. A dimension that is :obj:`None` or
+            not a valid identifier is recorded as :obj:`None`.
+        :param timestamp: The :func:`time.monotonic` time of the position.
+            Defaults to :obj:`None` as now.
+
+        :raises ValueError: If ``timestamp`` is older than the latest sample of the player.
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
+        dimension = as_dimension(position.dimension)
+        dim = dimension.id if type(dimension) is Dimension else _NO_DIMENSION
+        with self._lock:
+            ring = self._rings.get(player)
+            if ring is None:
+                ring = self._rings[player] = _Ring(self.capacity)
+            elif ring.size and timestamp < ring.time(ring.size - 1):
+                raise ValueError(
+                    f"Sample of {player} at {timestamp} is older than the latest one!"
+                )
+            ring.append(timestamp, position.x, position.y, position.z, dim)
+
+    def remove(self, player: str) -> None:
+        """Forget the history of a player, if any.
+
+        :param player: The name of the player.
+        """
+        with self._lock:
+            self._rings.pop(player, None)
+
+    def clear(self) -> None:
+        """Forget the histories of all players."""
+        with self._lock:
+            self._rings.clear()
+
+    def count(self, player: str) -> int:
+        """Get the number of samples kept for a player."""
+        ring = self._rings.get(player)
+        return 0 if ring is None else ring.size
+
+    def latest(self, player: str) -> TrackedPosition | None:
+        """Get the latest sample of a player.
+
+        :param player: The name of the player.
+
+        :return: The latest sample, or :obj:`None` if the player has no sample.
+        """
+        with self._lock:
+            ring = self._rings.get(player)
+            if ring is None:
+                return None
+            return ring.sample(ring.size - 1)
+
+    def last(self, player: str, n: int) -> list[TrackedPosition]:
+        """Get the latest samples of a player.
+
+        :param player: The name of the player.
+        :param n: The maximum number of samples.
+
+        :return: Up to ``n`` samples, oldest first.
+        """
+        with self._lock:
+            ring = self._rings.get(player)
+            if ring is None or n <= 0:
+                return []
+            return [
+                ring.sample(i) for i in range(max(0, ring.size - n), ring.size)
+            ]
+
+    def between(
+        self, player: str, start: float, end: float
+    ) -> list[TrackedPosition]:
+        """Get the samples of a player within a time range.
+
+        :param player: The name of the player.
+        :param start: The :func:`time.monotonic` time the range starts at, inclusive.
+        :param end: The :func:`time.monotonic` time the range ends at, inclusive.
+
+        :return: The samples in the range, oldest first.
+        """
+        with self._lock:
+            ring = self._rings.get(player)
+            if ring is None:
+                return []
+            first = ring.bisect_left(start)
+            stop = ring.bisect_right(end)
+            return [ring.sample(i) for i in range(first, stop)]
+
+    def position_at(self, player: str, timestamp: float) -> MCPosition | None:
+        """Get the position of a player at a time, interpolated between its samples.
+
+        The position is interpolated linearly between the samples around ``timestamp``.
+        If the player changed dimension between them, the earlier sample is returned.
+
+        :param player: The name of the player.
+        :param timestamp: The :func:`time.monotonic` time.
+
+        :return: The position, or :obj:`None` if ``timestamp`` is outside of the samples.
+        """
+        with self._lock:
+            ring = self._rings.get(player)
+            if ring is None:
+                return None
+            return self._position_at(ring, timestamp)
+
+    def velocity(
+        self, player: str, window: float | None = None
+    ) -> tuple[float, float, float] | None:
+        """Get the velocity of a player in blocks per second.
+
+        :param player: The name of the player.
+        :param window: The seconds before the latest sample to measure the movement over,
+            the start position being interpolated. Defaults to :obj:`None` as since the
+            previous sample.
+
+        :return: The ``(x, y, z)`` velocity, or :obj:`None` if the samples don't cover the
+            window, or the player changed dimension within it.
+        """
+        with self._lock:
+            ring = self._rings.get(player)
+            if ring is None or ring.size < 2:
+                return None
+            end = ring.sample(ring.size - 1)
+            if window is None:
+                start = ring.sample(ring.size - 2)
+                begin, elapsed = (
+                    start.position,
+                    end.timestamp - start.timestamp,
+                )
+            else:
+                begin = self._position_at(ring, end.timestamp - window)
+                elapsed = window
+        if (
+            begin is None
+            or elapsed <= 0
+            or begin.dimension is not end.position.dimension
+        ):
+            return None
+        last = end.position
+        return (
+            (last.x - begin.x) / elapsed,
+            (last.y - begin.y) / elapsed,
+            (last.z - begin.z) / elapsed,
+        )
+
+    def speed(
+        self,
+        player: str,
+        window: float | None = None,
+        horizontal: bool = False,
+    ) -> float | None:
+        """Get the speed of a player in blocks per second.
+
+        :param player: The name of the player.
+        :param window: Passed to :meth:`velocity`. Defaults to :obj:`None`.
+        :param horizontal: Whether to ignore the y coordinate. Defaults to :obj:`False`.
+
+        :return: The speed, or :obj:`None` if :meth:`velocity` is :obj:`None`.
+        """
+        velocity = self.velocity(player, window)
+        if velocity is None:
+            return None
+        vx, vy, vz = velocity
+        return math.hypot(vx, vz) if horizontal else math.hypot(vx, vy, vz)
+
+    def heading(
+        self, player: str, window: float | None = None
+    ) -> float | None:
+        """Get the horizontal direction a player moves in, as a Minecraft yaw.
+
+        :param player: The name of the player.
+        :param window: Passed to :meth:`velocity`. Defaults to :obj:`None`.
+
+        :return: The yaw in degrees from ``-180`` to ``180``, ``0`` being south (+z) and
+            ``90`` west (-x), or :obj:`None` if the player doesn't move horizontally.
+        """
+        velocity = self.velocity(player, window)
+        if velocity is None:
+            return None
+        vx, _, vz = velocity
+        if vx == 0 and vz == 0:
+            return None
+        return math.degrees(math.atan2(-vx, vz))
+
+    @staticmethod
+    def _position_at(ring: _Ring, timestamp: float) -> MCPosition | None:
+        after = ring.bisect_right(timestamp)
+        if after == 0:
+            return None
+        if after == ring.size:
+            if ring.time(after - 1) != timestamp:
+                return None
+            return ring.sample(after - 1).position
+        a, b = ring.slot(after - 1), ring.slot(after)
+        if ring.dims[a] != ring.dims[b]:
+            return ring.sample(after - 1).position
+        fraction = (timestamp - ring.times[a]) / (
+            ring.times[b] - ring.times[a]
+        )
+        return MCPosition(
+            Point3D.trusted(
+                ring.xs[a] + (ring.xs[b] - ring.xs[a]) * fraction,
+                ring.ys[a] + (ring.ys[b] - ring.ys[a]) * fraction,
+                ring.zs[a] + (ring.zs[b] - ring.zs[a]) * fraction,
+            ),
+            _dimension(ring.dims[a]),
+        )
@@ -0,0 +1,261 @@
+"""This module provides a spatial index of locations for nearest and range queries.
+
+Locations are partitioned by dimension, and each partition is a uniform grid of
+columns on the x-z plane. The default cell size is a chunk (16 blocks), and the
+y-coordinate is only used when measuring distances, as the height of a Minecraft
+world is small compared to its width.
+"""
+
+import heapq
+import math
+from typing import Iterable, Iterator, TypeAlias
+
+from location_api import Location, MCPosition, Point3D
+from location_api.dimension import as_dimension
+
+_Cell: TypeAlias = tuple[int, int]
+
+
+class LocationIndex:
+    """Index locations by dimension and grid cell.
+
+    Queries only visit the cells around the query position instead of all locations,
+    and locations can be inserted or removed one by one without rebuilding the index.
+
+    The index keeps the cell of every location at insertion, so a location whose
+    position is changed must be removed before the change and inserted again after it.
+    """
+
+    def __init__(
+        self, locations: Iterable[Location] = (), cell_size: float = 16.0
+    ):
+        """
+        :param locations: The locations to insert initially. Defaults to an empty tuple.
+        :param cell_size: The side length in blocks of the grid cells. Defaults to ``16.0``.
+
+        :raises ValueError: If ``cell_size`` is not positive.
+        """
+        if cell_size <= 0:
+            raise ValueError("Cell size must be positive!")
+        self.cell_size = cell_size
+        self._grids: dict[str, dict[_Cell, list[Location]]] = {}
+        self._cells: dict[int, tuple[str, _Cell]] = {}
+        for location in locations:
+            self.insert(location)
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def __contains__(self, location: object) -> bool:
+        return id(location) in self._cells
+
+    def __iter__(self) -> Iterator[Location]:
+        for grid in self._grids.values():
+            for cell in grid.values():
+                yield from cell
+
+    @property
+    def dimensions(self) -> frozenset[str]:
+        """The dimensions having indexed locations."""
+        return frozenset(self._grids)
+
+    def _cell_of(self, x: float, z: float) -> _Cell:
+        return (
+            math.floor(x / self.cell_size),
+            math.floor(z / self.cell_size),
+        )
+
+    def insert(self, location: Location) -> None:
+        """Add a location to the index, nothing happens if it is already indexed.
+
+        :param location: The location.
+        """
+        key = id(location)
+        if key in self._cells:
+            return
+        dimension = location.dimension
+        cell = self._cell_of(location.x, location.z)
+        grid = self._grids.setdefault(dimension, {})
+        grid.setdefault(cell, []).append(location)
+        self._cells[key] = (dimension, cell)
+
+    def remove(self, location: Location) -> None:
+        """Remove a location from the index.
+
+        :param location: The location, which is compared by identity.
+
+        :raises KeyError: If the location is not indexed.
+        """
+        dimension, cell = self._cells.pop(id(location))
+        grid = self._grids[dimension]
+        bucket = grid[cell]
+        for i, indexed in enumerate(bucket):
+            if indexed is location:
+                del bucket[i]
+                break
+        if not bucket:
+            del grid[cell]
+            if not grid:
+                del self._grids[dimension]
+
+    def clear(self) -> None:
+        """Remove all locations from the index."""
+        self._grids.clear()
+        self._cells.clear()
+
+    def _rings(
+        self, grid: dict[_Cell, list[Location]], center: _Cell
+    ) -> Iterator[tuple[int, list[Location]]]:
+        """Yield the locations ring by ring around a cell.
+
+        The ``r``-th ring holds the cells whose Chebyshev distance to ``center`` is ``r``.
+        Once a ring would have more cells than the occupied ones, the remaining
+        occupied cells are yielded by their own rings instead of scanning empty cells.
+        """
+        cx, cz = center
+        r = 0
+        while True:
+            if 8 * r >= len(grid):
+                break
+            if r == 0:
+                cells = [center]
+            else:
+                cells = [(cx + d, cz - r) for d in range(-r, r + 1)]
+                cells += [(cx + d, cz + r) for d in range(-r, r + 1)]
+                cells += [(cx - r, cz + d) for d in range(-r + 1, r)]
+                cells += [(cx + r, cz + d) for d in range(-r + 1, r)]
+            found = []
+            for cell in cells:
+                bucket = grid.get(cell)
+                if bucket:
+                    found.extend(bucket)
+            yield r, found
+            r += 1
+        remaining: dict[int, list[Location]] = {}
+        for (x, z), bucket in grid.items():
+            ring = max(abs(x - cx), abs(z - cz))
+            if ring >= r:
+                remaining.setdefault(ring, []).extend(bucket)
+        for ring in sorted(remaining):
+            yield ring, remaining[ring]
+
+    def nearest(self, position: MCPosition, k: int = 1) -> list[Location]:
+        """Find the nearest locations to a position in the same dimension.
+
+        :param position: The position.
+        :param k: The maximum number of locations to find. Defaults to ``1``.
+
+        :return: At most ``k`` locations, from the nearest to the farthest.
+        """
+        grid = self._grids.get(position.dimension)
+        if not grid or k <= 0:
+            return []
+        px, py, pz = position.x, position.y, position.z
+        center = self._cell_of(px, pz)
+        # A max-heap of (-distance, counter, location) keeping the best k.
+        best: list[tuple[float, int, Location]] = []
+        counter = 0
+        for ring, found in self._rings(grid, center):
+            # Unvisited locations are at least this far from the position.
+            if len(best) == k and -best[0][0] <= (ring - 1) * self.cell_size:
+                break
+            for location in found:
+                distance = math.hypot(
+                    location.x - px, location.y - py, location.z - pz
+                )
+                counter += 1
+                if len(best) < k:
+                    heapq.heappush(best, (-distance, counter, location))
+                elif distance < -best[0][0]:
+                    heapq.heapreplace(best, (-distance, counter, location))
+        return [location for _, _, location in sorted(best, reverse=True)]
+
+    def within_radius(
+        self, position: MCPosition, radius: float
+    ) -> list[Location]:
+        """Find the locations within a distance to a position in the same dimension.
+
+        :param position: The position.
+        :param radius: The maximum Euclidean distance, inclusive.
+
+        :return: The locations, from the nearest to the farthest, none if ``radius``
+            is negative.
+        """
+        if not radius >= 0:
+            return []
+        grid = self._grids.get(position.dimension)
+        if not grid:
+            return []
+        px, py, pz = position.x, position.y, position.z
+        side = 2 * radius / self.cell_size + 1
+        if side * side > len(grid):
+            # More cells in range than occupied ones, which also keeps a huge
+            # radius from overflowing the cell coordinates.
+            candidates = (
+                location for bucket in grid.values() for location in bucket
+            )
+        else:
+            low = self._cell_of(px - radius, pz - radius)
+            high = self._cell_of(px + radius, pz + radius)
+            candidates = self._in_cells(grid, low, high)
+        found = []
+        for location in candidates:
+            distance = math.hypot(
+                location.x - px, location.y - py, location.z - pz
+            )
+            if distance <= radius:
+                found.append((distance, len(found), location))
+        found.sort()
+        return [location for _, _, location in found]
+
+    def within_box(
+        self, dimension: str, corner1: Point3D, corner2: Point3D
+    ) -> list[Location]:
+        """Find the locations inside an axis-aligned box in a dimension.
+
+        :param dimension: The dimension, with or without a namespace.
+        :param corner1: A corner of the box.
+        :param corner2: The opposite corner of the box, both corners are inclusive.
+
+        :return: The locations, in no particular order.
+        """
+        grid = self._grids.get(as_dimension(dimension))
+        if not grid:
+            return []
+        x1, x2 = sorted((corner1.x, corner2.x))
+        y1, y2 = sorted((corner1.y, corner2.y))
+        z1, z2 = sorted((corner1.z, corner2.z))
+        if math.isfinite(x1 + x2 + z1 + z2):
+            low = self._cell_of(x1, z1)
+            high = self._cell_of(x2, z2)
+            candidates = self._in_cells(grid, low, high)
+        else:
+            # An infinite side covers every occupied cell, and has no cell itself.
+            candidates = (
+                location for bucket in grid.values() for location in bucket
+            )
+        return [
+            location
+            for location in candidates
+            if x1 <= location.x <= x2
+            and y1 <= location.y <= y2
+            and z1 <= location.z <= z2
+        ]
+
+    @staticmethod
+    def _in_cells(
+        grid: dict[_Cell, list[Location]], low: _Cell, high: _Cell
+    ) -> Iterator[Location]:
+        width = high[0] - low[0] + 1
+        depth = high[1] - low[1] + 1
+        if width * depth > len(grid):
+            # Fewer occupied cells than cells in the range, scan them instead.
+            for (x, z), bucket in grid.items():
+                if low[0] <= x <= high[0] and low[1] <= z <= high[1]:
+                    yield from bucket
+            return
+        for x in range(low[0], high[0] + 1):
+            for z in range(low[1], high[1] + 1):
+                bucket = grid.get((x, z))
+                if bucket:
+                    yield from bucket
@@ -0,0 +1,79 @@
+"""This module provides streaming import and export of locations in JSON Lines.
+
+Each line of a file holds one :meth:`Location.asdict` record. Files are read and
+written one record at a time, so converting or filtering a dump takes constant
+memory however large it is.
+"""
+
+import json
+import os
+from typing import Iterable, Iterator
+
+from returns.result import Failure, Result, Success
+
+from location_api import Location
+from location_api.utils import atomic_write
+
+
+class RecordError(ValueError):
+    """An exception raised when a line could not be read as a location."""
+
+    def __init__(self, lineno: int, error: Exception):
+        """
+        :param lineno: The line number, starting from 1.
+        :param error: The exception raised by the line.
+        """
+        super().__init__(f"Line {lineno}: {error}")
+        self.lineno = lineno
+        """The line number, starting from 1.
+        """
+        self.error = error
+        """The exception raised by the line.
+        """
+
+
+def iter_locations(
+    path: str | os.PathLike,
+) -> Iterator[Result[Location, RecordError]]:
+    """Read the locations in a JSON Lines file one by one.
+
+    Blank lines are skipped. A line that is not valid JSON or not a valid location
+    yields a :class:`~returns.result.Failure` and the reading goes on.
+
+    :param path: The path of the file.
+
+    :return: An iterator of the location results, in the order of the lines.
+
+    :raises OSError: If the file could not be opened.
+    """
+    with open(path, encoding="utf-8") as file:
+        for lineno, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                if not isinstance(record, dict):
+                    raise TypeError("Record is not an object!")
+                yield Success(Location.from_dict(record))
+            except Exception as e:
+                yield Failure(RecordError(lineno, e))
+
+
+def write_locations(
+    path: str | os.PathLike, locations: Iterable[Location]
+) -> int:
+    """Write locations to a JSON Lines file one by one, replacing it atomically.
+
+    :param path: The path of the file, which can be the file ``locations`` is read from.
+    :param locations: The locations, such as those filtered from :data:`iter_locations`.
+
+    :return: The number of locations written.
+    """
+    count = 0
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    with atomic_write(path) as file:
+        for location in locations:
+            file.write(encode(location.asdict()))
+            file.write("\n")
+            count += 1
+    return count
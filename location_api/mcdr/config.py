@@ -0,0 +1,22 @@
+from mcdreforged.api.utils import Serializable
+
+
+class TrackerConfig(Serializable):
+    enabled: bool = True
+    interval: float = 1.0
+    concurrency: int = 8
+    single_query: bool = False
+    snapshot_query: bool = False
+    history: int = 600  # Samples kept per player, 0 to disable
+
+
+class TransportConfig(Serializable):
+    backend: str = "pool"  # "pool", "rcon" or "console"
+    timeout: float = 5.0
+    connections: int = 4
+    pipeline: int = 1
+
+
+class Config(Serializable):
+    tracker: TrackerConfig = TrackerConfig()
+    transport: TransportConfig = TransportConfig()
@@ -1,14 +1,94 @@
-from mcdreforged.api.all import PluginServerInterface
+from mcdreforged.api.all import Info, PluginServerInterface
 
 import location_api.runtime as rt
+from location_api.console import ConsoleTransport
+from location_api.history import PositionHistory
 from location_api.mcdr.commands import build_command_tree
+from location_api.mcdr.config import Config, TransportConfig
+from location_api.pos import (
+    CommandTransport,
+    invalidate_player_pos,
+    set_transport,
+)
+from location_api.rcon import PooledRconTransport
+from location_api.tracker import tracker
+
+console = ConsoleTransport()
+_pool: PooledRconTransport | None = None
 
 
 async def on_load(server: PluginServerInterface, _prev_module):
     rt.psi = server
+    config = server.load_config_simple(target_class=Config)
     server.register_command(build_command_tree())
+    set_transport(build_transport(server, config.transport))
+    if config.tracker.enabled:
+        tracker.interval = config.tracker.interval
+        tracker.concurrency = config.tracker.concurrency
+        tracker.single_query = config.tracker.single_query
+        tracker.snapshot_query = config.tracker.snapshot_query
+        if config.tracker.history > 0:
+            tracker.history = PositionHistory(config.tracker.history)
+        prev_tracker = getattr(_prev_module, "tracker", None)
+        if prev_tracker is not None:
+            tracker.set_players(prev_tracker.players)
+        tracker.start()
     server.logger.info("Loaded LocationAPI.")
 
 
+def build_transport(
+    server: PluginServerInterface, config: TransportConfig
+) -> CommandTransport | None:
+    global _pool
+    if config.backend == "console":
+        console.timeout = config.timeout
+        return console
+    if config.backend == "pool":
+        rcon = server.get_mcdr_config()["rcon"]
+        if not rcon["enable"]:
+            server.logger.warning(
+                "RCON is disabled in MCDR, enable it or use the console transport."
+            )
+        _pool = PooledRconTransport(
+            rcon["address"],
+            rcon["port"],
+            rcon["password"],
+            connections=config.connections,
+            pipeline=config.pipeline,
+            timeout=config.timeout,
+        )
+        return _pool
+    if config.backend != "rcon":
+        server.logger.warning(
+            f"Unknown transport {config.backend}, using rcon."
+        )
+    return None
+
+
+def on_info(server: PluginServerInterface, info: Info):
+    # Chat can quote a reply, only the output of commands answers queries.
+    if info.is_from_server and not info.is_player:
+        console.feed(info.content)
+
+
+def on_player_joined(server: PluginServerInterface, player: str, _info: Info):
+    tracker.add_player(player)
+
+
+def on_player_left(server: PluginServerInterface, player: str):
+    tracker.remove_player(player)
+    invalidate_player_pos(player)
+
+
+def on_server_stop(server: PluginServerInterface, _return_code: int):
+    tracker.clear()
+    invalidate_player_pos()
+
+
 def on_unload(server: PluginServerInterface):
+    tracker.stop()
+    console.close()
+    if _pool is not None:
+        _pool.close()
+    set_transport()
     server.logger.info("Unloaded LocationAPI.")
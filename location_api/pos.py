@@ -3,24 +3,53 @@
 To use APIs here, you must have set up `MCDReforged <https://docs.mcdreforged.com>`__ in your environment.
 """
 
+import asyncio
 import re
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, Protocol
 
-from mcdreforged.api.all import CommandContext, CommandSource
-from moolings_rcon_api.api import rcon_get
+from returns.maybe import Maybe
 from returns.result import Failure, Result, Success, safe
 
 import location_api.runtime as rt
 from location_api import MCPosition, Point3D
+from location_api.metrics import metrics
+from location_api.snbt import parse_snbt_prefix
 from location_api.utils import promote_to_result
 
+if TYPE_CHECKING:
+    from mcdreforged.api.all import CommandContext, CommandSource
+
+_POINT3D_PATTERN = re.compile(
+    # Captures three numbers with optional decimal part and optional 'd' suffix
+    r"\[(-?\d+(?:\.\d+)?)d?,\s*(-?\d+(?:\.\d+)?)d?,\s*(-?\d+(?:\.\d+)?)d?\]"
+)
+_DIMENSION_PATTERN = re.compile(r"minecraft:(\w+)")
+_DIMENSION_PREFIX = "minecraft:"
+# The last word before the marker, dropping a team prefix of the display name.
+_ENTITY_REPLY_PATTERN = re.compile(r"(\w+) has the following entity data: ")
+
+ENTITY_DATA_KEYS = ("Pos", "Dimension", "Rotation", "Motion")
+"""The keys kept by :data:`get_entity_data_from_server_reply` by default.
+"""
+
 # _PSI: PluginServerInterface | None = None
 
+_LOOKUP_LATENCY = metrics.histogram("get_player_pos")
+_RCON_LATENCY = metrics.histogram("rcon")
+_PARSE_POS_LATENCY = metrics.histogram("parse_pos")
+_PARSE_DIM_LATENCY = metrics.histogram("parse_dim")
+_PARSE_ENTITY_LATENCY = metrics.histogram("parse_entity")
+_SNAPSHOT_LATENCY = metrics.histogram("snapshot_all_positions")
+
 
-def on_debug_pos_help(src: CommandSource):
+def on_debug_pos_help(src: "CommandSource"):
     src.reply("Usage: !!loc_api debug pos <player>")
 
 
-async def on_debug_pos(src: CommandSource, ctx: CommandContext):
+async def on_debug_pos(src: "CommandSource", ctx: "CommandContext"):
     result = await get_player_pos(ctx["player"])
     match result:
         case Success(pos):
@@ -50,11 +79,7 @@ def get_point3d_from_server_reply(
     if "No entity was found" in content:
         return None
 
-    if regex is None:
-        # Captures three numbers with optional decimal part and optional 'd' suffix
-        regex = r"\[(-?\d+(?:\.\d+)?)d?,\s*(-?\d+(?:\.\d+)?)d?,\s*(-?\d+(?:\.\d+)?)d?\]"
-
-    pattern = re.compile(regex)
+    pattern = _POINT3D_PATTERN if regex is None else _compile(regex)
     match = pattern.search(content)
 
     if not match:
@@ -74,7 +99,7 @@ def get_point3d_from_server_reply(
     if player_name is not None and player_name not in content:
         return None
 
-    return Point3D(x=x, y=y, z=z)
+    return Point3D.trusted(x, y, z)
 
 
 def get_dimension_from_server_reply(
@@ -94,15 +119,124 @@ def get_dimension_from_server_reply(
         return None
 
     if regex is None:
-        regex = r"minecraft:(\w+)"
-
-    match = re.search(regex, content)
+        dimension = _fast_parse_dimension(content)
+        if dimension is not None:
+            return dimension
+        match = _DIMENSION_PATTERN.search(content)
+    else:
+        match = _compile(regex).search(content)
     if match is None:
         return None
 
     return match.group(1)
 
 
+@lru_cache(maxsize=64)
+def _compile(regex: str) -> re.Pattern[str]:
+    return re.compile(regex)
+
+
+def _fast_parse_dimension(content: str) -> str | None:
+    # Handles the vanilla ``"minecraft:<id>"`` format without regex, returns None
+    # for anything unusual so that the caller falls back to the regex.
+    start = content.find(_DIMENSION_PREFIX)
+    if start == -1:
+        return None
+    name = content[start + len(_DIMENSION_PREFIX) :].partition('"')[0]
+    if name and name.replace("_", "a").isalnum():
+        return name
+    return None
+
+
+def get_entity_data_from_server_reply(
+    content: str,
+    player_name: str | None = None,
+    keys: tuple[str, ...] | None = ENTITY_DATA_KEYS,
+) -> dict | None:
+    """Extracts the entity data compound from a text content, like this:
+
+    ``CleMooling has the following entity data: {Pos: [-524.5d, 71.0d, -66.5d], Dimension: "minecraft:overworld", ...}``
+
+    :param content: The text content to extract the entity data from.
+    :param player_name: The name of the player. Defaults to :obj:`None`.
+    :param keys: The top-level keys to keep, others are skipped without being parsed.
+        Defaults to :data:`ENTITY_DATA_KEYS`, use :obj:`None` to keep all keys.
+
+    :returns:
+        * :obj:`None` -- If matches ``No entity was found`` or if player name is provided but not found in log content.
+        * :class:`dict` -- The parsed entity data compound.
+
+    :raises TypeError: If the entity data cannot be extracted.
+    """
+    if "No entity was found" in content:
+        return None
+
+    if player_name is not None and player_name not in content:
+        return None
+
+    start = content.find("{")
+    if start == -1:
+        raise TypeError(
+            f"Could not extract entity data from log content: {content}"
+        )
+
+    try:
+        data, _ = parse_snbt_prefix(content, start, keys)
+    except ValueError as e:
+        raise TypeError(
+            f"Could not parse entity data from log content: {content}"
+        ) from e
+
+    return data  # ty: ignore[invalid-return-type]
+
+
+def get_position_from_entity_data(data: dict) -> MCPosition:
+    """Builds a :class:`~location_api.MCPosition` instance from an entity data compound.
+
+    The dimension is normalized to a :class:`~location_api.dimension.Dimension`,
+    like the dimensions of all positions.
+
+    :param data: The entity data compound, containing ``Pos`` and ``Dimension`` at least.
+
+    :returns: The position of the entity.
+
+    :raises TypeError: If ``Pos`` or ``Dimension`` is missing or malformed.
+    """
+    pos = data.get("Pos")
+    dimension = data.get("Dimension")
+    if not isinstance(pos, list) or len(pos) != 3:
+        raise TypeError(f"Invalid Pos in entity data: {pos}")
+    if not isinstance(dimension, str):
+        raise TypeError(f"Invalid Dimension in entity data: {dimension}")
+    try:
+        point = Point3D.trusted(float(pos[0]), float(pos[1]), float(pos[2]))
+    except (TypeError, ValueError) as e:
+        raise TypeError(f"Could not convert Pos values to float: {pos}") from e
+    return MCPosition(point=point, dimension=dimension)
+
+
+def split_entity_data_reply(content: str) -> dict[str, str]:
+    """Splits the reply of a ``data get entity`` command run for many entities, like this:
+
+    ``Alice has the following entity data: [1.0d, 64.0d, 2.0d]Bob has the following entity data: [-3.5d, 70.0d, 8.0d]``
+
+    RCON joins the messages of the entities without a separator, and the console
+    logs one line per entity, both are handled.
+
+    :param content: The text content to split.
+
+    :returns: A dict maps every entity name to its data, the text following its
+        ``has the following entity data:``. The name is the last word before it,
+        so a team prefix is dropped.
+    """
+    replies = {}
+    matches = list(_ENTITY_REPLY_PATTERN.finditer(content))
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
+        replies[match.group(1)] = content[match.end() : end].strip()
+    return replies
+
+
 @safe
 def safe_parse_pos(pos_str: str, player: str) -> Point3D:
     """A wrapper to get a :class:`~location_api.Point3D` instance from a string(rcon command result as server reply).
@@ -113,8 +247,14 @@ def safe_parse_pos(pos_str: str, player: str) -> Point3D:
     :param player: The name of the player.
     :return: The parsed :class:`~location_api.Point3D` result, but actually a :class:`~returns.result.Result` object.
     """
-    result = get_point3d_from_server_reply(pos_str, player)
+    with _PARSE_POS_LATENCY.time():
+        try:
+            result = get_point3d_from_server_reply(pos_str, player)
+        except TypeError:
+            metrics.incr("parse_errors")
+            raise
     if result is None:
+        metrics.incr("offline")
         raise ValueError(f"No data received for {player}!")
     return result
 
@@ -129,26 +269,402 @@ def safe_parse_dim(dim_str: str, player: str) -> str:
     :param player: The name of the player.
     :return: The parsed dimension string, but actually a :class:`~returns.result.Result` object.
     """
-    result = get_dimension_from_server_reply(dim_str)
+    with _PARSE_DIM_LATENCY.time():
+        result = get_dimension_from_server_reply(dim_str)
     if result is None:
+        if "No entity was found" in dim_str:
+            metrics.incr("offline")
+        else:
+            metrics.incr("parse_errors")
         raise ValueError(f"No data received for {player}!")
     return result
 
 
-async def get_player_pos(player: str) -> Result[MCPosition, Exception]:
-    """Get the position of a player.
+@safe
+def safe_parse_entity_pos(data_str: str, player: str) -> MCPosition:
+    """A wrapper to get a :class:`~location_api.MCPosition` instance from a string(rcon command result of the whole entity data as server reply).
+
+    Actually calls :data:`get_entity_data_from_server_reply` and :data:`get_position_from_entity_data`.
 
+    :param data_str: The string to parse.
     :param player: The name of the player.
+    :return: The parsed :class:`~location_api.MCPosition` result, but actually a :class:`~returns.result.Result` object.
+    """
+    with _PARSE_ENTITY_LATENCY.time():
+        try:
+            data = get_entity_data_from_server_reply(data_str, player)
+            position = (
+                None if data is None else get_position_from_entity_data(data)
+            )
+        except TypeError:
+            metrics.incr("parse_errors")
+            raise
+    if position is None:
+        metrics.incr("offline")
+        raise ValueError(f"No data received for {player}!")
+    return position
 
-    :return: The position of the player or an exception.
+
+class PositionCache:
+    """A size-bounded LRU cache of player positions.
+
+    Every cached position records the time it was fetched, so that a caller
+    can decide how old a position it would accept with ``max_age``.
+
+    Every invalidation of a player advances its :meth:`generation`, so a lookup
+    finishing after its player was invalidated, such as after leaving the server,
+    doesn't cache the position again.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        """
+        :param maxsize: The maximum number of players to keep, the least recently used
+            player is evicted first. Defaults to ``256``.
+
+        :raises ValueError: If ``maxsize`` is less than ``1``.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1!")
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[float, MCPosition]] = (
+            OrderedDict()
+        )
+        self._generations: dict[str, int] = {}
+        self._clears = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, player: str) -> bool:
+        return player in self._entries
+
+    def get(self, player: str, max_age: float) -> MCPosition | None:
+        """Get the cached position of a player.
+
+        :param player: The name of the player.
+        :param max_age: The maximum age in seconds of the cached position.
+
+        :return: The cached position, or :obj:`None` if not cached or older than ``max_age``.
+        """
+        entry = self._entries.get(player)
+        if entry is None:
+            return None
+        timestamp, position = entry
+        if time.monotonic() - timestamp > max_age:
+            return None
+        self._entries.move_to_end(player)
+        return position
+
+    def generation(self, player: str) -> int:
+        """Get the number of times a player was invalidated, by itself or by :meth:`clear`.
+
+        :param player: The name of the player.
+
+        :return: The generation to pass to :meth:`put` after fetching the position.
+        """
+        return self._clears + self._generations.get(player, 0)
+
+    def put(
+        self,
+        player: str,
+        position: MCPosition,
+        timestamp: float | None = None,
+        generation: int | None = None,
+    ) -> None:
+        """Cache the position of a player.
+
+        :param player: The name of the player.
+        :param position: The position of the player.
+        :param timestamp: The :func:`time.monotonic` time the position was fetched.
+            Defaults to :obj:`None` as now.
+        :param generation: The :meth:`generation` of the player when the fetch started,
+            the position isn't cached if the player was invalidated since.
+            Defaults to :obj:`None` as always caching.
+        """
+        if generation is not None and generation != self.generation(player):
+            return
+        if timestamp is None:
+            timestamp = time.monotonic()
+        self._entries[player] = (timestamp, position)
+        self._entries.move_to_end(player)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, player: str) -> None:
+        """Remove the cached position of a player, if any.
+
+        :param player: The name of the player.
+        """
+        self._entries.pop(player, None)
+        self._generations[player] = self._generations.get(player, 0) + 1
+
+    def clear(self) -> None:
+        """Remove all cached positions."""
+        self._entries.clear()
+        self._clears += 1
+
+
+position_cache = PositionCache()
+"""The cache used by :data:`get_player_pos`.
+
+It's invalidated automatically when a player leaves the server.
+"""
+
+
+async def rcon_get(psi, command: str) -> Result[Maybe[str], Exception]:
+    """Run a command through RCON with ``moolings_rcon_api``, which is imported on first use.
+
+    :param psi: The plugin server interface.
+    :param command: The command to run.
+
+    :return: The reply of the server, or an exception.
+    """
+    from moolings_rcon_api.api import rcon_get as _rcon_get
+
+    return await _rcon_get(psi, command)
+
+
+class CommandTransport(Protocol):
+    """Define how position queries reach the server."""
+
+    async def query(self, command: str) -> Result[str, Exception]:
+        """Run a command on the server.
+
+        :param command: The command to run, without the leading slash.
+
+        :return: The reply of the server, or an exception.
+        """
+        ...
+
+
+class RconTransport:
+    """Run commands through RCON with :data:`rcon_get`, the default transport.
+
+    The plugin replaces it with a :class:`~location_api.rcon.PooledRconTransport`
+    unless configured otherwise.
+    """
+
+    async def query(self, command: str) -> Result[str, Exception]:
+        return promote_to_result(await rcon_get(rt.psi, command))
+
+
+transport: CommandTransport = RconTransport()
+"""The transport used by :data:`get_player_pos`, change it with :data:`set_transport`.
+"""
+
+
+def set_transport(new_transport: CommandTransport | None = None) -> None:
+    """Change the transport used by :data:`get_player_pos`.
+
+    :param new_transport: The transport. Defaults to :obj:`None` as a new :class:`RconTransport`.
     """
-    raw_pos = await rcon_get(rt.psi, f"data get entity {player} Pos")
-    raw_dim = await rcon_get(rt.psi, f"data get entity {player} Dimension")
+    global transport
+    transport = RconTransport() if new_transport is None else new_transport
+
+
+async def _rcon_query(command: str) -> Result[str, Exception]:
+    with _RCON_LATENCY.time():
+        result = await transport.query(command)
+    if not isinstance(result, Success):
+        metrics.incr("rcon_errors")
+    return result
+
+
+async def _query_player_pos(
+    player: str, single_query: bool
+) -> Result[MCPosition, Exception]:
+    if single_query:
+        raw_data = await _rcon_query(f"data get entity {player}")
+        return raw_data.bind(
+            lambda data_str: safe_parse_entity_pos(data_str, player)
+        )
+
+    raw_pos = await _rcon_query(f"data get entity {player} Pos")
+    raw_dim = await _rcon_query(f"data get entity {player} Dimension")
 
     return Result.do(
         MCPosition(point=point, dimension=dimension)
-        for pos_str in promote_to_result(raw_pos)
-        for dim_str in promote_to_result(raw_dim)
+        for pos_str in raw_pos
+        for dim_str in raw_dim
         for point in safe_parse_pos(pos_str, player)
         for dimension in safe_parse_dim(dim_str, player)
     )
+
+
+async def _fetch_player_pos(
+    player: str, single_query: bool
+) -> Result[MCPosition, Exception]:
+    generation = position_cache.generation(player)
+    result = await _query_player_pos(player, single_query)
+    if isinstance(result, Success):
+        position_cache.put(player, result.unwrap(), generation=generation)
+    return result
+
+
+_in_flight: dict[str, asyncio.Task[Result[MCPosition, Exception]]] = {}
+
+
+def _forget_in_flight(
+    player: str, task: asyncio.Task[Result[MCPosition, Exception]]
+) -> None:
+    if _in_flight.get(player) is task:
+        del _in_flight[player]
+    if not task.cancelled():
+        task.exception()  # Retrieved, even if every caller was cancelled.
+
+
+async def _shared_fetch_player_pos(
+    player: str, single_query: bool
+) -> Result[MCPosition, Exception]:
+    # Concurrent lookups of a player share one task, which keeps running when
+    # one of its callers is cancelled, as long as they run in the same loop.
+    loop = asyncio.get_running_loop()
+    task = _in_flight.get(player)
+    if task is None or task.get_loop() is not loop:
+        task = loop.create_task(_fetch_player_pos(player, single_query))
+        _in_flight[player] = task
+        task.add_done_callback(lambda t: _forget_in_flight(player, t))
+    else:
+        metrics.incr("coalesced")
+    return await asyncio.shield(task)
+
+
+async def get_player_pos(
+    player: str, single_query: bool = False, max_age: float | None = None
+) -> Result[MCPosition, Exception]:
+    """Get the position of a player.
+
+    Concurrent lookups of the same player are coalesced: a lookup started while
+    another one is querying the server waits for it and gets the same result,
+    instead of sending its own queries.
+
+    Every successfully fetched position is stored in :data:`position_cache`,
+    but it's only read back when ``max_age`` is provided.
+    Every lookup is recorded in :data:`~location_api.metrics.metrics`.
+
+    :param player: The name of the player.
+    :param single_query: Whether to get the whole entity data with a single command,
+        instead of querying ``Pos`` and ``Dimension`` one after another. Defaults to :obj:`False`.
+    :param max_age: The maximum age in seconds of a cached position to accept
+        instead of querying the server. Defaults to :obj:`None` as always querying.
+
+    :return: The position of the player or an exception.
+    """
+    with _LOOKUP_LATENCY.time():
+        if max_age is not None:
+            cached = position_cache.get(player, max_age)
+            if cached is not None:
+                metrics.incr("cache_hits")
+                return Success(cached)
+            metrics.incr("cache_misses")
+
+        return await _shared_fetch_player_pos(player, single_query)
+
+
+async def snapshot_all_positions(
+    selector: str = "@a",
+) -> Result[dict[str, MCPosition], Exception]:
+    """Get the positions of all online players with two commands, however many players are online.
+
+    ``Pos`` and ``Dimension`` are queried once each for every entity matched by
+    ``selector``, like ``execute as @a run data get entity @s Pos``, and the replies
+    are split with :data:`split_entity_data_reply`. A player whose data can't be
+    parsed, or who only appears in one of the replies because of joining or leaving
+    between them, is left out.
+
+    Every position is stored in :data:`position_cache`. The
+    :class:`~location_api.console.ConsoleTransport` doesn't support it, and as the
+    server replies nothing when no player matches, a transport may report an
+    exception for an empty server.
+
+    :param selector: The entity selector. Defaults to ``"@a"``, all online players.
+
+    :return: A dict maps player names to their positions, or an exception if a query failed.
+    """
+    with _SNAPSHOT_LATENCY.time():
+        raw_pos = await _rcon_query(
+            f"execute as {selector} run data get entity @s Pos"
+        )
+        raw_dim = await _rcon_query(
+            f"execute as {selector} run data get entity @s Dimension"
+        )
+        return Result.do(
+            _parse_snapshot(pos_str, dim_str)
+            for pos_str in raw_pos
+            for dim_str in raw_dim
+        )
+
+
+def _parse_snapshot(pos_str: str, dim_str: str) -> dict[str, MCPosition]:
+    dimensions = split_entity_data_reply(dim_str)
+    positions = {}
+    timestamp = time.monotonic()
+    for player, data in split_entity_data_reply(pos_str).items():
+        if player not in dimensions:
+            continue
+        try:
+            point = get_point3d_from_server_reply(data)
+        except TypeError:
+            point = None
+        dimension = get_dimension_from_server_reply(dimensions[player])
+        if point is None or dimension is None:
+            metrics.incr("parse_errors")
+            continue
+        positions[player] = position = MCPosition(point, dimension)
+        position_cache.put(player, position, timestamp)
+    return positions
+
+
+def invalidate_player_pos(player: str | None = None) -> None:
+    """Invalidate the cached position of a player.
+
+    :param player: The name of the player. Defaults to :obj:`None` as invalidating all players.
+    """
+    if player is None:
+        position_cache.clear()
+    else:
+        position_cache.invalidate(player)
+
+
+async def get_players_pos(
+    players: Iterable[str],
+    concurrency: int = 8,
+    timeout: float | None = None,
+    single_query: bool = False,
+    max_age: float | None = None,
+) -> dict[str, Result[MCPosition, Exception]]:
+    """Get the positions of many players concurrently.
+
+    Each player is looked up with :data:`get_player_pos`, at most ``concurrency`` lookups are in flight at the same time.
+    A failed or timed out lookup only affects the result of its own player.
+
+    :param players: The names of the players, duplicates are queried only once.
+    :param concurrency: The maximum number of lookups running at the same time. Defaults to ``8``.
+    :param timeout: The timeout in seconds of every single lookup. Defaults to :obj:`None` as disabled.
+    :param single_query: Passed to :data:`get_player_pos`. Defaults to :obj:`False`.
+    :param max_age: Passed to :data:`get_player_pos`. Defaults to :obj:`None`.
+
+    :return: A dict maps every player name to its position or an exception.
+
+    :raises ValueError: If ``concurrency`` is less than ``1``.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1!")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(player: str) -> Result[MCPosition, Exception]:
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(
+                    get_player_pos(player, single_query, max_age), timeout
+                )
+            except TimeoutError:
+                return Failure(
+                    TimeoutError(f"Timed out getting position of {player}!")
+                )
+            except Exception as e:
+                return Failure(e)
+
+    names = list(dict.fromkeys(players))
+    results = await asyncio.gather(*(fetch(player) for player in names))
+    return dict(zip(names, results))
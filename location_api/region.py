@@ -0,0 +1,375 @@
+"""This module provides areas of a Minecraft world and a lookup of the areas containing a position.
+
+A chunk is a 16x16 column of blocks, and a region is a 32x32 area of chunks stored
+in one ``r.<x>.<z>.mca`` file. :class:`RegionSet` buckets named boxes by the chunks
+they overlap, so finding the boxes containing a position only tests the boxes
+overlapping its chunk.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Self, TypeAlias
+
+from location_api import MCPosition, Point2D, Point3D
+from location_api.dimension import as_dimension
+
+CHUNK_SIZE = 16
+"""The side length of a chunk in blocks.
+"""
+REGION_SIZE = 32
+"""The side length of a region in chunks.
+"""
+
+_Chunk: TypeAlias = tuple[int, int]
+_Entry: TypeAlias = tuple[int, str, "BoundingBox"]
+
+
+@dataclass(frozen=True, slots=True)
+class ChunkPos:
+    """Define the position of a chunk by its chunk coordinates."""
+
+    x: int
+    """The chunk x-coordinate, the block x-coordinate divided by 16 and floored.
+    """
+    z: int
+    """The chunk z-coordinate, the block z-coordinate divided by 16 and floored.
+    """
+
+    @classmethod
+    def from_point(cls, point: Point3D | Point2D | MCPosition) -> Self:
+        """Get the chunk containing a point.
+
+        :param point: The point or position.
+
+        :return: The chunk position.
+        """
+        return cls(math.floor(point.x) >> 4, math.floor(point.z) >> 4)
+
+    @property
+    def region(self) -> "RegionPos":
+        """The region containing the chunk."""
+        return RegionPos(self.x >> 5, self.z >> 5)
+
+    def to_box(
+        self, min_y: float = -64.0, max_y: float = 320.0
+    ) -> "BoundingBox":
+        """Get the box covering the blocks of the chunk.
+
+        :param min_y: The bottom of the box. Defaults to ``-64.0``.
+        :param max_y: The top of the box. Defaults to ``320.0``.
+
+        :return: The box.
+        """
+        x, z = self.x * CHUNK_SIZE, self.z * CHUNK_SIZE
+        return BoundingBox(x, min_y, z, x + CHUNK_SIZE, max_y, z + CHUNK_SIZE)
+
+
+@dataclass(frozen=True, slots=True)
+class RegionPos:
+    """Define the position of a region by its region coordinates."""
+
+    x: int
+    """The region x-coordinate, the chunk x-coordinate divided by 32 and floored.
+    """
+    z: int
+    """The region z-coordinate, the chunk z-coordinate divided by 32 and floored.
+    """
+
+    @classmethod
+    def from_point(cls, point: Point3D | Point2D | MCPosition) -> Self:
+        """Get the region containing a point.
+
+        :param point: The point or position.
+
+        :return: The region position.
+        """
+        return cls(math.floor(point.x) >> 9, math.floor(point.z) >> 9)
+
+    @classmethod
+    def from_chunk(cls, chunk: ChunkPos) -> Self:
+        """Get the region containing a chunk.
+
+        :param chunk: The chunk position.
+
+        :return: The region position.
+        """
+        return cls(chunk.x >> 5, chunk.z >> 5)
+
+    @property
+    def file_name(self) -> str:
+        """The name of the region file, like ``r.0.-1.mca``."""
+        return f"r.{self.x}.{self.z}.mca"
+
+    def chunks(self) -> Iterator[ChunkPos]:
+        """Iterate over the chunks of the region."""
+        x, z = self.x * REGION_SIZE, self.z * REGION_SIZE
+        for cx in range(x, x + REGION_SIZE):
+            for cz in range(z, z + REGION_SIZE):
+                yield ChunkPos(cx, cz)
+
+
+@dataclass(frozen=True, slots=True)
+class BoundingBox:
+    """Define an axis-aligned box by its minimum and maximum corners.
+
+    A point on a face of the box is inside the box.
+    """
+
+    min_x: float
+    """The minimum x-coordinate of the box.
+    """
+    min_y: float
+    """The minimum y-coordinate of the box.
+    """
+    min_z: float
+    """The minimum z-coordinate of the box.
+    """
+    max_x: float
+    """The maximum x-coordinate of the box.
+    """
+    max_y: float
+    """The maximum y-coordinate of the box.
+    """
+    max_z: float
+    """The maximum z-coordinate of the box.
+    """
+
+    def __post_init__(self):
+        if (
+            self.min_x > self.max_x
+            or self.min_y > self.max_y
+            or self.min_z > self.max_z
+        ):
+            raise ValueError(
+                f"The minimum corner of a box must not exceed the maximum corner: {self}"
+            )
+
+    @classmethod
+    def from_corners(cls, corner1: Point3D, corner2: Point3D) -> Self:
+        """Create the box between two opposite corners, in any order.
+
+        :param corner1: A corner of the box.
+        :param corner2: The opposite corner of the box.
+
+        :return: The box.
+        """
+        return cls(
+            min(corner1.x, corner2.x),
+            min(corner1.y, corner2.y),
+            min(corner1.z, corner2.z),
+            max(corner1.x, corner2.x),
+            max(corner1.y, corner2.y),
+            max(corner1.z, corner2.z),
+        )
+
+    @classmethod
+    def from_blocks(cls, block1: Point3D, block2: Point3D) -> Self:
+        """Create the box covering the blocks between two corner blocks, both included.
+
+        Like a selection in game, the blocks are taken by their floored coordinates,
+        so ``(0, 0, 0)`` to ``(15, 255, 15)`` covers up to ``(16, 256, 16)``.
+
+        :param block1: A corner block.
+        :param block2: The opposite corner block.
+
+        :return: The box.
+        """
+        x1, y1, z1 = (math.floor(v) for v in (block1.x, block1.y, block1.z))
+        x2, y2, z2 = (math.floor(v) for v in (block2.x, block2.y, block2.z))
+        return cls(
+            min(x1, x2),
+            min(y1, y2),
+            min(z1, z2),
+            max(x1, x2) + 1,
+            max(y1, y2) + 1,
+            max(z1, z2) + 1,
+        )
+
+    @property
+    def center(self) -> Point3D:
+        """The center of the box."""
+        return Point3D.trusted(
+            (self.min_x + self.max_x) / 2,
+            (self.min_y + self.max_y) / 2,
+            (self.min_z + self.max_z) / 2,
+        )
+
+    def contains(self, point: Point3D | MCPosition) -> bool:
+        """Check whether a point is inside the box.
+
+        :param point: The point, the dimension of a position is ignored.
+
+        :return: :obj:`True` if the point is inside the box or on its faces.
+        """
+        return (
+            self.min_x <= point.x <= self.max_x
+            and self.min_y <= point.y <= self.max_y
+            and self.min_z <= point.z <= self.max_z
+        )
+
+    def intersects(self, other: "BoundingBox") -> bool:
+        """Check whether two boxes overlap, touching faces included.
+
+        :param other: The other box.
+
+        :return: :obj:`True` if the boxes overlap.
+        """
+        return (
+            self.min_x <= other.max_x
+            and other.min_x <= self.max_x
+            and self.min_y <= other.max_y
+            and other.min_y <= self.max_y
+            and self.min_z <= other.max_z
+            and other.min_z <= self.max_z
+        )
+
+    def _chunk_range(self) -> tuple[int, int, int, int]:
+        return (
+            math.floor(self.min_x) >> 4,
+            math.floor(self.min_z) >> 4,
+            math.floor(self.max_x) >> 4,
+            math.floor(self.max_z) >> 4,
+        )
+
+    def chunks(self) -> Iterator[ChunkPos]:
+        """Iterate over the chunks overlapping the box."""
+        x1, z1, x2, z2 = self._chunk_range()
+        for cx in range(x1, x2 + 1):
+            for cz in range(z1, z2 + 1):
+                yield ChunkPos(cx, cz)
+
+
+class RegionSet:
+    """Find the named boxes containing a position.
+
+    Every box is added to the buckets of the chunks it overlaps in its dimension,
+    so a lookup only tests the boxes overlapping the chunk of the position. A box
+    overlapping more than ``max_chunks`` chunks, or with infinite bounds such as one
+    covering a whole world, is kept out of the buckets and tested on every lookup of
+    its dimension.
+    """
+
+    def __init__(
+        self,
+        regions: Iterable[tuple[str, BoundingBox, str]] = (),
+        max_chunks: int = 4096,
+    ):
+        """
+        :param regions: The ``(name, box, dimension)`` tuples to add initially. Defaults to an empty tuple.
+        :param max_chunks: The maximum number of chunks a bucketed box can overlap. Defaults to ``4096``.
+
+        :raises ValueError: If two regions have the same name.
+        """
+        self.max_chunks = max_chunks
+        self._regions: dict[str, tuple[BoundingBox, str]] = {}
+        # Entries are (sequence, name, box), the sequence keeps the adding order.
+        self._buckets: dict[str, dict[_Chunk, list[_Entry]]] = {}
+        self._large: dict[str, list[_Entry]] = {}
+        self._sequence = 0
+        for name, box, dimension in regions:
+            self.add(name, box, dimension)
+
+    def __len__(self) -> int:
+        return len(self._regions)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._regions
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._regions)
+
+    def get(self, name: str) -> tuple[BoundingBox, str] | None:
+        """Get a region by name.
+
+        :param name: The name of the region.
+
+        :return: The box and the dimension of the region, or :obj:`None` if not found.
+        """
+        return self._regions.get(name)
+
+    def add(self, name: str, box: BoundingBox, dimension: str) -> None:
+        """Add a region.
+
+        :param name: The name of the region.
+        :param box: The box of the region.
+        :param dimension: The dimension of the region.
+
+        :raises ValueError: If a region with the same name exists.
+        """
+        if name in self._regions:
+            raise ValueError(f"Region {name} already exists!")
+        dimension = as_dimension(dimension)
+        self._regions[name] = (box, dimension)
+        entry = (self._sequence, name, box)
+        self._sequence += 1
+        if not math.isfinite(box.min_x + box.max_x + box.min_z + box.max_z):
+            # Infinite bounds have no chunk.
+            self._large.setdefault(dimension, []).append(entry)
+            return
+        x1, z1, x2, z2 = box._chunk_range()
+        if (x2 - x1 + 1) * (z2 - z1 + 1) > self.max_chunks:
+            self._large.setdefault(dimension, []).append(entry)
+            return
+        buckets = self._buckets.setdefault(dimension, {})
+        for cx in range(x1, x2 + 1):
+            for cz in range(z1, z2 + 1):
+                buckets.setdefault((cx, cz), []).append(entry)
+
+    def remove(self, name: str) -> None:
+        """Remove a region.
+
+        :param name: The name of the region.
+
+        :raises KeyError: If the region does not exist.
+        """
+        box, dimension = self._regions.pop(name)
+        large = self._large.get(dimension, [])
+        for i, (_, other, _) in enumerate(large):
+            if other == name:
+                del large[i]
+                if not large:
+                    del self._large[dimension]
+                return
+        buckets = self._buckets[dimension]
+        x1, z1, x2, z2 = box._chunk_range()
+        for cx in range(x1, x2 + 1):
+            for cz in range(z1, z2 + 1):
+                bucket = buckets[(cx, cz)]
+                bucket[:] = [entry for entry in bucket if entry[1] != name]
+                if not bucket:
+                    del buckets[(cx, cz)]
+        if not buckets:
+            del self._buckets[dimension]
+
+    def clear(self) -> None:
+        """Remove all regions."""
+        self._regions.clear()
+        self._buckets.clear()
+        self._large.clear()
+
+    def regions_at(self, position: MCPosition) -> list[str]:
+        """Find the regions containing a position.
+
+        :param position: The position.
+
+        :return: The names of the regions in the dimension of the position whose boxes
+            contain it, in the order they were added.
+        """
+        dimension = position.dimension
+        x, y, z = position.x, position.y, position.z
+        candidates: list[_Entry] = []
+        buckets = self._buckets.get(dimension)
+        if buckets:
+            candidates = buckets.get(
+                (math.floor(x) >> 4, math.floor(z) >> 4), candidates
+            )
+        large = self._large.get(dimension)
+        if large:
+            candidates = sorted(candidates + large)
+        return [
+            name
+            for _, name, box in candidates
+            if box.min_x <= x <= box.max_x
+            and box.min_y <= y <= box.max_y
+            and box.min_z <= z <= box.max_z
+        ]
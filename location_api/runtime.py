@@ -1,3 +1,17 @@
-from mcdreforged.api.all import ServerInterface
+"""The runtime handle of the MCDR plugin.
 
-psi = ServerInterface.psi()
+``psi`` is the :class:`~mcdreforged.api.all.PluginServerInterface` of the plugin.
+It's set when the plugin loads, and otherwise resolved from MCDR on first access,
+so importing this module doesn't import MCDR.
+"""
+
+
+def __getattr__(name: str):
+    if name == "psi":
+        from mcdreforged.api.all import ServerInterface
+
+        psi = ServerInterface.psi_opt()
+        if psi is not None:
+            globals()["psi"] = psi
+        return psi
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
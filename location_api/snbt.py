@@ -0,0 +1,209 @@
+"""A small parser for SNBT (stringified NBT), the text format of the entity data replied by Minecraft servers, like this:
+
+``{Pos: [-524.5d, 71.0d, -66.5d], Dimension: "minecraft:overworld", Rotation: [90.0f, 0.0f]}``
+
+Compounds are parsed into :class:`dict`, lists and typed arrays into :class:`list`,
+numbers into :class:`int` or :class:`float` (by suffix) and other values into :class:`str`.
+"""
+
+import re
+from typing import Iterable
+
+_WHITESPACE = re.compile(r"\s*")
+_UNQUOTED = re.compile(r"[0-9A-Za-z_\-.+]+")
+_NUMBER = re.compile(
+    r"([+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)([bBsSlLfFdD]?)"
+)
+_QUOTED = {
+    '"': re.compile(r'"((?:[^"\\]|\\.)*)"', re.S),
+    "'": re.compile(r"'((?:[^'\\]|\\.)*)'", re.S),
+}
+_ESCAPE = re.compile(r"\\(u[0-9A-Fa-f]{4}|x[0-9A-Fa-f]{2}|.)", re.S)
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "s": " "}
+_SKIP_TOKEN = re.compile(r"[\"'\[\]{}]")
+_INT_SUFFIXES = ("", "b", "B", "s", "S", "l", "L")
+
+
+class SNBTError(ValueError):
+    """An exception raised when a text could not be parsed as SNBT."""
+
+    pass
+
+
+def _unescape(match: re.Match) -> str:
+    escaped = match.group(1)
+    if len(escaped) > 1:
+        return chr(int(escaped[1:], 16))
+    return _ESCAPES.get(escaped, escaped)
+
+
+class _Parser:
+    def __init__(self, text: str, pos: int = 0):
+        self.text = text
+        self.pos = pos
+
+    def error(self, message: str) -> SNBTError:
+        return SNBTError(f"{message} at position {self.pos}: {self.text!r}")
+
+    def skip_whitespace(self) -> None:
+        self.pos = _WHITESPACE.match(self.text, self.pos).end()  # ty: ignore[possibly-missing-attribute]
+
+    def peek(self) -> str:
+        self.skip_whitespace()
+        if self.pos >= len(self.text):
+            raise self.error("Unexpected end of text")
+        return self.text[self.pos]
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise self.error(f"Expected {char!r}")
+        self.pos += 1
+
+    def parse_value(self) -> object:
+        char = self.peek()
+        if char == "{":
+            return self.parse_compound()
+        if char == "[":
+            return self.parse_list()
+        if char in _QUOTED:
+            return self.parse_quoted()
+        return self.parse_literal()
+
+    def parse_compound(self, keys: frozenset[str] | None = None) -> dict:
+        self.expect("{")
+        result = {}
+        if self.peek() == "}":
+            self.pos += 1
+            return result
+        while True:
+            key = self.parse_key()
+            self.expect(":")
+            if keys is None or key in keys:
+                result[key] = self.parse_value()
+            else:
+                self.skip_value()
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self.expect("}")
+            return result
+
+    def parse_key(self) -> str:
+        if self.peek() in _QUOTED:
+            return self.parse_quoted()
+        match = _UNQUOTED.match(self.text, self.pos)
+        if match is None:
+            raise self.error("Expected a key")
+        self.pos = match.end()
+        return match.group()
+
+    def parse_list(self) -> list:
+        self.expect("[")
+        text = self.text
+        if (
+            text[self.pos : self.pos + 1] in ("B", "I", "L")
+            and text[self.pos + 1 : self.pos + 2] == ";"
+        ):
+            self.pos += 2
+        result = []
+        if self.peek() == "]":
+            self.pos += 1
+            return result
+        while True:
+            result.append(self.parse_value())
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self.expect("]")
+            return result
+
+    def parse_quoted(self) -> str:
+        match = _QUOTED[self.text[self.pos]].match(self.text, self.pos)
+        if match is None:
+            raise self.error("Unterminated string")
+        self.pos = match.end()
+        return _ESCAPE.sub(_unescape, match.group(1))
+
+    def parse_literal(self) -> int | float | str:
+        match = _UNQUOTED.match(self.text, self.pos)
+        if match is None:
+            raise self.error("Unexpected character")
+        self.pos = match.end()
+        token = match.group()
+        number = _NUMBER.fullmatch(token)
+        if number is None:
+            if token == "true":
+                return True
+            if token == "false":
+                return False
+            return token
+        digits, suffix = number.groups()
+        if suffix in _INT_SUFFIXES and not any(c in digits for c in ".eE"):
+            return int(digits)
+        return float(digits)
+
+    def skip_value(self) -> None:
+        char = self.peek()
+        if char in _QUOTED:
+            self.parse_quoted()
+            return
+        if char not in "[{":
+            self.parse_literal()
+            return
+        text = self.text
+        depth = 0
+        pos = self.pos
+        while True:
+            match = _SKIP_TOKEN.search(text, pos)
+            if match is None:
+                raise self.error("Unterminated value")
+            token = match.group()
+            if token in _QUOTED:
+                self.pos = match.start()
+                self.parse_quoted()
+                pos = self.pos
+                continue
+            pos = match.end()
+            depth += 1 if token in "[{" else -1
+            if depth == 0:
+                self.pos = pos
+                return
+
+
+def parse_snbt_prefix(
+    text: str, start: int = 0, keys: Iterable[str] | None = None
+) -> tuple[object, int]:
+    """Parse one SNBT value at the given position of a text, ignoring anything after it.
+
+    :param text: The text containing the SNBT value.
+    :param start: The position where the value starts. Defaults to ``0``.
+    :param keys: If provided and the value is a compound, only these top-level keys are kept,
+        the values of other keys are skipped without being parsed. Defaults to :obj:`None`.
+
+    :returns: The parsed value and the position right after it.
+
+    :raises SNBTError: If the text could not be parsed.
+    """
+    parser = _Parser(text, start)
+    if keys is not None and parser.peek() == "{":
+        value = parser.parse_compound(frozenset(keys))
+    else:
+        value = parser.parse_value()
+    return value, parser.pos
+
+
+def parse_snbt(text: str, keys: Iterable[str] | None = None) -> object:
+    """Parse a text as one SNBT value.
+
+    :param text: The SNBT text to parse.
+    :param keys: If provided and the value is a compound, only these top-level keys are kept.
+        Defaults to :obj:`None`.
+
+    :returns: The parsed value.
+
+    :raises SNBTError: If the text could not be parsed or has trailing content.
+    """
+    value, end = parse_snbt_prefix(text, keys=keys)
+    if text[end:].strip():
+        raise SNBTError(f"Unexpected trailing content at position {end}")
+    return value
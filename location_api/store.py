@@ -0,0 +1,179 @@
+"""This module provides a persistent store of named locations.
+
+Locations are kept in memory with an index by name and an index by dimension,
+and saved to a JSON file holding a list of :meth:`Location.asdict` records.
+"""
+
+import json
+import os
+from typing import Iterable, Iterator, Self
+
+from location_api import Location
+from location_api.dimension import as_dimension
+from location_api.utils import atomic_write
+
+
+class LocationStore:
+    """Store named locations, with their names unique in the store.
+
+    Looking up a location by name and listing the locations in a dimension don't
+    scan the other locations.
+
+    The indexes are updated by the methods of the store, so do not rename or move
+    a stored location in place, :meth:`add` a new one with ``overwrite`` instead.
+    """
+
+    def __init__(
+        self,
+        locations: Iterable[Location] = (),
+        path: str | os.PathLike | None = None,
+    ):
+        """
+        :param locations: The locations to store initially. Defaults to an empty tuple.
+        :param path: The default file for :meth:`save_many`. Defaults to :obj:`None`.
+
+        :raises ValueError: If two locations have the same name.
+        """
+        self.path = path
+        self._by_name: dict[str, Location] = {}
+        self._by_dimension: dict[str, dict[str, Location]] = {}
+        self.load_many(locations)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> Self:
+        """Load a store from a file saved by :meth:`save_many`.
+
+        :param path: The path of the file, also the default file to save to.
+
+        :return: The store, which is empty if the file doesn't exist.
+
+        :raises ValueError: If the file is not valid JSON or two records have the same name.
+        :raises TypeError: If a record is not a valid location.
+        """
+        store = cls(path=path)
+        try:
+            with open(path, encoding="utf-8") as file:
+                records = json.load(file)
+        except FileNotFoundError:
+            return store
+        if not isinstance(records, list):
+            raise ValueError(f"Invalid location file: {path}")
+        store.load_many(Location.from_dicts(records))
+        return store
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._by_name
+
+    def __iter__(self) -> Iterator[Location]:
+        return iter(self._by_name.values())
+
+    @property
+    def names(self) -> list[str]:
+        """The names of the stored locations, in insertion order."""
+        return list(self._by_name)
+
+    @property
+    def dimensions(self) -> frozenset[str]:
+        """The dimensions having stored locations."""
+        return frozenset(self._by_dimension)
+
+    def get(self, name: str) -> Location | None:
+        """Get a location by name.
+
+        :param name: The name of the location.
+
+        :return: The location, or :obj:`None` if not found.
+        """
+        return self._by_name.get(name)
+
+    def in_dimension(self, dimension: str) -> list[Location]:
+        """Get the locations in a dimension.
+
+        :param dimension: The dimension, with or without a namespace.
+
+        :return: The locations, in insertion order.
+        """
+        dimension = as_dimension(dimension)
+        return list(self._by_dimension.get(dimension, {}).values())
+
+    def add(self, location: Location, overwrite: bool = False) -> None:
+        """Store a location.
+
+        :param location: The location.
+        :param overwrite: Whether to replace the location with the same name. Defaults to :obj:`False`.
+
+        :raises ValueError: If a location with the same name exists and ``overwrite`` is :obj:`False`.
+        """
+        name = location.name
+        if name in self._by_name:
+            if not overwrite:
+                raise ValueError(f"Location {name} already exists!")
+            self.remove(name)
+        self._by_name[name] = location
+        self._by_dimension.setdefault(location.dimension, {})[name] = location
+
+    def remove(self, name: str) -> Location:
+        """Remove a location by name.
+
+        :param name: The name of the location.
+
+        :return: The removed location.
+
+        :raises KeyError: If the location is not found.
+        """
+        location = self._by_name.pop(name)
+        in_dimension = self._by_dimension[location.dimension]
+        del in_dimension[name]
+        if not in_dimension:
+            del self._by_dimension[location.dimension]
+        return location
+
+    def clear(self) -> None:
+        """Remove all locations."""
+        self._by_name.clear()
+        self._by_dimension.clear()
+
+    def load_many(self, locations: Iterable[Location | dict]) -> None:
+        """Store many locations at once.
+
+        Nothing is stored if any of the locations is invalid.
+
+        :param locations: The locations, or dicts to deserialize with :meth:`Location.from_dict`.
+
+        :raises ValueError: If a name exists in the store or appears twice.
+        :raises TypeError: If a dict is not a valid location.
+        """
+        by_name: dict[str, Location] = {}
+        for location in locations:
+            if isinstance(location, dict):
+                location = Location.from_dict(location)
+            name = location.name
+            if name in by_name or name in self._by_name:
+                raise ValueError(f"Location {name} already exists!")
+            by_name[name] = location
+        self._by_name.update(by_name)
+        for name, location in by_name.items():
+            self._by_dimension.setdefault(location.dimension, {})[name] = (
+                location
+            )
+
+    def save_many(self, path: str | os.PathLike | None = None) -> None:
+        """Save all locations to a file, replacing it atomically.
+
+        :param path: The path of the file. Defaults to :obj:`None` as :attr:`path`.
+
+        :raises ValueError: If neither ``path`` nor :attr:`path` is set.
+        """
+        path = self.path if path is None else path
+        if path is None:
+            raise ValueError("No path to save the locations to!")
+        # json.dumps uses the C encoder, json.dump would encode in Python.
+        text = json.dumps(
+            [location.asdict() for location in self._by_name.values()],
+            ensure_ascii=False,
+        )
+        with atomic_write(path) as file:
+            file.write(text)
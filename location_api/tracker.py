@@ -0,0 +1,247 @@
+"""This module provides a background service keeping the latest positions of online players.
+
+Positions are polled at a fixed interval, and can be read at any time without querying the server.
+The online players are maintained from the player joined and left events of MCDR.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Iterable
+
+from returns.result import Result, Success
+
+from location_api import MCPosition
+from location_api.history import PositionHistory, TrackedPosition
+from location_api.pos import get_players_pos, snapshot_all_positions
+
+_logger = logging.getLogger(__name__)
+
+
+class PositionTracker:
+    """Poll the positions of online players and keep the latest ones in memory.
+
+    The server is queried once per interval no matter how many readers there are,
+    and reading the table with :meth:`get` never queries the server.
+    """
+
+    def __init__(
+        self,
+        interval: float = 1.0,
+        concurrency: int = 8,
+        single_query: bool = False,
+        snapshot_query: bool = False,
+        history: PositionHistory | None = None,
+    ):
+        """
+        :param interval: Seconds between two polls. Defaults to ``1.0``.
+        :param concurrency: Passed to :data:`~location_api.pos.get_players_pos`. Defaults to ``8``.
+        :param single_query: Passed to :data:`~location_api.pos.get_players_pos`. Defaults to :obj:`False`.
+        :param snapshot_query: Whether to poll all players with :data:`~location_api.pos.snapshot_all_positions`,
+            two commands per poll instead of one or two per player. Defaults to :obj:`False`.
+        :param history: The history to record every sample into. Defaults to :obj:`None` as not recording.
+        """
+        self.interval = interval
+        self.concurrency = concurrency
+        self.single_query = single_query
+        self.snapshot_query = snapshot_query
+        self.history = history
+        """The history every sample is recorded into, if any.
+        """
+        self._lock = threading.Lock()
+        self._players: set[str] = set()
+        self._table: dict[str, TrackedPosition] = {}
+        self._task: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def players(self) -> frozenset[str]:
+        """The players being tracked."""
+        with self._lock:
+            return frozenset(self._players)
+
+    @property
+    def running(self) -> bool:
+        """Whether the tracker is polling."""
+        return self._task is not None and not self._task.done()
+
+    def add_player(self, player: str) -> None:
+        """Start tracking a player.
+
+        :param player: The name of the player.
+        """
+        with self._lock:
+            self._players.add(player)
+
+    def remove_player(self, player: str) -> None:
+        """Stop tracking a player and forget its position.
+
+        :param player: The name of the player.
+        """
+        with self._lock:
+            self._players.discard(player)
+            self._table.pop(player, None)
+        if self.history is not None:
+            self.history.remove(player)
+
+    def set_players(self, players: Iterable[str]) -> None:
+        """Replace the players being tracked.
+
+        :param players: The names of the players.
+        """
+        with self._lock:
+            self._players = players = set(players)
+            for player in self._table.keys() - players:
+                del self._table[player]
+        if self.history is not None:
+            for player in set(self.history) - players:
+                self.history.remove(player)
+
+    def clear(self) -> None:
+        """Stop tracking all players and forget all positions."""
+        self.set_players(())
+
+    def get(
+        self, player: str, max_age: float | None = None
+    ) -> TrackedPosition | None:
+        """Get the latest sampled position of a player.
+
+        :param player: The name of the player.
+        :param max_age: The maximum age in seconds of the sample. Defaults to :obj:`None` as any age.
+
+        :return: The latest sample, or :obj:`None` if not sampled yet or older than ``max_age``.
+        """
+        tracked = self._table.get(player)
+        if tracked is None:
+            return None
+        if max_age is not None and tracked.age > max_age:
+            return None
+        return tracked
+
+    def players_near(
+        self,
+        position: MCPosition,
+        radius: float,
+        max_age: float | None = None,
+        horizontal: bool = False,
+    ) -> dict[str, TrackedPosition]:
+        """Get the players whose latest sampled positions are near a position.
+
+        Only players in the same dimension are included, and distances are compared squared.
+
+        :param position: The center position.
+        :param radius: The maximum distance to the center, inclusive.
+        :param max_age: The maximum age in seconds of the samples. Defaults to :obj:`None` as any age.
+        :param horizontal: Whether to ignore the y coordinate. Defaults to :obj:`False`.
+
+        :return: A dict maps player names to their latest samples, nearest first.
+        """
+        if radius < 0:
+            return {}
+        dimension = position.dimension
+        cx, cy, cz = position.x, position.y, position.z
+        limit = radius * radius
+        now = time.monotonic()
+        near = []
+        for player, tracked in self.snapshot().items():
+            sampled = tracked.position
+            if sampled.dimension != dimension:
+                continue
+            if max_age is not None and now - tracked.timestamp > max_age:
+                continue
+            point = sampled.point
+            dx = point.x - cx
+            dz = point.z - cz
+            distance = dx * dx + dz * dz
+            if not horizontal:
+                dy = point.y - cy
+                distance += dy * dy
+            if distance <= limit:
+                near.append((distance, player, tracked))
+        near.sort(key=lambda item: item[0])
+        return {player: tracked for _, player, tracked in near}
+
+    def snapshot(self) -> dict[str, TrackedPosition]:
+        """Get the latest sampled positions of all players.
+
+        :return: A dict maps player names to their latest samples.
+        """
+        with self._lock:
+            return dict(self._table)
+
+    async def poll(self) -> None:
+        """Sample the positions of all tracked players once.
+
+        Players failed to be sampled keep their previous samples.
+        """
+        players = self.players
+        if not players:
+            return
+        if self.snapshot_query:
+            results = await self._poll_snapshot()
+        else:
+            results = await get_players_pos(
+                players,
+                concurrency=self.concurrency,
+                timeout=self.interval,
+                single_query=self.single_query,
+            )
+        timestamp = time.monotonic()
+        with self._lock:
+            for player, result in results.items():
+                match result:
+                    case Success(position) if player in self._players:
+                        self._table[player] = TrackedPosition(
+                            position, timestamp
+                        )
+                        if self.history is not None:
+                            self.history.record(player, position, timestamp)
+
+    async def _poll_snapshot(self) -> dict[str, Result[MCPosition, Exception]]:
+        try:
+            result = await asyncio.wait_for(
+                snapshot_all_positions(), self.interval
+            )
+        except TimeoutError:
+            return {}
+        return {
+            player: Success(position)
+            for player, position in result.value_or({}).items()
+        }
+
+    async def _run(self) -> None:
+        while True:
+            started = time.monotonic()
+            try:
+                await self.poll()
+            except Exception:
+                # Keep tracking, the next poll may succeed.
+                _logger.exception("Failed to poll player positions")
+            elapsed = time.monotonic() - started
+            await asyncio.sleep(max(0.0, self.interval - elapsed))
+
+    def start(self) -> None:
+        """Start polling in the running event loop.
+
+        :raises RuntimeError: If there is no running event loop.
+        """
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._task = self._loop.create_task(self._run())
+
+    def stop(self) -> None:
+        """Stop polling, can be called from any thread."""
+        task, loop = self._task, self._loop
+        self._task = None
+        if task is None or loop is None:
+            return
+        if loop.is_closed():
+            return
+        loop.call_soon_threadsafe(task.cancel)
+
+
+tracker = PositionTracker()
+"""The tracker started by LocationAPI plugin.
+"""
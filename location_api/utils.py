@@ -1,9 +1,22 @@
+import os
+import stat
+import tempfile
+from contextlib import contextmanager
+from typing import IO, Iterator
+
 from returns.result import Result
 from returns.converters import maybe_to_result
 from returns.maybe import Maybe
 
+# The umask can only be read by setting it, which affects every thread, so it is
+# read once at import rather than at every write.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
 
-def promote_to_result(res: Result[Maybe[str], Exception]) -> Result[str, Exception]:
+def promote_to_result(
+    res: Result[Maybe[str], Exception],
+) -> Result[str, Exception]:
     return res.alt(
         lambda e: Exception(f"Failed to get data from Rcon: {e}")
     ).bind(
@@ -11,3 +24,48 @@ def promote_to_result(res: Result[Maybe[str], Exception]) -> Result[str, Excepti
             lambda _: Exception("No data received!")
         )
     )
+
+
+@contextmanager
+def atomic_write(
+    path: str | os.PathLike, mode: str = "w", encoding: str | None = "utf-8"
+) -> Iterator[IO]:
+    """Write a file atomically.
+
+    The content is written to a temporary file in the same directory, which replaces
+    ``path`` only if the ``with`` block exits without an exception. Readers never see
+    a partially written file. The file keeps the permissions of the file it replaces,
+    or gets the default permissions of a new file.
+
+    :param path: The path of the file.
+    :param mode: The mode to open the temporary file, ``"w"`` or ``"wb"``. Defaults to ``"w"``.
+    :param encoding: The encoding in text mode. Defaults to ``"utf-8"``.
+    """
+    path = os.fspath(path)
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory
+    )
+    try:
+        with open(
+            fd, mode, encoding=None if "b" in mode else encoding
+        ) as file:
+            yield file
+            file.flush()
+            os.fsync(file.fileno())
+        # mkstemp creates the file readable by its owner only.
+        os.chmod(temp_path, _file_mode(path))
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _file_mode(path: str) -> int:
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
@@ -0,0 +1,119 @@
+"""Runtime type checking of the core data types.
+
+The methods of the checked classes are wrapped by `beartype <https://beartype.readthedocs.io>`__,
+and the wrapped or the original methods are installed on the classes according to the
+global :class:`ValidationMode`, so the unchecked mode costs nothing per call.
+"""
+
+from contextlib import contextmanager
+from enum import StrEnum
+from typing import Iterable, Iterator, TypeVar
+
+from beartype import BeartypeConf, beartype
+
+_T = TypeVar("_T", bound=type)
+
+_CONF = BeartypeConf(is_pep484_tower=True)
+
+
+class ValidationMode(StrEnum):
+    """Define how much runtime type checking is done on the core data types."""
+
+    STRICT = "strict"
+    """Check every construction and every method call.
+    """
+    METHODS = "methods"
+    """Check every method call but not constructions, as the data types always did.
+    """
+    BOUNDARY = "boundary"
+    """Only check at API boundaries, such as ``from_dict``.
+    """
+
+
+_mode = ValidationMode.METHODS
+_registry: list[tuple[type, dict, dict, frozenset[str]]] = []
+
+
+def _apply(cls: type, raw: dict, checked: dict, boundary: frozenset[str]):
+    for name, method in checked.items():
+        if (
+            name in boundary
+            or _mode is ValidationMode.STRICT
+            or (_mode is ValidationMode.METHODS and name != "__init__")
+        ):
+            setattr(cls, name, method)
+        else:
+            setattr(cls, name, raw[name])
+
+
+def validated(
+    boundary: Iterable[str] = ("from_dict",),
+    skip: Iterable[str] = (),
+    boundary_only: bool = False,
+):
+    """Make a class checked according to the global :class:`ValidationMode`.
+
+    Integers are accepted where floats are expected.
+
+    :param boundary: Names of the methods always checked. Defaults to ``("from_dict",)``.
+    :param skip: Names of the methods never checked. Defaults to an empty tuple.
+    :param boundary_only: Whether to never check the methods not in ``boundary``, for
+        classes whose properties are read on hot paths. Defaults to :obj:`False`.
+
+    :return: A class decorator.
+    """
+    boundary = frozenset(boundary)
+    skip = frozenset(skip)
+
+    def decorator(cls: _T) -> _T:
+        raw = dict(vars(cls))
+        beartype(cls, conf=_CONF)
+        checked = {}
+        for name, value in raw.items():
+            if vars(cls)[name] is value:
+                continue
+            if name in skip or (boundary_only and name not in boundary):
+                setattr(cls, name, value)
+            else:
+                checked[name] = vars(cls)[name]
+        raw = {name: raw[name] for name in checked}
+        _registry.append((cls, raw, checked, boundary))
+        _apply(cls, raw, checked, boundary)
+        return cls
+
+    return decorator
+
+
+def get_validation_mode() -> ValidationMode:
+    """Get the global validation mode.
+
+    :return: The current mode, :attr:`ValidationMode.METHODS` by default.
+    """
+    return _mode
+
+
+def set_validation_mode(mode: ValidationMode | str) -> None:
+    """Set the global validation mode, taking effect on all checked classes immediately.
+
+    :param mode: The mode or its name.
+
+    :raises ValueError: If the mode name is unknown.
+    """
+    global _mode
+    _mode = ValidationMode(mode)
+    for entry in _registry:
+        _apply(*entry)
+
+
+@contextmanager
+def validation_mode(mode: ValidationMode | str) -> Iterator[None]:
+    """Use a validation mode temporarily in a ``with`` block.
+
+    :param mode: The mode or its name.
+    """
+    previous = _mode
+    set_validation_mode(mode)
+    try:
+        yield
+    finally:
+        set_validation_mode(previous)
@@ -0,0 +1,26 @@
+"""测试中共用的位置与地点构造函数"""
+
+from location_api import Location, MCPosition, Point3D
+
+
+def make_pos(
+    x: float = 0.0,
+    y: float = 64.0,
+    z: float = 0.0,
+    dimension: str = "overworld",
+) -> MCPosition:
+    """构造一个位置，默认位于主世界y=64处"""
+    return MCPosition(Point3D(x, y, z), dimension)
+
+
+def make_location(
+    name: str,
+    x: float = 1.0,
+    y: float = 64.0,
+    z: float = -2.0,
+    dimension: str = "overworld",
+    description: str | None = "描述",
+    other: dict | None = None,
+) -> Location:
+    """构造一个地点，默认带有描述"""
+    return Location(make_pos(x, y, z, dimension), name, description, other)
@@ -0,0 +1,129 @@
+"""location_api.array模块中批量坐标数组的测试"""
+
+import math
+import unittest
+from unittest.mock import patch
+
+import location_api.array as array_module
+from location_api import MCPosition, Point2D, Point3D
+from location_api.array import PointArray, PositionArray
+
+POINTS = [
+    Point3D(0.0, 0.0, 0.0),
+    Point3D(3.0, 4.0, 0.0),
+    Point3D(0.0, 10.0, 4.0),
+]
+POSITIONS = [
+    MCPosition(Point3D(0.0, 0.0, 0.0), "minecraft:overworld"),
+    MCPosition(Point3D(3.0, 4.0, 0.0), "minecraft:the_nether"),
+    MCPosition(Point3D(0.0, 10.0, 4.0), "minecraft:overworld"),
+]
+
+
+class _ArrayTests:
+    """两种存储后端共用的测试用例"""
+
+    def assertSequenceAlmostEqual(self, actual, expected):
+        self.assertEqual(len(actual), len(expected))
+        for a, e in zip(actual, expected):
+            self.assertAlmostEqual(float(a), e, places=6)
+
+    def test_from_points_and_getitem(self):
+        """测试从Point3D创建数组并按下标取回"""
+        points = PointArray.from_points(POINTS)
+        self.assertEqual(len(points), 3)
+        self.assertEqual(points[1], Point3D(3.0, 4.0, 0.0))
+        self.assertEqual(list(points), POINTS)
+
+    def test_mismatched_columns(self):
+        """测试列长度不一致时引发ValueError"""
+        with self.assertRaises(ValueError):
+            PointArray([1.0, 2.0], [1.0], [1.0, 2.0])
+        with self.assertRaises(ValueError):
+            PositionArray([1.0], [1.0], [1.0], [])
+
+    def test_distances_to(self):
+        """测试批量计算到某点的3D和2D距离"""
+        points = PointArray.from_points(POINTS)
+        self.assertSequenceAlmostEqual(
+            points.distances_to(Point3D(0.0, 0.0, 0.0)),
+            [0.0, 5.0, math.hypot(10.0, 4.0)],
+        )
+        self.assertSequenceAlmostEqual(
+            points.distances2d_to(Point2D(0.0, 0.0)), [0.0, 3.0, 4.0]
+        )
+
+    def test_distance_matrix(self):
+        """测试两两距离矩阵"""
+        points = PointArray.from_points(POINTS[:2])
+        matrix = points.distance_matrix()
+        self.assertSequenceAlmostEqual(matrix[0], [0.0, 5.0])
+        self.assertSequenceAlmostEqual(matrix[1], [5.0, 0.0])
+        other = PointArray.from_points(POINTS[2:])
+        matrix2d = points.distance2d_matrix(other)
+        self.assertSequenceAlmostEqual(matrix2d[0], [4.0])
+        self.assertSequenceAlmostEqual(matrix2d[1], [5.0])
+
+    def test_translated(self):
+        """测试整体平移"""
+        moved = PositionArray.from_positions(POSITIONS).translated(dy=1.0)
+        self.assertIsInstance(moved, PositionArray)
+        self.assertEqual(
+            moved[2],
+            MCPosition(Point3D(0.0, 11.0, 4.0), "minecraft:overworld"),
+        )
+
+    def test_dimension_mask_and_split(self):
+        """测试按维度生成掩码和拆分"""
+        positions = PositionArray.from_positions(POSITIONS)
+        self.assertEqual(
+            [bool(v) for v in positions.dimension_mask("minecraft:overworld")],
+            [True, False, True],
+        )
+        groups = positions.split_by_dimension()
+        self.assertEqual(
+            set(groups), {"minecraft:overworld", "minecraft:the_nether"}
+        )
+        self.assertEqual(
+            list(groups["minecraft:overworld"]), [POSITIONS[0], POSITIONS[2]]
+        )
+        self.assertEqual(list(groups["minecraft:the_nether"]), [POSITIONS[1]])
+
+    def test_position_distances_respect_dimension(self):
+        """测试不同维度的位置距离为无穷大"""
+        positions = PositionArray.from_positions(POSITIONS)
+        self.assertSequenceAlmostEqual(
+            positions.distances_to(POSITIONS[0]),
+            [0.0, math.inf, math.hypot(10.0, 4.0)],
+        )
+        self.assertSequenceAlmostEqual(
+            positions.distances2d_to(POSITIONS[1]), [math.inf, 0.0, math.inf]
+        )
+        self.assertSequenceAlmostEqual(
+            positions.distances_to(Point3D(0.0, 0.0, 0.0)),
+            [0.0, 5.0, math.hypot(10.0, 4.0)],
+        )
+        matrix = positions.distance_matrix()
+        self.assertSequenceAlmostEqual(
+            matrix[0], [0.0, math.inf, math.hypot(10.0, 4.0)]
+        )
+
+
+@unittest.skipIf(array_module.np is None, "NumPy is not installed")
+class TestArrayWithNumPy(_ArrayTests, unittest.TestCase):
+    """使用NumPy存储时的测试用例"""
+
+
+class TestArrayWithoutNumPy(_ArrayTests, unittest.TestCase):
+    """不使用NumPy存储时的测试用例"""
+
+    def setUp(self):
+        self.patcher = patch("location_api.array.np", None)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
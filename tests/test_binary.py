@@ -0,0 +1,89 @@
+"""location_api.binary模块中二进制存档格式的测试"""
+
+import os
+import tempfile
+import unittest
+
+from location_api import Location, MCPosition, Point3D
+from location_api.binary import (
+    KIND_LOCATION,
+    KIND_POSITION,
+    BinaryFormatError,
+    LocationArchive,
+    dump_locations,
+    dump_positions,
+)
+
+POSITIONS = [
+    MCPosition(Point3D(1.5, 64.0, -3.25), "minecraft:overworld"),
+    MCPosition(Point3D(-100.0, 32.0, 8.0), "minecraft:the_nether"),
+    MCPosition(Point3D(0.0, 0.0, 0.0), "minecraft:overworld"),
+]
+LOCATIONS = [
+    Location(POSITIONS[0], "主城", "出生点附近", {"owner": "Alice", "x": 1}),
+    Location(POSITIONS[1], "fortress"),
+    Location(POSITIONS[2], "主城", "", {}),
+]
+
+
+class TestBinaryArchive(unittest.TestCase):
+    """二进制存档读写的测试用例"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "archive.locb")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_positions_round_trip(self):
+        """测试位置写入后按下标和迭代读取"""
+        self.assertEqual(dump_positions(self.path, iter(POSITIONS)), 3)
+        self.assertEqual(os.path.getsize(self.path), 32 + 3 * 28 + 47 + 12)
+        with LocationArchive(self.path) as archive:
+            self.assertEqual(archive.kind, KIND_POSITION)
+            self.assertEqual(len(archive), 3)
+            self.assertEqual(archive[1], POSITIONS[1])
+            self.assertEqual(archive[-1], POSITIONS[2])
+            self.assertEqual(list(archive), POSITIONS)
+            self.assertEqual(archive.point(0), POSITIONS[0].point)
+            self.assertEqual(
+                archive.dimensions,
+                ["minecraft:overworld", "minecraft:the_nether"],
+            )
+            with self.assertRaises(IndexError):
+                archive[3]
+
+    def test_locations_round_trip(self):
+        """测试地点写入后读取，重复的字符串只存储一次"""
+        self.assertEqual(dump_locations(self.path, LOCATIONS), 3)
+        with LocationArchive(self.path) as archive:
+            self.assertEqual(archive.kind, KIND_LOCATION)
+            self.assertEqual(list(archive), LOCATIONS)
+            self.assertEqual(archive._string_count, 6)
+
+    def test_empty_archive(self):
+        """测试空存档"""
+        dump_locations(self.path, [])
+        with LocationArchive(self.path) as archive:
+            self.assertEqual(len(archive), 0)
+            self.assertEqual(list(archive), [])
+
+    def test_invalid_files(self):
+        """测试无效文件引发BinaryFormatError"""
+        for content in (b"", b"JSON" + b"\0" * 28, b"LOCB\x01\0\x01\0"):
+            with self.subTest(content=content):
+                with open(self.path, "wb") as file:
+                    file.write(content)
+                with self.assertRaises(BinaryFormatError):
+                    LocationArchive(self.path)
+
+        dump_positions(self.path, POSITIONS)
+        with open(self.path, "r+b") as file:
+            file.truncate(40)
+        with self.assertRaises(BinaryFormatError):
+            LocationArchive(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
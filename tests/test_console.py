@@ -0,0 +1,172 @@
+"""location_api.console模块中控制台传输的测试"""
+
+import asyncio
+import threading
+import unittest
+from unittest.mock import Mock
+
+from returns.result import Failure, Success
+
+from location_api import MCPosition, Point3D
+from location_api.console import ConsoleTransport
+from location_api.mcdr import entry
+from location_api.pos import get_player_pos, set_transport
+
+
+class FakeConsole:
+    """模拟服务端控制台，按执行顺序稍后输出预设的回复"""
+
+    def __init__(self, replies: dict[str, str | None]):
+        self.replies = replies
+        self.transport = ConsoleTransport(self, timeout=0.2)
+        self.commands: list[str] = []
+
+    def execute(self, command: str):
+        self.commands.append(command)
+        reply = self.replies[command]
+        if reply is not None:
+            asyncio.get_running_loop().call_soon(self.transport.feed, reply)
+
+
+class TestConsoleTransport(unittest.IsolatedAsyncioTestCase):
+    """控制台传输的测试用例"""
+
+    def tearDown(self):
+        set_transport()
+
+    async def test_get_player_pos(self):
+        """测试通过控制台获取位置并复用回复解析"""
+        console = FakeConsole(
+            {
+                "data get entity Steve Pos": "Steve has the following entity data: [1.0d, 2.0d, 3.0d]",
+                "data get entity Steve Dimension": 'Steve has the following entity data: "minecraft:the_nether"',
+            }
+        )
+        set_transport(console.transport)
+        result = await get_player_pos("Steve")
+        self.assertEqual(
+            result, Success(MCPosition(Point3D(1.0, 2.0, 3.0), "the_nether"))
+        )
+        self.assertEqual(console.transport.pending, 0)
+
+    async def test_offline_player(self):
+        """测试未找到实体的回复按顺序交给最早的查询"""
+        console = FakeConsole({"data get entity Ghost": "No entity was found"})
+        set_transport(console.transport)
+        result = await get_player_pos("Ghost", single_query=True)
+        self.assertIsInstance(result, Failure)
+        self.assertIsInstance(result.failure(), ValueError)
+
+    async def test_replies_out_of_order(self):
+        """测试回复按玩家名对应到查询，而非到达顺序"""
+        transport = FakeConsole(
+            {
+                "data get entity Alice Pos": None,
+                "data get entity Bob Pos": None,
+            }
+        ).transport
+        alice = asyncio.ensure_future(
+            transport.query("data get entity Alice Pos")
+        )
+        bob = asyncio.ensure_future(transport.query("data get entity Bob Pos"))
+        await asyncio.sleep(0)
+        self.assertEqual(transport.pending, 2)
+        self.assertTrue(transport.feed("Bob has the following entity data: 1"))
+        self.assertTrue(
+            transport.feed("[Admin] Alice has the following entity data: 2")
+        )
+        self.assertFalse(transport.feed("Bob has the following entity data"))
+        self.assertEqual(
+            (await alice).unwrap(),
+            "[Admin] Alice has the following entity data: 2",
+        )
+        self.assertEqual(
+            (await bob).unwrap(), "Bob has the following entity data: 1"
+        )
+
+    async def test_name_is_not_a_substring(self):
+        """测试玩家名只在完全相同或位于队伍前缀之后时匹配"""
+        transport = FakeConsole({"data get entity Alex Pos": None}).transport
+        alex = asyncio.ensure_future(
+            transport.query("data get entity Alex Pos")
+        )
+        await asyncio.sleep(0)
+        self.assertFalse(
+            transport.feed("Alexander has the following entity data: 1")
+        )
+        self.assertFalse(
+            transport.feed("Alex [AFK] has the following entity data: 1")
+        )
+        self.assertTrue(
+            transport.feed("[Red] Alex has the following entity data: 2")
+        )
+        self.assertEqual(
+            (await alex).unwrap(),
+            "[Red] Alex has the following entity data: 2",
+        )
+
+    async def test_chat_does_not_answer(self):
+        """测试玩家聊天中的伪造回复不会结束查询"""
+        transport = FakeConsole({"data get entity Alex Pos": None}).transport
+        self.addCleanup(setattr, entry, "console", entry.console)
+        entry.console = transport
+        alex = asyncio.ensure_future(
+            transport.query("data get entity Alex Pos")
+        )
+        await asyncio.sleep(0)
+        chat = Mock(
+            is_from_server=True,
+            is_player=True,
+            content="Alex has the following entity data: [0d, 0d, 0d]",
+        )
+        entry.on_info(Mock(), chat)
+        self.assertEqual(transport.pending, 1)
+        reply = Mock(
+            is_from_server=True,
+            is_player=False,
+            content="Alex has the following entity data: [1d, 2d, 3d]",
+        )
+        entry.on_info(Mock(), reply)
+        self.assertEqual((await alex).unwrap(), reply.content)
+
+    async def test_timeout(self):
+        """测试超时的查询失败并被移除"""
+        console = FakeConsole({"data get entity Steve": None})
+        result = await console.transport.query("data get entity Steve")
+        self.assertIsInstance(result.failure(), TimeoutError)
+        self.assertEqual(console.transport.pending, 0)
+        self.assertFalse(
+            console.transport.feed("Steve has the following entity data: {}")
+        )
+
+    async def test_feed_from_another_thread(self):
+        """测试从其他线程输入回复"""
+        console = FakeConsole({"data get entity Steve Pos": None})
+        query = asyncio.ensure_future(
+            console.transport.query("data get entity Steve Pos")
+        )
+        await asyncio.sleep(0)
+        thread = threading.Thread(
+            target=console.transport.feed,
+            args=("Steve has the following entity data: [0d, 0d, 0d]",),
+        )
+        thread.start()
+        thread.join()
+        self.assertIsInstance(await query, Success)
+
+    async def test_unsupported_command_and_close(self):
+        """测试不支持的命令与关闭时失败的查询"""
+        console = FakeConsole({"data get entity Steve": None})
+        result = await console.transport.query("list")
+        self.assertIsInstance(result.failure(), ValueError)
+        self.assertEqual(console.commands, [])
+        query = asyncio.ensure_future(
+            console.transport.query("data get entity Steve")
+        )
+        await asyncio.sleep(0)
+        console.transport.close()
+        self.assertIsInstance((await query).failure(), ConnectionError)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+"""location_api.dimension模块中维度注册表的测试"""
+
+import copy
+import pickle
+import unittest
+
+from location_api import FrozenMCPosition, MCPosition, Point3D
+from location_api.dimension import (
+    _MAX_ALIASES,
+    OVERWORLD,
+    THE_NETHER,
+    Dimension,
+    as_dimension,
+)
+
+
+class TestDimension(unittest.TestCase):
+    """Dimension类的测试用例"""
+
+    def test_normalize_and_intern(self):
+        """测试带或不带命名空间的标识符得到同一个对象"""
+        self.assertIs(Dimension("overworld"), OVERWORLD)
+        self.assertIs(Dimension("minecraft:overworld"), OVERWORLD)
+        self.assertIs(Dimension(OVERWORLD), OVERWORLD)
+        self.assertEqual(OVERWORLD, "minecraft:overworld")
+        self.assertEqual(hash(OVERWORLD), hash("minecraft:overworld"))
+        self.assertIsInstance(OVERWORLD, str)
+
+    def test_modded_dimension(self):
+        """测试其他命名空间的维度"""
+        dimension = Dimension("twilightforest:twilight_forest")
+        self.assertEqual(dimension.namespace, "twilightforest")
+        self.assertEqual(dimension.path, "twilight_forest")
+        self.assertIs(Dimension.from_id(dimension.id), dimension)
+        self.assertEqual(
+            repr(dimension), "Dimension('twilightforest:twilight_forest')"
+        )
+
+    def test_invalid_identifiers(self):
+        """测试无效的标识符"""
+        for value in ("", ":overworld", "minecraft:", "a:b:c"):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    Dimension(value)
+        with self.assertRaises(TypeError):
+            Dimension(1)  # ty: ignore[invalid-argument-type]
+        with self.assertRaises(IndexError):
+            Dimension.from_id(-1)
+
+    def test_copy_and_pickle_keep_identity(self):
+        """测试复制和序列化后仍是同一个对象"""
+        self.assertIs(copy.copy(THE_NETHER), THE_NETHER)
+        self.assertIs(copy.deepcopy(THE_NETHER), THE_NETHER)
+        self.assertIs(pickle.loads(pickle.dumps(THE_NETHER)), THE_NETHER)
+
+    def test_as_dimension(self):
+        """测试as_dimension保留非字符串和空字符串"""
+        self.assertIs(as_dimension("the_nether"), THE_NETHER)
+        self.assertIsNone(as_dimension(None))
+        self.assertEqual(as_dimension(""), "")
+        self.assertEqual(as_dimension("a:b:c"), "a:b:c")
+
+    def test_aliases_are_capped(self):
+        """测试注册表不会无限缓存其他写法"""
+        for i in range(1000):
+            Dimension(f"alias_{i}")
+        self.assertLessEqual(
+            len(Dimension._registry),
+            len(Dimension._by_id) + _MAX_ALIASES,
+        )
+        self.assertIs(Dimension("alias_999"), Dimension("minecraft:alias_999"))
+
+    def test_positions_share_dimensions(self):
+        """测试位置创建时规范化维度"""
+        bare = MCPosition(Point3D(1.0, 2.0, 3.0), "overworld")
+        namespaced = MCPosition(Point3D(1.0, 2.0, 3.0), "minecraft:overworld")
+        frozen = FrozenMCPosition(Point3D(1.0, 2.0, 3.0), "overworld")
+        self.assertIs(bare.dimension, OVERWORLD)
+        self.assertIs(namespaced.dimension, OVERWORLD)
+        self.assertIs(frozen.dimension, OVERWORLD)
+        self.assertEqual(bare, namespaced)
+        self.assertEqual(
+            MCPosition(Point3D(1.0, 2.0, 3.0), "a:b:c").dimension, "a:b:c"
+        )
+        self.assertEqual(
+            MCPosition.from_dict(bare.asdict()).dimension,
+            "minecraft:overworld",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
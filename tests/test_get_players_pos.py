@@ -0,0 +1,331 @@
+"""location_api.pos模块中批量获取位置函数的测试"""
+
+import asyncio
+import unittest
+from unittest.mock import Mock, patch
+
+from returns.maybe import Nothing, Some
+from returns.result import Failure, Success
+
+# Mock ServerInterface.psi before importing location_api modules
+mock_psi = Mock()
+
+with patch("mcdreforged.api.all.ServerInterface.psi", return_value=mock_psi):
+    from location_api import MCPosition, Point3D
+    from location_api.pos import (
+        get_player_pos,
+        get_players_pos,
+        invalidate_player_pos,
+        position_cache,
+        snapshot_all_positions,
+    )
+
+
+def fake_server(positions: dict[str, tuple[float, float, float]]):
+    """根据给定的玩家坐标构造一个模拟的rcon_get"""
+
+    async def rcon_get(_psi, command: str):
+        player, *key = command.split()[3:5]
+        await asyncio.sleep(0)
+        if player not in positions:
+            return Success(Some("No entity was found"))
+        if not key:
+            x, y, z = positions[player]
+            return Success(
+                Some(
+                    f"{player} has the following entity data: "
+                    f"{{Air: 300s, Pos: [{x}d, {y}d, {z}d], "
+                    'Dimension: "minecraft:overworld", OnGround: 1b}'
+                )
+            )
+        if key == ["Pos"]:
+            x, y, z = positions[player]
+            return Success(
+                Some(
+                    f"{player} has the following entity data: [{x}d, {y}d, {z}d]"
+                )
+            )
+        return Success(
+            Some(
+                f'{player} has the following entity data: "minecraft:overworld"'
+            )
+        )
+
+    return rcon_get
+
+
+class TestGetPlayersPos(unittest.IsolatedAsyncioTestCase):
+    """批量获取位置函数的测试用例"""
+
+    async def test_get_players_pos_all_online(self):
+        """测试所有玩家均在线的情况"""
+        rcon_get = fake_server(
+            {"Alice": (1.0, 2.0, 3.0), "Bob": (4.0, 5.0, 6.0)}
+        )
+        with patch("location_api.pos.rcon_get", rcon_get):
+            result = await get_players_pos(["Alice", "Bob"])
+
+        self.assertEqual(
+            result["Alice"],
+            Success(MCPosition(Point3D(1.0, 2.0, 3.0), "overworld")),
+        )
+        self.assertEqual(
+            result["Bob"],
+            Success(MCPosition(Point3D(4.0, 5.0, 6.0), "overworld")),
+        )
+
+    async def test_get_players_pos_offline_player_isolated(self):
+        """测试离线玩家只影响自己的结果"""
+        rcon_get = fake_server({"Alice": (1.0, 2.0, 3.0)})
+        with patch("location_api.pos.rcon_get", rcon_get):
+            result = await get_players_pos(["Alice", "Ghost"])
+
+        self.assertIsInstance(result["Alice"], Success)
+        self.assertIsInstance(result["Ghost"], Failure)
+
+    async def test_get_players_pos_rcon_failure(self):
+        """测试rcon无返回数据时返回Failure"""
+
+        async def rcon_get(_psi, _command):
+            return Success(Nothing)
+
+        with patch("location_api.pos.rcon_get", rcon_get):
+            result = await get_players_pos(["Alice"])
+
+        self.assertIsInstance(result["Alice"], Failure)
+
+    async def test_get_players_pos_deduplicates_players(self):
+        """测试重复的玩家名称只查询一次"""
+        commands = []
+        inner = fake_server({"Alice": (1.0, 2.0, 3.0)})
+
+        async def rcon_get(psi, command):
+            commands.append(command)
+            return await inner(psi, command)
+
+        with patch("location_api.pos.rcon_get", rcon_get):
+            result = await get_players_pos(["Alice", "Alice"])
+
+        self.assertEqual(list(result), ["Alice"])
+        self.assertEqual(len(commands), 2)
+
+    async def test_get_players_pos_respects_concurrency(self):
+        """测试同时进行的查询数量不超过并发上限"""
+        running = 0
+        peak = 0
+        inner = fake_server({f"P{i}": (i, 0.0, 0.0) for i in range(10)})
+
+        async def rcon_get(psi, command):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            return await inner(psi, command)
+
+        with patch("location_api.pos.rcon_get", rcon_get):
+            result = await get_players_pos(
+                [f"P{i}" for i in range(10)], concurrency=3
+            )
+
+        self.assertEqual(len(result), 10)
+        self.assertLessEqual(peak, 3)
+
+    async def test_get_players_pos_timeout(self):
+        """测试超时的玩家返回Failure且不影响其他玩家"""
+        inner = fake_server(
+            {"Alice": (1.0, 2.0, 3.0), "Slow": (0.0, 0.0, 0.0)}
+        )
+
+        async def rcon_get(psi, command):
+            if "Slow" in command:
+                await asyncio.sleep(1)
+            return await inner(psi, command)
+
+        with patch("location_api.pos.rcon_get", rcon_get):
+            result = await get_players_pos(["Alice", "Slow"], timeout=0.05)
+
+        self.assertIsInstance(result["Alice"], Success)
+        self.assertIsInstance(result["Slow"], Failure)
+
+    async def test_get_players_pos_single_query(self):
+        """测试单次查询模式下每个玩家只发送一条命令"""
+        commands = []
+        inner = fake_server({"Alice": (1.0, 2.0, 3.0)})
+
+        async def rcon_get(psi, command):
+            commands.append(command)
+            return await inner(psi, command)
+
+        with patch("location_api.pos.rcon_get", rcon_get):
+            result = await get_players_pos(
+                ["Alice", "Ghost"], single_query=True
+            )
+
+        self.assertEqual(
+            result["Alice"],
+            Success(MCPosition(Point3D(1.0, 2.0, 3.0), "overworld")),
+        )
+        self.assertIsInstance(result["Ghost"], Failure)
+        self.assertEqual(
+            commands, ["data get entity Alice", "data get entity Ghost"]
+        )
+
+    async def test_get_players_pos_invalid_concurrency(self):
+        """测试并发上限小于1时引发ValueError"""
+        with self.assertRaises(ValueError):
+            await get_players_pos(["Alice"], concurrency=0)
+
+
+class TestSingleFlight(unittest.IsolatedAsyncioTestCase):
+    """同一玩家并发查询合并的测试用例"""
+
+    def counting_server(self, delay: float = 0.01):
+        """构造一个记录命令并延迟回复的模拟rcon_get"""
+        commands = []
+        inner = fake_server({"Alice": (1.0, 2.0, 3.0), "Bob": (4.0, 5.0, 6.0)})
+
+        async def rcon_get(psi, command):
+            commands.append(command)
+            await asyncio.sleep(delay)
+            return await inner(psi, command)
+
+        return commands, rcon_get
+
+    async def test_concurrent_lookups_share_queries(self):
+        """测试并发查询同一玩家只发送一组命令且结果相同"""
+        commands, rcon_get = self.counting_server()
+        with patch("location_api.pos.rcon_get", rcon_get):
+            results = await asyncio.gather(
+                *(get_player_pos("Alice") for _ in range(5))
+            )
+
+        self.assertEqual(len(commands), 2)
+        self.assertTrue(all(r is results[0] for r in results))
+        self.assertIsInstance(results[0], Success)
+
+    async def test_different_players_not_shared(self):
+        """测试不同玩家的查询不会合并"""
+        commands, rcon_get = self.counting_server()
+        with patch("location_api.pos.rcon_get", rcon_get):
+            alice, bob = await asyncio.gather(
+                get_player_pos("Alice"), get_player_pos("Bob")
+            )
+
+        self.assertEqual(len(commands), 4)
+        self.assertEqual(alice.unwrap().point, Point3D(1.0, 2.0, 3.0))
+        self.assertEqual(bob.unwrap().point, Point3D(4.0, 5.0, 6.0))
+
+    async def test_sequential_lookups_not_shared(self):
+        """测试先后进行的查询各自查询服务器"""
+        commands, rcon_get = self.counting_server(0.0)
+        with patch("location_api.pos.rcon_get", rcon_get):
+            await get_player_pos("Alice")
+            await get_player_pos("Alice")
+
+        self.assertEqual(len(commands), 4)
+
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """测试取消其中一个调用者不影响其他调用者"""
+        commands, rcon_get = self.counting_server(0.05)
+        with patch("location_api.pos.rcon_get", rcon_get):
+            first = asyncio.create_task(get_player_pos("Alice"))
+            second = asyncio.create_task(get_player_pos("Alice"))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            result = await second
+
+        self.assertTrue(first.cancelled())
+        self.assertIsInstance(result, Success)
+        self.assertEqual(len(commands), 2)
+
+    async def test_shared_failure(self):
+        """测试失败结果同样共享"""
+        commands, rcon_get = self.counting_server()
+        with patch("location_api.pos.rcon_get", rcon_get):
+            results = await asyncio.gather(
+                get_player_pos("Ghost"), get_player_pos("Ghost")
+            )
+
+        self.assertIs(results[0], results[1])
+        self.assertIsInstance(results[0], Failure)
+        self.assertEqual(len(commands), 2)
+
+
+def selector_server(pos_reply: str, dim_reply: str):
+    """构造一个回复选择器查询的模拟rcon_get，并记录收到的命令"""
+    commands = []
+
+    async def rcon_get(_psi, command: str):
+        commands.append(command)
+        if command.endswith(" Pos"):
+            return Success(Some(pos_reply))
+        return Success(Some(dim_reply))
+
+    return commands, rcon_get
+
+
+class TestSnapshotAllPositions(unittest.IsolatedAsyncioTestCase):
+    """一次选择器查询获取所有玩家位置的测试用例"""
+
+    def tearDown(self):
+        invalidate_player_pos()
+
+    async def test_snapshot(self):
+        """测试两条命令获取所有玩家位置并写入缓存"""
+        commands, rcon_get = selector_server(
+            "Alice has the following entity data: [1.0d, 2.0d, 3.0d]"
+            "[Admin] Bob has the following entity data: [4.0d, 5.0d, 6.0d]",
+            'Alice has the following entity data: "minecraft:overworld"'
+            '[Admin] Bob has the following entity data: "minecraft:the_end"',
+        )
+        with patch("location_api.pos.rcon_get", rcon_get):
+            result = await snapshot_all_positions()
+
+        self.assertEqual(
+            commands,
+            [
+                "execute as @a run data get entity @s Pos",
+                "execute as @a run data get entity @s Dimension",
+            ],
+        )
+        self.assertEqual(
+            result.unwrap(),
+            {
+                "Alice": MCPosition(Point3D(1.0, 2.0, 3.0), "overworld"),
+                "Bob": MCPosition(Point3D(4.0, 5.0, 6.0), "the_end"),
+            },
+        )
+        self.assertEqual(
+            position_cache.get("Bob", 60),
+            MCPosition(Point3D(4.0, 5.0, 6.0), "the_end"),
+        )
+
+    async def test_snapshot_skips_incomplete_players(self):
+        """测试只出现在一条回复中或无法解析的玩家被跳过"""
+        _, rcon_get = selector_server(
+            "Alice has the following entity data: [1.0d, 2.0d, 3.0d]\n"
+            "Bob has the following entity data: garbage\n"
+            "Carol has the following entity data: [7.0d, 8.0d, 9.0d]",
+            'Alice has the following entity data: "minecraft:overworld"\n'
+            'Bob has the following entity data: "minecraft:overworld"',
+        )
+        with patch("location_api.pos.rcon_get", rcon_get):
+            result = await snapshot_all_positions("@a[tag=tracked]")
+
+        self.assertEqual(list(result.unwrap()), ["Alice"])
+
+    async def test_snapshot_failure(self):
+        """测试查询失败时返回Failure"""
+
+        async def rcon_get(_psi, _command):
+            return Failure(ConnectionError("closed"))
+
+        with patch("location_api.pos.rcon_get", rcon_get):
+            result = await snapshot_all_positions()
+
+        self.assertIsInstance(result, Failure)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+"""location_api.history模块中位置历史的测试"""
+
+import math
+import threading
+import unittest
+
+from location_api.history import PositionHistory
+from tests.factories import make_pos
+
+
+class TestPositionHistory(unittest.TestCase):
+    """PositionHistory类的测试用例"""
+
+    def setUp(self):
+        self.history = PositionHistory(capacity=4)
+        for t in range(6):
+            self.history.record("Steve", make_pos(t * 2.0), float(t))
+
+    def test_ring_keeps_latest_samples(self):
+        """测试缓冲区满后覆盖最旧的样本"""
+        self.assertEqual(self.history.count("Steve"), 4)
+        self.assertEqual(
+            [s.timestamp for s in self.history.last("Steve", 10)],
+            [2.0, 3.0, 4.0, 5.0],
+        )
+        self.assertEqual(
+            [s.position.x for s in self.history.last("Steve", 2)],
+            [8.0, 10.0],
+        )
+        self.assertEqual(self.history.last("Steve", 0), [])
+        latest = self.history.latest("Steve")
+        self.assertEqual(latest.position, make_pos(10.0))  # ty: ignore[possibly-missing-attribute]
+        self.assertEqual(latest.timestamp, 5.0)  # ty: ignore[possibly-missing-attribute]
+        self.assertEqual(self.history.nbytes, 4 * 36)
+
+    def test_between(self):
+        """测试按时间范围查询，两端包含在内"""
+        self.assertEqual(
+            [s.timestamp for s in self.history.between("Steve", 2.5, 4.0)],
+            [3.0, 4.0],
+        )
+        self.assertEqual(
+            [s.timestamp for s in self.history.between("Steve", 0.0, 2.0)],
+            [2.0],
+        )
+        self.assertEqual(self.history.between("Steve", 6.0, 9.0), [])
+        self.assertEqual(self.history.between("Alex", 0.0, 9.0), [])
+
+    def test_position_at(self):
+        """测试插值得到某一时刻的位置"""
+        self.assertEqual(
+            self.history.position_at("Steve", 3.25), make_pos(6.5)
+        )
+        self.assertEqual(self.history.position_at("Steve", 4.0), make_pos(8.0))
+        self.assertEqual(
+            self.history.position_at("Steve", 5.0), make_pos(10.0)
+        )
+        self.assertIsNone(self.history.position_at("Steve", 1.0))
+        self.assertIsNone(self.history.position_at("Steve", 5.5))
+        self.assertIsNone(self.history.position_at("Alex", 3.0))
+
+    def test_dimension_change(self):
+        """测试跨维度时不插值，也不计算速度"""
+        self.history.record(
+            "Steve", make_pos(1.0, dimension="the_nether"), 6.0
+        )
+        self.assertEqual(
+            self.history.position_at("Steve", 5.5), make_pos(10.0)
+        )
+        self.assertEqual(
+            self.history.latest("Steve").position.dimension,  # ty: ignore[possibly-missing-attribute]
+            "minecraft:the_nether",
+        )
+        self.assertIsNone(self.history.velocity("Steve"))
+        self.assertIsNone(self.history.speed("Steve", window=2.0))
+
+    def test_without_dimension(self):
+        """测试没有有效维度的位置也被记录，取回时维度为None"""
+        history = PositionHistory()
+        history.record("Alex", make_pos(0.0, dimension=None), 0.0)  # ty: ignore[invalid-argument-type]
+        history.record("Alex", make_pos(2.0, dimension=None), 1.0)  # ty: ignore[invalid-argument-type]
+        self.assertIsNone(history.latest("Alex").position.dimension)  # ty: ignore[possibly-missing-attribute]
+        self.assertEqual(
+            history.position_at("Alex", 0.5),
+            make_pos(1.0, dimension=None),  # ty: ignore[invalid-argument-type]
+        )
+        self.assertEqual(history.speed("Alex"), 2.0)
+        history.record("Alex", make_pos(4.0, dimension="a:b:c"), 2.0)
+        self.assertIsNone(history.latest("Alex").position.dimension)  # ty: ignore[possibly-missing-attribute]
+        history.record("Alex", make_pos(6.0), 3.0)
+        self.assertIsNone(history.velocity("Alex"))
+
+    def test_velocity_speed_and_heading(self):
+        """测试速度与朝向"""
+        self.assertEqual(self.history.velocity("Steve"), (2.0, 0.0, 0.0))
+        self.assertEqual(
+            self.history.velocity("Steve", window=2.5), (2.0, 0.0, 0.0)
+        )
+        self.assertIsNone(self.history.velocity("Steve", window=10.0))
+        self.assertEqual(self.history.speed("Steve"), 2.0)
+        # Moving towards +x is east, yaw -90 in Minecraft.
+        self.assertEqual(self.history.heading("Steve"), -90.0)
+
+        history = PositionHistory()
+        history.record("Alex", make_pos(0.0, 60.0, 0.0), 0.0)
+        self.assertIsNone(history.velocity("Alex"))
+        history.record("Alex", make_pos(0.0, 64.0, 3.0), 1.0)
+        self.assertEqual(history.speed("Alex"), 5.0)
+        self.assertEqual(history.speed("Alex", horizontal=True), 3.0)
+        self.assertEqual(history.heading("Alex"), 0.0)
+        history.record("Alex", make_pos(0.0, 70.0, 3.0), 2.0)
+        self.assertIsNone(history.heading("Alex"))
+        history.record("Alex", make_pos(-1.0, 70.0, 2.0), 3.0)
+        self.assertTrue(math.isclose(history.heading("Alex"), 135.0))  # ty: ignore[invalid-argument-type]
+
+    def test_out_of_order_sample(self):
+        """测试比最新样本更早的样本引发ValueError"""
+        with self.assertRaises(ValueError):
+            self.history.record("Steve", make_pos(0.0), 4.0)
+        self.history.record("Steve", make_pos(12.0), 5.0)
+        self.assertEqual(self.history.count("Steve"), 4)
+
+    def test_remove_and_clear(self):
+        """测试删除与清空"""
+        self.history.record("Alex", make_pos(0.0))
+        self.assertEqual(set(self.history), {"Steve", "Alex"})
+        self.history.remove("Steve")
+        self.assertNotIn("Steve", self.history)
+        self.assertIsNone(self.history.latest("Steve"))
+        self.history.clear()
+        self.assertEqual(len(self.history), 0)
+
+    def test_invalid_capacity(self):
+        """测试容量小于2时引发ValueError"""
+        with self.assertRaises(ValueError):
+            PositionHistory(capacity=1)
+
+    def test_concurrent_records(self):
+        """测试多线程同时记录不同玩家"""
+        history = PositionHistory(capacity=50)
+
+        def record(player: str):
+            for t in range(200):
+                history.record(player, make_pos(float(t)), float(t))
+
+        threads = [
+            threading.Thread(target=record, args=(f"P{i}",)) for i in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for i in range(4):
+            self.assertEqual(
+                [s.timestamp for s in history.last(f"P{i}", 2)],
+                [198.0, 199.0],
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
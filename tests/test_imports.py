@@ -0,0 +1,71 @@
+"""延迟导入的测试"""
+
+import subprocess
+import sys
+import unittest
+from importlib.util import find_spec
+
+HEAVY_MODULES = ("mcdreforged", "moolings_rcon_api", "asyncio", "numpy")
+
+
+def imported_after(code: str) -> list[str]:
+    """在新的解释器中执行代码，返回之后已导入的重量级模块"""
+    script = (
+        f"import sys\n{code}\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+    return output.split(",") if output else []
+
+
+class TestLazyImports(unittest.TestCase):
+    """数据模型的导入不应加载MCDR与RCON"""
+
+    def test_data_model_import(self):
+        """测试只导入数据模型时不加载MCDR、RCON、asyncio与NumPy"""
+        self.assertEqual(imported_after("import location_api"), [])
+
+    def test_api_import(self):
+        """测试导入location_api.api时不加载MCDR、RCON、asyncio与NumPy"""
+        self.assertEqual(
+            imported_after(
+                "import location_api.api as api\napi.Point3D(1.0, 2.0, 3.0)"
+            ),
+            [],
+        )
+
+    def test_lazy_attribute(self):
+        """测试首次访问时才导入位置查询"""
+        modules = imported_after(
+            "from location_api.api import get_player_pos, tracker\n"
+            "import location_api.pos\n"
+            "assert get_player_pos is location_api.pos.get_player_pos"
+        )
+        self.assertEqual(modules, ["asyncio"])
+
+    @unittest.skipIf(find_spec("numpy") is None, "NumPy is not installed")
+    def test_lazy_point_array(self):
+        """测试首次访问PointArray时才导入NumPy"""
+        modules = imported_after(
+            "import location_api.api as api\n"
+            "api.LocationStore, api.LocationArchive, api.iter_locations\n"
+            "assert 'numpy' not in sys.modules\n"
+            "api.PointArray"
+        )
+        self.assertEqual(modules, ["numpy"])
+
+    def test_unknown_attribute(self):
+        """测试访问不存在的属性引发AttributeError"""
+        from location_api import api
+
+        with self.assertRaises(AttributeError):
+            api.no_such_name  # noqa: B018
+
+
+if __name__ == "__main__":
+    unittest.main()
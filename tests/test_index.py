@@ -0,0 +1,173 @@
+"""location_api.index模块中空间索引的测试"""
+
+import math
+import random
+import unittest
+
+from location_api import MCPosition, Point3D
+from location_api.index import LocationIndex
+from tests.factories import make_location, make_pos
+
+
+def linear_nearest(locations, position, k):
+    candidates = [
+        loc for loc in locations if loc.dimension == position.dimension
+    ]
+    candidates.sort(
+        key=lambda loc: loc.position.point.distance_to(position.point)
+    )
+    return candidates[:k]
+
+
+class TestLocationIndex(unittest.TestCase):
+    """LocationIndex类的测试用例"""
+
+    def setUp(self):
+        self.spawn = make_location("spawn", 0.0, 64.0, 0.0)
+        self.farm = make_location("farm", 40.0, 64.0, 30.0)
+        self.base = make_location("base", -500.0, 70.0, 800.0)
+        self.portal = make_location("portal", 5.0, 64.0, 5.0, "the_nether")
+        self.index = LocationIndex(
+            [self.spawn, self.farm, self.base, self.portal]
+        )
+
+    def test_len_and_contains(self):
+        """测试索引的大小和成员判断"""
+        self.assertEqual(len(self.index), 4)
+        self.assertIn(self.farm, self.index)
+        self.assertNotIn(make_location("farm", 40.0, 64.0, 30.0), self.index)
+        self.assertEqual(
+            self.index.dimensions,
+            frozenset({"minecraft:overworld", "minecraft:the_nether"}),
+        )
+
+    def test_nearest(self):
+        """测试按距离查找最近的位置，且只在同一维度中查找"""
+        position = make_pos(30.0, 64.0, 20.0, "overworld")
+        self.assertEqual(self.index.nearest(position), [self.farm])
+        self.assertEqual(
+            self.index.nearest(position, k=5),
+            [self.farm, self.spawn, self.base],
+        )
+        nether = make_pos(-900.0, 64.0, 0.0, "the_nether")
+        self.assertEqual(self.index.nearest(nether), [self.portal])
+        end = make_pos(0.0, 64.0, 0.0, "the_end")
+        self.assertEqual(self.index.nearest(end), [])
+
+    def test_within_radius(self):
+        """测试查找半径内的位置"""
+        position = make_pos(0.0, 64.0, 0.0, "overworld")
+        self.assertEqual(
+            self.index.within_radius(position, 10.0), [self.spawn]
+        )
+        self.assertEqual(
+            self.index.within_radius(position, 50.0), [self.spawn, self.farm]
+        )
+
+    def test_within_huge_radius(self):
+        """测试极大半径返回维度内所有位置，负半径返回空列表"""
+        position = make_pos(0.0, 64.0, 0.0, "overworld")
+        everything = self.index.within_radius(position, 1e308)
+        self.assertEqual(everything, [self.spawn, self.farm, self.base])
+        self.assertEqual(
+            self.index.within_radius(position, 1.7e308), everything
+        )
+        self.assertEqual(
+            self.index.within_radius(position, math.inf), everything
+        )
+        for radius in (math.nan, -1.0):
+            self.assertEqual(self.index.within_radius(position, radius), [])
+
+    def test_within_box(self):
+        """测试查找长方体内的位置"""
+        found = self.index.within_box(
+            "overworld",
+            Point3D(50.0, 100.0, 50.0),
+            Point3D(-10.0, 0.0, -10.0),
+        )
+        self.assertEqual({loc.name for loc in found}, {"spawn", "farm"})
+        self.assertEqual(
+            self.index.within_box(
+                "overworld",
+                Point3D(-10.0, 65.0, -10.0),
+                Point3D(50.0, 100.0, 50.0),
+            ),
+            [],
+        )
+
+    def test_within_infinite_box(self):
+        """测试无限大的长方体不会溢出"""
+        found = self.index.within_box(
+            "overworld",
+            Point3D(-math.inf, -math.inf, -math.inf),
+            Point3D(math.inf, math.inf, math.inf),
+        )
+        self.assertEqual(
+            {loc.name for loc in found}, {"spawn", "farm", "base"}
+        )
+        found = self.index.within_box(
+            "overworld",
+            Point3D(-math.inf, 0.0, -10.0),
+            Point3D(50.0, 100.0, 50.0),
+        )
+        self.assertEqual({loc.name for loc in found}, {"spawn", "farm"})
+
+    def test_insert_and_remove(self):
+        """测试增量插入和删除"""
+        position = make_pos(30.0, 64.0, 20.0, "overworld")
+        self.index.remove(self.farm)
+        self.assertEqual(self.index.nearest(position), [self.spawn])
+        self.index.insert(self.farm)
+        self.index.insert(self.farm)
+        self.assertEqual(len(self.index), 4)
+        self.assertEqual(self.index.nearest(position), [self.farm])
+
+        self.index.remove(self.portal)
+        self.assertEqual(
+            self.index.dimensions, frozenset({"minecraft:overworld"})
+        )
+        with self.assertRaises(KeyError):
+            self.index.remove(self.portal)
+
+    def test_invalid_cell_size(self):
+        """测试非正数的网格大小引发ValueError"""
+        with self.assertRaises(ValueError):
+            LocationIndex(cell_size=0)
+
+    def test_matches_linear_scan(self):
+        """测试查询结果与线性扫描一致"""
+        rng = random.Random(0)
+        locations = [
+            make_location(
+                str(i),
+                rng.uniform(-3000, 3000),
+                rng.uniform(-64, 320),
+                rng.uniform(-3000, 3000),
+                rng.choice(["overworld", "the_nether"]),
+            )
+            for i in range(2000)
+        ]
+        index = LocationIndex(locations)
+        for _ in range(50):
+            position = MCPosition(
+                Point3D(
+                    rng.uniform(-4000, 4000),
+                    rng.uniform(-64, 320),
+                    rng.uniform(-4000, 4000),
+                ),
+                rng.choice(["overworld", "the_nether"]),
+            )
+            self.assertEqual(
+                index.nearest(position, k=5),
+                linear_nearest(locations, position, 5),
+            )
+            expected = [
+                loc
+                for loc in linear_nearest(locations, position, len(locations))
+                if loc.position.point.distance_to(position.point) <= 300.0
+            ]
+            self.assertEqual(index.within_radius(position, 300.0), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""location_api.jsonl模块中流式导入导出的测试"""
+
+import os
+import tempfile
+import unittest
+
+from returns.pipeline import is_successful
+from returns.result import Success
+
+from location_api.jsonl import RecordError, iter_locations, write_locations
+from tests.factories import make_location
+
+
+class TestJSONL(unittest.TestCase):
+    """iter_locations和write_locations函数的测试用例"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "locations.jsonl")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        """测试写入后逐条读取"""
+        locations = [make_location("spawn"), make_location("farm")]
+        self.assertEqual(write_locations(self.path, iter(locations)), 2)
+        self.assertEqual(
+            list(iter_locations(self.path)),
+            [Success(location) for location in locations],
+        )
+        with open(self.path, encoding="utf-8") as file:
+            self.assertIn("描述", file.readline())
+
+    def test_errors_per_record(self):
+        """测试错误的行单独报告而不中断读取"""
+        write_locations(self.path, [make_location("spawn")])
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write("\n")
+            file.write("{not json\n")
+            file.write("[1, 2]\n")
+            file.write('{"x": "far", "y": 1, "z": 2, "name": "bad"}\n')
+            file.write('{"name": "nowhere"}\n')
+        results = list(iter_locations(self.path))
+        self.assertEqual(len(results), 5)
+        self.assertEqual(results[0], Success(make_location("spawn")))
+        for result, lineno in zip(results[1:], [3, 4, 5, 6]):
+            self.assertFalse(is_successful(result))
+            error = result.failure()
+            self.assertIsInstance(error, RecordError)
+            self.assertEqual(error.lineno, lineno)
+
+    def test_filter_in_place(self):
+        """测试在同一文件上流式过滤"""
+        write_locations(
+            self.path,
+            [
+                make_location("spawn"),
+                make_location("fortress", dimension="the_nether"),
+            ],
+        )
+        count = write_locations(
+            self.path,
+            (
+                location
+                for result in iter_locations(self.path)
+                if is_successful(result)
+                and (location := result.unwrap()).dimension
+                == "minecraft:the_nether"
+            ),
+        )
+        self.assertEqual(count, 1)
+        self.assertEqual(
+            list(iter_locations(self.path)),
+            [Success(make_location("fortress", dimension="the_nether"))],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
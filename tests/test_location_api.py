@@ -1,6 +1,16 @@
 import unittest
+from dataclasses import FrozenInstanceError
 
-from location_api import Location, MCPosition, Point2D, Point3D
+from location_api import (
+    FrozenLocation,
+    FrozenMCPosition,
+    FrozenPoint2D,
+    FrozenPoint3D,
+    Location,
+    MCPosition,
+    Point2D,
+    Point3D,
+)
 
 
 class TestLocationAPI(unittest.TestCase):
@@ -138,6 +148,20 @@ class TestLocationAPI(unittest.TestCase):
         self.assertEqual(MCPosition.from_dict(data_folded), position)
         self.assertEqual(MCPosition.from_dict(data_primitived), position)
 
+    def test_location_from_dict_with_other(self):
+        """测试Location.from_dict接受扁平的other字段并拒绝嵌套结构"""
+        location = Location(
+            MCPosition(Point3D(1.0, 2.0, 3.0), "minecraft:overworld"),
+            "home",
+            "my home",
+            {"owner": "Alice", "public": True},
+        )
+        self.assertEqual(Location.from_dict(location.asdict()), location)
+        data = location.asdict()
+        data["other"] = {"owner": {"name": "Alice"}}
+        with self.assertRaises(TypeError):
+            Location.from_dict(data)
+
     def test_point3d_distance_to(self):
         """测试Point3D类的3D距离计算"""
         point1 = Point3D(0.0, 0.0, 0.0)
@@ -230,6 +254,237 @@ class TestLocationAPI(unittest.TestCase):
         self.assertEqual(point2d.x, 1.0)
         self.assertEqual(point2d.z, 3.0)
 
+    def test_point_distance_squared(self):
+        """测试平方距离计算"""
+        a = Point3D(0.0, 10.0, 0.0)
+        b = Point3D(3.0, 22.0, 4.0)
+        self.assertEqual(a.distance_squared_to(b), 169.0)
+        self.assertEqual(a.distance2d_squared_to(b), 25.0)
+        self.assertEqual(a.distance2d_squared_to(Point2D(3.0, 4.0)), 25.0)
+        self.assertEqual(
+            Point2D(0.0, 0.0).distance_squared_to(Point2D(3.0, 4.0)), 25.0
+        )
+        self.assertEqual(Point2D(0.0, 0.0).distance2d_squared_to(b), 25.0)
+
+    def test_point_within(self):
+        """测试半径判断，边界值包含在内"""
+        a = Point3D(0.0, 10.0, 0.0)
+        b = Point3D(3.0, 22.0, 4.0)
+        self.assertTrue(a.within(b, 13))
+        self.assertFalse(a.within(b, 12.9))
+        self.assertTrue(a.within2d(b, 5.0))
+        self.assertFalse(a.within2d(b, 4.9))
+        self.assertTrue(Point2D(0.0, 0.0).within(Point2D(3.0, 4.0), 5.0))
+        self.assertTrue(Point2D(0.0, 0.0).within2d(b, 5.0))
+        self.assertFalse(a.within(a, -1.0))
+
+    def test_mcposition_distance_respects_dimension(self):
+        """测试MCPosition的距离与半径判断考虑维度"""
+        a = MCPosition(Point3D(0.0, 10.0, 0.0), "overworld")
+        b = MCPosition(Point3D(3.0, 22.0, 4.0), "minecraft:overworld")
+        nether = MCPosition(Point3D(0.0, 10.0, 0.0), "the_nether")
+        self.assertEqual(a.distance_squared_to(b), 169.0)
+        self.assertEqual(a.distance2d_squared_to(b), 25.0)
+        self.assertTrue(a.within(b, 13.0))
+        self.assertTrue(a.within2d(b, 5.0))
+        self.assertEqual(a.distance_squared_to(nether), float("inf"))
+        self.assertEqual(a.distance2d_squared_to(nether), float("inf"))
+        self.assertFalse(a.within(nether, 1000.0))
+        self.assertFalse(a.within2d(nether, 1000.0))
+
+    def test_slotted_instances_have_no_dict(self):
+        """测试核心数据类使用__slots__，没有实例字典"""
+        position = MCPosition(Point3D(1.0, 2.0, 3.0), "minecraft:overworld")
+        for obj in [
+            Point2D(1.0, 2.0),
+            position.point,
+            position,
+            Location(position, "Test Location"),
+        ]:
+            with self.subTest(obj=obj):
+                self.assertFalse(hasattr(obj, "__dict__"))
+                with self.assertRaises(AttributeError):
+                    obj.unknown_field = 1  # ty: ignore[unresolved-attribute]
+
+    def test_frozen_points(self):
+        """测试不可变的Point2D和Point3D"""
+        point3d = FrozenPoint3D(1.0, 2.0, 3.0)
+        point2d = FrozenPoint2D(1.0, 3.0)
+
+        self.assertIsInstance(point3d, Point3D)
+        self.assertEqual(str(point3d), "[1.0, 2.0, 3.0]")
+        self.assertAlmostEqual(
+            point3d.distance_to(Point3D(4.0, 6.0, 3.0)), 5.0, places=3
+        )
+        self.assertEqual(point3d.to_point2d(), Point2D(1.0, 3.0))
+        self.assertAlmostEqual(point2d.distance2d_to(point3d), 0.0, places=3)
+        self.assertEqual(len({point3d, FrozenPoint3D(1.0, 2.0, 3.0)}), 1)
+        self.assertEqual(hash(point2d), hash(FrozenPoint2D(1.0, 3.0)))
+
+        with self.assertRaises(FrozenInstanceError):
+            point3d.x = 5.0
+        with self.assertRaises(FrozenInstanceError):
+            del point2d.z
+
+    def test_frozen_mcposition_and_location(self):
+        """测试不可变的MCPosition和Location"""
+        data = {
+            "x": 1.0,
+            "y": 2.0,
+            "z": 3.0,
+            "dimension": "minecraft:overworld",
+            "name": "Test Location",
+        }
+        position = FrozenMCPosition.from_dict(data)
+        location = FrozenLocation.from_dict(data)
+
+        self.assertIsInstance(position.point, FrozenPoint3D)
+        self.assertIsInstance(location.position, FrozenMCPosition)
+        self.assertEqual(location.position, position)
+        self.assertEqual(location.x, 1.0)
+        self.assertEqual(
+            position.asdict(), MCPosition.from_dict(data).asdict()
+        )
+        self.assertEqual(location.asdict(), Location.from_dict(data).asdict())
+        self.assertEqual(
+            hash(location), hash(FrozenLocation.from_dict(dict(data)))
+        )
+
+        with self.assertRaises(FrozenInstanceError):
+            position.dimension = "minecraft:the_nether"
+        with self.assertRaises(FrozenInstanceError):
+            location.position.point.y = 64.0
+        with self.assertRaises(FrozenInstanceError):
+            location.name = "Other"
+
+    def test_mcposition_from_dicts(self):
+        """测试MCPosition.from_dicts与逐条from_dict结果一致"""
+        flat = [
+            {"x": 1.5, "y": 64, "z": -3.0, "dimension": "minecraft:overworld"},
+            {"x": 2, "y": 65, "z": 4, "dimension": "minecraft:the_nether"},
+            {"x": "3.5", "y": 64, "z": 0, "dimension": "minecraft:the_end"},
+            {"x": 1.0, "y": 2.0, "z": 3.0, "dim": "minecraft:overworld"},
+            {"x": 1.0, "y": 2.0, "z": 3.0, "dimension": 7},
+        ]
+        nested = [
+            {"point": {"x": 1.0, "y": 2.0, "z": 3.0}, "dimension": "nether"},
+            {"point": {"x": 4, "y": 5, "z": 6}, "dimension": "overworld"},
+            {"x": 9.0, "y": 9.0, "z": 9.0, "dimension": "the_end"},
+        ]
+        for records in (flat, nested, []):
+            with self.subTest(records=records):
+                self.assertEqual(
+                    MCPosition.from_dicts(iter(records)),
+                    [MCPosition.from_dict(data) for data in records],
+                )
+        positions = FrozenMCPosition.from_dicts(nested)
+        self.assertIsInstance(positions[0].point, FrozenPoint3D)
+
+    def test_mcposition_from_dicts_invalid(self):
+        """测试MCPosition.from_dicts对无效数据抛出与from_dict相同的异常"""
+        with self.assertRaises(TypeError):
+            MCPosition.from_dicts(
+                [
+                    {"x": 1.0, "y": 2.0, "z": 3.0, "dimension": "overworld"},
+                    {"x": 1.0, "y": 2.0, "z": 3.0},
+                ]
+            )
+        with self.assertRaises(TypeError):
+            MCPosition.from_dicts(
+                [{"x": None, "y": 2.0, "z": 3.0, "dim": "a"}]
+            )
+
+    def test_location_from_dicts(self):
+        """测试Location.from_dicts与逐条from_dict结果一致"""
+        flat = [
+            {
+                "x": 1.0,
+                "y": 64.0,
+                "z": 2.0,
+                "dimension": "minecraft:overworld",
+                "name": "home",
+                "description": "my home",
+                "other": {"owner": "Alice"},
+            },
+            {
+                "x": 3,
+                "y": 70,
+                "z": -2,
+                "dimension": None,
+                "name": "farm",
+                "description": None,
+                "other": None,
+            },
+            {
+                "x": 3,
+                "y": 70,
+                "z": -2,
+                "dimension": "minecraft:overworld",
+                "name": 42,
+                "description": "",
+                "other": None,
+            },
+            {
+                "x": 0.0,
+                "y": 0.0,
+                "z": 0.0,
+                "name": "origin",
+                "desc": "short",
+            },
+        ]
+        nested = [
+            {
+                "position": {
+                    "x": 1.0,
+                    "y": 2.0,
+                    "z": 3.0,
+                    "dimension": "minecraft:the_end",
+                },
+                "name": "end",
+            },
+            {
+                "position": {
+                    "point": {"x": 1.0, "y": 2.0, "z": 3.0},
+                    "dimension": "minecraft:the_end",
+                },
+                "name": "end2",
+            },
+            {
+                "position": {
+                    "x": 4.0,
+                    "y": 5.0,
+                    "z": 6.0,
+                    "dimension": "minecraft:the_nether",
+                },
+                "name": "fortress",
+            },
+        ]
+        for records in (flat, nested):
+            with self.subTest(records=records):
+                self.assertEqual(
+                    Location.from_dicts(records),
+                    [Location.from_dict(data) for data in records],
+                )
+        locations = FrozenLocation.from_dicts(nested)
+        self.assertIsInstance(locations[0].position, FrozenMCPosition)
+
+    def test_location_from_dicts_invalid(self):
+        """测试Location.from_dicts对无效数据抛出与from_dict相同的异常"""
+        record = {
+            "x": 1.0,
+            "y": 2.0,
+            "z": 3.0,
+            "dimension": "minecraft:overworld",
+            "name": "home",
+            "other": None,
+        }
+        with self.assertRaises(TypeError):
+            Location.from_dicts(
+                [record, dict(record, other={"nested": {"a": 1}})]
+            )
+        with self.assertRaises(TypeError):
+            Location.from_dicts([record, dict(record, name=None)])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,210 @@
+"""location_api.metrics模块的测试"""
+
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+from returns.maybe import Some
+from returns.result import Failure, Success
+
+with patch("mcdreforged.api.all.ServerInterface.psi", return_value=Mock()):
+    from location_api.metrics import LatencyHistogram, Metrics, metrics
+    from location_api.pos import get_player_pos, invalidate_player_pos
+
+
+def fake_rcon_get(replies: dict[str, object]):
+    """根据命令返回预设回复的模拟rcon_get，回复为异常时返回Failure"""
+
+    async def rcon_get(_psi, command: str):
+        reply = replies[command]
+        if isinstance(reply, Exception):
+            return Failure(reply)
+        return Success(Some(reply))
+
+    return rcon_get
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    """延迟直方图的测试用例"""
+
+    def test_empty(self):
+        """测试空直方图"""
+        histogram = LatencyHistogram()
+        self.assertEqual(histogram.count, 0)
+        self.assertEqual(histogram.mean, 0.0)
+        self.assertEqual(histogram.percentile(0.99), 0.0)
+
+    def test_percentiles_within_bucket_width(self):
+        """测试分位数误差不超过一个桶宽"""
+        histogram = LatencyHistogram()
+        for i in range(1, 1001):
+            histogram.observe(i / 1000)
+        self.assertEqual(histogram.count, 1000)
+        self.assertAlmostEqual(histogram.mean, 0.5005)
+        self.assertEqual(histogram.max, 1.0)
+        for fraction in (0.5, 0.95, 0.99):
+            value = histogram.percentile(fraction)
+            self.assertGreaterEqual(value, fraction * 0.99)
+            self.assertLessEqual(value, fraction * 1.2)
+
+    def test_percentile_not_above_max(self):
+        """测试分位数不超过最大值"""
+        histogram = LatencyHistogram()
+        histogram.observe(0.003)
+        self.assertEqual(histogram.percentile(0.5), 0.003)
+
+    def test_out_of_range(self):
+        """测试超出桶范围的时长"""
+        histogram = LatencyHistogram()
+        histogram.observe(0.0)
+        histogram.observe(1000.0)
+        self.assertLessEqual(histogram.percentile(0.01), 1e-6)
+        self.assertEqual(histogram.percentile(1.0), 1000.0)
+
+
+class TestMetrics(unittest.TestCase):
+    """指标注册表的测试用例"""
+
+    def test_counters(self):
+        """测试计数器"""
+        registry = Metrics()
+        self.assertEqual(registry.count("a"), 0)
+        registry.incr("a")
+        registry.incr("a", 2)
+        self.assertEqual(registry.count("a"), 3)
+
+    def test_timer_records_on_exception(self):
+        """测试计时器在抛出异常时也记录"""
+        registry = Metrics()
+        with registry.timer("t"):
+            pass
+        with self.assertRaises(RuntimeError), registry.timer("t"):
+            raise RuntimeError
+        self.assertEqual(registry.histogram("t").count, 2)
+
+    def test_snapshot_and_reset(self):
+        """测试快照与重置"""
+        registry = Metrics()
+        registry.incr("a")
+        registry.observe("t", 0.002)
+        snapshot = registry.snapshot()
+        self.assertEqual(snapshot["counters"], {"a": 1})
+        self.assertEqual(snapshot["histograms"]["t"]["count"], 1)
+        self.assertEqual(snapshot["histograms"]["t"]["max"], 0.002)
+        self.assertEqual(len(registry.format()), 2)
+        registry.reset()
+        self.assertEqual(
+            registry.snapshot(), {"counters": {}, "histograms": {}}
+        )
+
+    def test_snapshot_while_recording(self):
+        """测试其他线程创建计数器和直方图时可以同时读取快照"""
+        registry = Metrics()
+        done = threading.Event()
+
+        def record():
+            for i in range(20000):
+                registry.incr(f"c{i}")
+                registry.observe(f"h{i}", 0.001)
+            done.set()
+
+        thread = threading.Thread(target=record)
+        thread.start()
+        while not done.is_set():
+            registry.snapshot()
+            registry.format()
+        thread.join()
+        self.assertEqual(len(registry.snapshot()["counters"]), 20000)
+
+
+class TestPositionMetrics(unittest.IsolatedAsyncioTestCase):
+    """位置查询埋点的测试用例"""
+
+    def setUp(self):
+        metrics.reset()
+        invalidate_player_pos()
+
+    def tearDown(self):
+        metrics.reset()
+        invalidate_player_pos()
+
+    async def test_successful_lookup(self):
+        """测试成功查询记录查询、rcon与解析耗时"""
+        rcon_get = fake_rcon_get(
+            {
+                "data get entity Steve Pos": "Steve has the following entity data: [1.0d, 2.0d, 3.0d]",
+                "data get entity Steve Dimension": 'Steve has the following entity data: "minecraft:overworld"',
+            }
+        )
+        with patch("location_api.pos.rcon_get", rcon_get):
+            result = await get_player_pos("Steve")
+        self.assertIsInstance(result, Success)
+        self.assertEqual(metrics.histogram("get_player_pos").count, 1)
+        self.assertEqual(metrics.histogram("rcon").count, 2)
+        self.assertEqual(metrics.histogram("parse_pos").count, 1)
+        self.assertEqual(metrics.histogram("parse_dim").count, 1)
+        self.assertEqual(metrics.snapshot()["counters"], {})
+
+    async def test_offline_player(self):
+        """测试离线玩家计入offline"""
+        rcon_get = fake_rcon_get(
+            {
+                "data get entity Steve Pos": "No entity was found",
+                "data get entity Steve Dimension": "No entity was found",
+                "data get entity Steve": "No entity was found",
+            }
+        )
+        with patch("location_api.pos.rcon_get", rcon_get):
+            await get_player_pos("Steve")
+            await get_player_pos("Steve", single_query=True)
+        self.assertEqual(metrics.count("offline"), 2)
+        self.assertEqual(metrics.count("parse_errors"), 0)
+
+    async def test_parse_error(self):
+        """测试无法解析的回复计入parse_errors"""
+        rcon_get = fake_rcon_get(
+            {
+                "data get entity Steve Pos": "garbage",
+                "data get entity Steve Dimension": "garbage",
+                "data get entity Steve": "Steve has the following entity data: {Air: 300s}",
+            }
+        )
+        with patch("location_api.pos.rcon_get", rcon_get):
+            await get_player_pos("Steve")
+            await get_player_pos("Steve", single_query=True)
+        self.assertEqual(metrics.count("parse_errors"), 2)
+        self.assertEqual(metrics.count("offline"), 0)
+
+    async def test_rcon_error(self):
+        """测试rcon失败计入rcon_errors"""
+        rcon_get = fake_rcon_get(
+            {
+                "data get entity Steve Pos": ConnectionError("closed"),
+                "data get entity Steve Dimension": ConnectionError("closed"),
+            }
+        )
+        with patch("location_api.pos.rcon_get", rcon_get):
+            result = await get_player_pos("Steve")
+        self.assertIsInstance(result, Failure)
+        self.assertEqual(metrics.count("rcon_errors"), 2)
+        self.assertEqual(metrics.histogram("parse_pos").count, 0)
+
+    async def test_cache_hits_and_misses(self):
+        """测试缓存命中与未命中计数"""
+        rcon_get = fake_rcon_get(
+            {
+                "data get entity Steve": "Steve has the following entity data: "
+                '{Pos: [1.0d, 2.0d, 3.0d], Dimension: "minecraft:overworld"}',
+            }
+        )
+        with patch("location_api.pos.rcon_get", rcon_get):
+            await get_player_pos("Steve", True, max_age=60)
+            await get_player_pos("Steve", True, max_age=60)
+        self.assertEqual(metrics.count("cache_misses"), 1)
+        self.assertEqual(metrics.count("cache_hits"), 1)
+        self.assertEqual(metrics.histogram("get_player_pos").count, 2)
+        self.assertEqual(metrics.histogram("rcon").count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,9 +8,14 @@ mock_psi = Mock()
 
 # Create a mock for ServerInterface class
 with patch("mcdreforged.api.all.ServerInterface.psi", return_value=mock_psi):
+    from location_api import MCPosition, Point3D
     from location_api.pos import (
         get_dimension_from_server_reply,
+        get_entity_data_from_server_reply,
         get_point3d_from_server_reply,
+        get_position_from_entity_data,
+        safe_parse_entity_pos,
+        split_entity_data_reply,
     )
 
 
@@ -135,6 +140,118 @@ class TestPositionParsing(unittest.TestCase):
 
         self.assertEqual(result, "custom_dimension")
 
+    def test_get_dimension_from_server_reply_unusual_formats(self):
+        """测试维度提取，非标准格式时与正则表达式的结果一致"""
+        cases = {
+            "X has the following entity data: minecraft:overworld\n": "overworld",
+            'X: "minecraft:the_end" extra': "the_end",
+            'X: "minecraft:" then minecraft:the_nether': "the_nether",
+            "X: minecraft:-bad": None,
+        }
+        for log, expected in cases.items():
+            with self.subTest(log=log):
+                self.assertEqual(
+                    get_dimension_from_server_reply(log), expected
+                )
+
+    def test_get_entity_data_from_server_reply_normal_case(self):
+        """测试从完整实体数据中提取位置相关的键"""
+        log = (
+            "CleMooling has the following entity data: {Air: 300s, "
+            'Pos: [-524.5d, 71.0d, -66.5d], Dimension: "minecraft:overworld", '
+            "Rotation: [90.0f, 0.0f], Motion: [0.0d, 0.0d, 0.0d], Health: 20.0f}"
+        )
+        result = get_entity_data_from_server_reply(log, "CleMooling")
+
+        self.assertEqual(
+            result,
+            {
+                "Pos": [-524.5, 71.0, -66.5],
+                "Dimension": "minecraft:overworld",
+                "Rotation": [90.0, 0.0],
+                "Motion": [0.0, 0.0, 0.0],
+            },
+        )
+
+    def test_get_entity_data_from_server_reply_no_entity_found(self):
+        """测试实体数据提取，'No entity was found'返回None的情况"""
+        self.assertIsNone(
+            get_entity_data_from_server_reply("No entity was found")
+        )
+
+    def test_get_entity_data_from_server_reply_player_not_found(self):
+        """测试实体数据提取，当玩家名称未找到时"""
+        log = "DifferentPlayer has the following entity data: {Pos: [1d, 2d, 3d]}"
+        self.assertIsNone(get_entity_data_from_server_reply(log, "CleMooling"))
+
+    def test_get_entity_data_from_server_reply_invalid_raises_typeerror(self):
+        """测试实体数据无效时引发TypeError"""
+        for log in ["Invalid log without data", "X has data: {Pos: [1d, 2d"]:
+            with self.subTest(log=log):
+                with self.assertRaises(TypeError):
+                    get_entity_data_from_server_reply(log)
+
+    def test_get_position_from_entity_data(self):
+        """测试从实体数据构造MCPosition"""
+        data = {"Pos": [1.0, 2.0, 3.0], "Dimension": "minecraft:the_end"}
+        self.assertEqual(
+            get_position_from_entity_data(data),
+            MCPosition(Point3D(1.0, 2.0, 3.0), "the_end"),
+        )
+
+    def test_get_position_from_entity_data_missing_fields(self):
+        """测试实体数据缺少Pos或Dimension时引发TypeError"""
+        for data in [
+            {"Dimension": "minecraft:overworld"},
+            {"Pos": [1.0, 2.0], "Dimension": "minecraft:overworld"},
+            {"Pos": [1.0, 2.0, 3.0]},
+        ]:
+            with self.subTest(data=data):
+                with self.assertRaises(TypeError):
+                    get_position_from_entity_data(data)
+
+    def test_safe_parse_entity_pos(self):
+        """测试safe_parse_entity_pos返回Result"""
+        log = (
+            "CleMooling has the following entity data: "
+            '{Pos: [1.0d, 2.0d, 3.0d], Dimension: "minecraft:overworld"}'
+        )
+        self.assertEqual(
+            safe_parse_entity_pos(log, "CleMooling").unwrap(),
+            MCPosition(Point3D(1.0, 2.0, 3.0), "overworld"),
+        )
+        self.assertIsInstance(
+            safe_parse_entity_pos(
+                "No entity was found", "CleMooling"
+            ).failure(),
+            ValueError,
+        )
+
+    def test_split_entity_data_reply(self):
+        """测试拆分多个实体的回复，RCON无分隔符与控制台逐行两种格式"""
+        expected = {
+            "Alice": "[1.0d, 2.0d, 3.0d]",
+            "Bob_2": '"minecraft:the_nether"',
+        }
+        for content in (
+            "Alice has the following entity data: [1.0d, 2.0d, 3.0d]"
+            'Bob_2 has the following entity data: "minecraft:the_nether"',
+            "Alice has the following entity data: [1.0d, 2.0d, 3.0d]\n"
+            '[Team] Bob_2 has the following entity data: "minecraft:the_nether"',
+        ):
+            with self.subTest(content=content):
+                replies = split_entity_data_reply(content)
+                self.assertEqual(list(replies), list(expected))
+                self.assertEqual(
+                    get_point3d_from_server_reply(replies["Alice"]),
+                    Point3D(1.0, 2.0, 3.0),
+                )
+                self.assertEqual(
+                    get_dimension_from_server_reply(replies["Bob_2"]),
+                    "the_nether",
+                )
+        self.assertEqual(split_entity_data_reply(""), {})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,159 @@
+"""location_api.pos模块中位置缓存的测试"""
+
+import asyncio
+import unittest
+from unittest.mock import Mock, patch
+
+from returns.maybe import Some
+from returns.pipeline import is_successful
+from returns.result import Success
+
+# Mock ServerInterface.psi before importing location_api modules
+mock_psi = Mock()
+
+with patch("mcdreforged.api.all.ServerInterface.psi", return_value=mock_psi):
+    from location_api.pos import (
+        PositionCache,
+        get_player_pos,
+        invalidate_player_pos,
+        position_cache,
+    )
+    from tests.factories import make_pos
+
+
+class TestPositionCache(unittest.TestCase):
+    """PositionCache类的测试用例"""
+
+    def test_get_within_max_age(self):
+        """测试在最大缓存时间内可以读取缓存"""
+        cache = PositionCache()
+        cache.put("Alice", make_pos(1.0))
+        self.assertEqual(cache.get("Alice", max_age=10), make_pos(1.0))
+
+    def test_get_expired(self):
+        """测试超过最大缓存时间的缓存不会被返回"""
+        cache = PositionCache()
+        with patch("location_api.pos.time.monotonic", return_value=100.0):
+            cache.put("Alice", make_pos(1.0))
+        with patch("location_api.pos.time.monotonic", return_value=105.0):
+            self.assertIsNone(cache.get("Alice", max_age=1))
+            self.assertEqual(cache.get("Alice", max_age=5), make_pos(1.0))
+
+    def test_lru_eviction(self):
+        """测试超出容量时淘汰最久未使用的玩家"""
+        cache = PositionCache(maxsize=2)
+        cache.put("Alice", make_pos(1.0))
+        cache.put("Bob", make_pos(2.0))
+        cache.get("Alice", max_age=10)
+        cache.put("Carol", make_pos(3.0))
+
+        self.assertEqual(len(cache), 2)
+        self.assertIn("Alice", cache)
+        self.assertNotIn("Bob", cache)
+        self.assertIn("Carol", cache)
+
+    def test_invalidate_and_clear(self):
+        """测试手动失效和清空缓存"""
+        cache = PositionCache()
+        cache.put("Alice", make_pos(1.0))
+        cache.put("Bob", make_pos(2.0))
+        cache.invalidate("Alice")
+        cache.invalidate("Nobody")
+        self.assertNotIn("Alice", cache)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_put_after_invalidation(self):
+        """测试获取期间玩家被失效时不缓存位置"""
+        cache = PositionCache()
+        alice = cache.generation("Alice")
+        bob = cache.generation("Bob")
+        cache.invalidate("Alice")
+        cache.put("Alice", make_pos(1.0), generation=alice)
+        cache.put("Bob", make_pos(2.0), generation=bob)
+        self.assertNotIn("Alice", cache)
+        self.assertIn("Bob", cache)
+        bob = cache.generation("Bob")
+        cache.clear()
+        cache.put("Bob", make_pos(2.0), generation=bob)
+        self.assertNotIn("Bob", cache)
+
+    def test_invalid_maxsize(self):
+        """测试容量小于1时引发ValueError"""
+        with self.assertRaises(ValueError):
+            PositionCache(maxsize=0)
+
+
+class TestGetPlayerPosWithCache(unittest.IsolatedAsyncioTestCase):
+    """get_player_pos使用缓存的测试用例"""
+
+    def setUp(self):
+        invalidate_player_pos()
+        self.commands = []
+
+        async def rcon_get(_psi, command):
+            self.commands.append(command)
+            if command.endswith("Pos"):
+                return Success(
+                    Some("Alice has the following entity data: [1d, 64d, 0d]")
+                )
+            return Success(
+                Some(
+                    'Alice has the following entity data: "minecraft:overworld"'
+                )
+            )
+
+        self.rcon_get = rcon_get
+
+    def tearDown(self):
+        invalidate_player_pos()
+
+    async def test_max_age_uses_cache(self):
+        """测试提供max_age时命中缓存不再查询服务器"""
+        with patch("location_api.pos.rcon_get", self.rcon_get):
+            first = await get_player_pos("Alice")
+            second = await get_player_pos("Alice", max_age=60)
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.commands), 2)
+
+    async def test_without_max_age_always_queries(self):
+        """测试不提供max_age时总是查询服务器"""
+        with patch("location_api.pos.rcon_get", self.rcon_get):
+            await get_player_pos("Alice")
+            await get_player_pos("Alice")
+
+        self.assertEqual(len(self.commands), 4)
+
+    async def test_invalidate_player_pos(self):
+        """测试失效后重新查询服务器"""
+        with patch("location_api.pos.rcon_get", self.rcon_get):
+            await get_player_pos("Alice")
+            invalidate_player_pos("Alice")
+            self.assertNotIn("Alice", position_cache)
+            await get_player_pos("Alice", max_age=60)
+
+        self.assertEqual(len(self.commands), 4)
+
+    async def test_invalidate_during_lookup(self):
+        """测试查询进行中玩家离开时，结果不会重新写入缓存"""
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_rcon_get(psi, command):
+            started.set()
+            await release.wait()
+            return await self.rcon_get(psi, command)
+
+        with patch("location_api.pos.rcon_get", slow_rcon_get):
+            lookup = asyncio.ensure_future(get_player_pos("Alice"))
+            await started.wait()
+            invalidate_player_pos("Alice")
+            release.set()
+            self.assertTrue(is_successful(await lookup))
+
+        self.assertNotIn("Alice", position_cache)
+
+
+if __name__ == "__main__":
+    unittest.main()
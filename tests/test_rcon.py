@@ -0,0 +1,238 @@
+"""location_api.rcon模块中RCON连接与连接池的测试"""
+
+import asyncio
+import unittest
+
+from returns.result import Success
+
+from location_api import MCPosition, Point3D
+from location_api.pos import get_player_pos, set_transport
+from location_api.rcon import (
+    MAX_RESPONSE_BODY,
+    SERVERDATA_AUTH,
+    SERVERDATA_AUTH_RESPONSE,
+    SERVERDATA_EXECCOMMAND,
+    SERVERDATA_RESPONSE_VALUE,
+    PooledRconTransport,
+    RconConnection,
+    encode_packet,
+    read_packet,
+)
+
+
+class FakeServer:
+    """模拟的RCON服务端，按命令前缀回复并可延迟或乱序回复"""
+
+    def __init__(self, password: str = "secret"):
+        self.password = password
+        self.connections = 0
+        self.commands: list[str] = []
+        self.delays: dict[str, float] = {}
+        self.active = 0
+        self.max_active = 0
+        self._server: asyncio.Server | None = None
+        self._writers: set[asyncio.StreamWriter] = set()
+
+    async def start(self) -> int:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.drop_all()
+        self._server.close()  # ty: ignore[possibly-missing-attribute]
+        await self._server.wait_closed()  # ty: ignore[possibly-missing-attribute]
+
+    def drop_all(self):
+        """断开所有连接"""
+        for writer in self._writers:
+            writer.close()
+
+    def answer(self, command: str) -> str:
+        if command.startswith("echo "):
+            return command[5:]
+        if command == "data get entity Steve Pos":
+            return "Steve has the following entity data: [1.0d, 2.0d, 3.0d]"
+        if command == "data get entity Steve Dimension":
+            return 'Steve has the following entity data: "minecraft:overworld"'
+        return "Unknown or incomplete command, see below for error"
+
+    async def _reply(self, writer, request_id: int, command: str):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delays.get(command, 0.0))
+        finally:
+            self.active -= 1
+        data = self.answer(command).encode("utf-8")
+        for start in range(0, max(len(data), 1), MAX_RESPONSE_BODY):
+            writer.write(
+                encode_packet(
+                    request_id,
+                    SERVERDATA_RESPONSE_VALUE,
+                    data[start : start + MAX_RESPONSE_BODY].decode(),
+                )
+            )
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        self._writers.add(writer)
+        replies = set()
+        try:
+            while True:
+                request_id, packet_type, body = await read_packet(reader)
+                if packet_type == SERVERDATA_AUTH:
+                    ok = body.decode() == self.password
+                    writer.write(
+                        encode_packet(
+                            request_id if ok else -1,
+                            SERVERDATA_AUTH_RESPONSE,
+                            "",
+                        )
+                    )
+                elif packet_type == SERVERDATA_EXECCOMMAND:
+                    self.commands.append(body.decode())
+                    reply = asyncio.ensure_future(
+                        self._reply(writer, request_id, body.decode())
+                    )
+                    replies.add(reply)
+                    reply.add_done_callback(replies.discard)
+                else:
+                    writer.write(
+                        encode_packet(
+                            request_id,
+                            SERVERDATA_RESPONSE_VALUE,
+                            f"Unknown request {packet_type:x}",
+                        )
+                    )
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+
+class TestRcon(unittest.IsolatedAsyncioTestCase):
+    """RCON连接与连接池的测试用例"""
+
+    async def asyncSetUp(self):
+        self.server = FakeServer()
+        self.port = await self.server.start()
+
+    async def asyncTearDown(self):
+        set_transport()
+        await self.server.stop()
+
+    def make_pool(self, **kwargs) -> PooledRconTransport:
+        pool = PooledRconTransport(port=self.port, password="secret", **kwargs)
+        self.addCleanup(pool.close)
+        return pool
+
+    async def test_command_and_long_response(self):
+        """测试执行命令，超过一个包的回复被拼接"""
+        connection = RconConnection("127.0.0.1", self.port, "secret")
+        await connection.connect()
+        self.assertTrue(connection.connected)
+        self.assertEqual(await connection.command("echo hello"), "hello")
+        text = "0123456789" * 1000
+        self.assertEqual(await connection.command(f"echo {text}"), text)
+        connection.close()
+        self.assertFalse(connection.connected)
+        with self.assertRaises(ConnectionError):
+            await connection.command("echo hello")
+
+    async def test_response_of_full_packets(self):
+        """测试长度恰为整包的回复也能结束"""
+        connection = RconConnection("127.0.0.1", self.port, "secret")
+        await connection.connect()
+        for size in (0, MAX_RESPONSE_BODY, MAX_RESPONSE_BODY * 2):
+            text = "x" * size
+            reply = await asyncio.wait_for(
+                connection.command(f"echo {text}"), 1.0
+            )
+            self.assertEqual(reply, text)
+        connection.close()
+
+    async def test_wrong_password(self):
+        """测试密码错误时返回PermissionError"""
+        pool = PooledRconTransport(port=self.port, password="wrong")
+        result = await pool.query("echo hello")
+        self.assertIsInstance(result.failure(), PermissionError)
+        self.assertEqual(pool.connected, 0)
+
+    async def test_pipelined_responses_by_request_id(self):
+        """测试流水线请求按请求ID对应乱序的回复"""
+        connection = RconConnection(
+            "127.0.0.1", self.port, "secret", pipeline=2
+        )
+        await connection.connect()
+        self.server.delays["echo slow"] = 0.05
+        slow = asyncio.ensure_future(connection.command("echo slow"))
+        fast = asyncio.ensure_future(connection.command("echo fast"))
+        self.assertEqual(await fast, "fast")
+        self.assertFalse(slow.done())
+        self.assertEqual(await slow, "slow")
+        connection.close()
+
+    async def test_pool_reuses_connections(self):
+        """测试连接池复用连接，且并发数不超过连接数乘流水线深度"""
+        pool = self.make_pool(connections=3)
+        self.server.delays["echo wait"] = 0.02
+        results = await asyncio.gather(
+            *(pool.query("echo wait") for _ in range(12))
+        )
+        self.assertTrue(all(r == Success("wait") for r in results))
+        self.assertEqual(self.server.connections, 3)
+        self.assertEqual(pool.connected, 3)
+        self.assertEqual(self.server.max_active, 3)
+        await pool.query("echo again")
+        self.assertEqual(self.server.connections, 3)
+
+    async def test_sequential_queries_use_one_connection(self):
+        """测试顺序查询只打开一个连接"""
+        pool = self.make_pool(connections=4)
+        for _ in range(5):
+            await pool.query("echo hello")
+        self.assertEqual(self.server.connections, 1)
+
+    async def test_timeout_then_recover(self):
+        """测试超时返回TimeoutError，之后的查询不受迟到回复影响"""
+        pool = self.make_pool(connections=1, timeout=0.05)
+        self.server.delays["echo late"] = 0.1
+        result = await pool.query("echo late")
+        self.assertIsInstance(result.failure(), TimeoutError)
+        await asyncio.sleep(0.1)
+        self.assertEqual(await pool.query("echo next"), Success("next"))
+
+    async def test_reconnect_after_lost_connection(self):
+        """测试连接断开时等待中的查询失败，之后重新连接"""
+        pool = self.make_pool(connections=1)
+        self.server.delays["echo never"] = 10.0
+        pending = asyncio.ensure_future(pool.query("echo never"))
+        await asyncio.sleep(0.02)
+        self.server.drop_all()
+        self.assertIsInstance((await pending).failure(), ConnectionError)
+        self.assertEqual(await pool.query("echo back"), Success("back"))
+        self.assertEqual(self.server.connections, 2)
+
+    async def test_get_player_pos_through_pool(self):
+        """测试通过连接池获取玩家位置"""
+        set_transport(self.make_pool())
+        result = await get_player_pos("Steve")
+        self.assertEqual(
+            result, Success(MCPosition(Point3D(1.0, 2.0, 3.0), "overworld"))
+        )
+        self.assertEqual(
+            self.server.commands,
+            ["data get entity Steve Pos", "data get entity Steve Dimension"],
+        )
+
+    def test_invalid_arguments(self):
+        """测试连接数或流水线深度小于1时引发ValueError"""
+        with self.assertRaises(ValueError):
+            PooledRconTransport(connections=0)
+        with self.assertRaises(ValueError):
+            PooledRconTransport(pipeline=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,259 @@
+"""location_api.region模块中区域与区块的测试"""
+
+import math
+import random
+import unittest
+
+from location_api import Point2D, Point3D
+from location_api.region import BoundingBox, ChunkPos, RegionPos, RegionSet
+from tests.factories import make_pos
+
+
+class TestChunkAndRegion(unittest.TestCase):
+    """ChunkPos与RegionPos的测试用例"""
+
+    def test_chunk_from_point(self):
+        """测试方块坐标到区块坐标的转换，包括负坐标"""
+        self.assertEqual(
+            ChunkPos.from_point(Point3D(0.0, 0.0, 15.9)), ChunkPos(0, 0)
+        )
+        self.assertEqual(
+            ChunkPos.from_point(Point3D(16.0, 0.0, -0.1)), ChunkPos(1, -1)
+        )
+        self.assertEqual(
+            ChunkPos.from_point(Point2D(-16.0, -17.0)), ChunkPos(-1, -2)
+        )
+        self.assertEqual(
+            ChunkPos.from_point(make_pos(-524.5, 71.0, -66.5)),
+            ChunkPos(-33, -5),
+        )
+
+    def test_region_from_point_and_chunk(self):
+        """测试区块与方块坐标到区域坐标的转换"""
+        self.assertEqual(
+            RegionPos.from_point(Point3D(511.9, 0.0, 512.0)), RegionPos(0, 1)
+        )
+        self.assertEqual(
+            RegionPos.from_point(make_pos(-1.0, 0.0, -513.0)),
+            RegionPos(-1, -2),
+        )
+        self.assertEqual(ChunkPos(-33, 31).region, RegionPos(-2, 0))
+        self.assertEqual(
+            RegionPos.from_chunk(ChunkPos(32, -1)), RegionPos(1, -1)
+        )
+        self.assertEqual(RegionPos(0, -1).file_name, "r.0.-1.mca")
+
+    def test_region_chunks(self):
+        """测试区域包含32x32个区块"""
+        chunks = list(RegionPos(-1, 0).chunks())
+        self.assertEqual(len(chunks), 1024)
+        self.assertTrue(
+            all(chunk.region == RegionPos(-1, 0) for chunk in chunks)
+        )
+
+    def test_chunk_to_box(self):
+        """测试区块转为包围盒"""
+        box = ChunkPos(-1, 2).to_box()
+        self.assertEqual(box, BoundingBox(-16, -64.0, 32, 0, 320.0, 48))
+        self.assertTrue(box.contains(Point3D(-0.5, 0.0, 40.0)))
+
+    def test_hashable(self):
+        """测试区块坐标可以作为字典键"""
+        self.assertEqual(
+            len({ChunkPos(1, 2), ChunkPos(1, 2), RegionPos(1, 2)}), 2
+        )
+
+
+class TestBoundingBox(unittest.TestCase):
+    """BoundingBox类的测试用例"""
+
+    def test_invalid_box(self):
+        """测试最小角超过最大角时引发ValueError"""
+        with self.assertRaises(ValueError):
+            BoundingBox(1.0, 0.0, 0.0, 0.0, 1.0, 1.0)
+
+    def test_from_corners_and_contains(self):
+        """测试任意顺序的两角构造与包含判断，表面包含在内"""
+        box = BoundingBox.from_corners(
+            Point3D(10.0, 80.0, -5.0), Point3D(-10.0, 60.0, 5.0)
+        )
+        self.assertEqual(box, BoundingBox(-10.0, 60.0, -5.0, 10.0, 80.0, 5.0))
+        self.assertTrue(box.contains(Point3D(0.0, 70.0, 0.0)))
+        self.assertTrue(box.contains(Point3D(10.0, 80.0, 5.0)))
+        self.assertFalse(box.contains(Point3D(10.1, 70.0, 0.0)))
+        self.assertTrue(box.contains(make_pos(0.0, 70.0, 0.0, "the_nether")))
+        self.assertEqual(box.center, Point3D(0.0, 70.0, 0.0))
+
+    def test_from_blocks(self):
+        """测试按方块选区构造包围盒"""
+        box = BoundingBox.from_blocks(
+            Point3D(15.0, 255.0, 15.0), Point3D(0.0, 0.0, 0.0)
+        )
+        self.assertEqual(box, BoundingBox(0, 0, 0, 16, 256, 16))
+        self.assertTrue(box.contains(Point3D(15.7, 10.0, 15.7)))
+
+    def test_intersects(self):
+        """测试包围盒相交判断"""
+        box = BoundingBox(0.0, 0.0, 0.0, 10.0, 10.0, 10.0)
+        self.assertTrue(
+            box.intersects(BoundingBox(10.0, 5.0, 5.0, 20.0, 20.0, 20.0))
+        )
+        self.assertFalse(
+            box.intersects(BoundingBox(10.1, 5.0, 5.0, 20.0, 20.0, 20.0))
+        )
+
+    def test_chunks(self):
+        """测试包围盒覆盖的区块"""
+        box = BoundingBox(-1.0, 0.0, 0.0, 16.0, 10.0, 15.0)
+        self.assertEqual(
+            set(box.chunks()),
+            {ChunkPos(-1, 0), ChunkPos(0, 0), ChunkPos(1, 0)},
+        )
+
+
+class TestRegionSet(unittest.TestCase):
+    """RegionSet类的测试用例"""
+
+    def setUp(self):
+        self.regions = RegionSet(
+            [
+                (
+                    "spawn",
+                    BoundingBox(-50.0, 0.0, -50.0, 50.0, 256.0, 50.0),
+                    "overworld",
+                ),
+                (
+                    "house",
+                    BoundingBox(10.0, 60.0, 10.0, 20.0, 70.0, 20.0),
+                    "overworld",
+                ),
+                (
+                    "hub",
+                    BoundingBox(-50.0, 0.0, -50.0, 50.0, 256.0, 50.0),
+                    "the_nether",
+                ),
+                (
+                    "world",
+                    BoundingBox(-1e6, -64.0, -1e6, 1e6, 320.0, 1e6),
+                    "overworld",
+                ),
+            ]
+        )
+
+    def test_regions_at(self):
+        """测试查询包含位置的区域，按添加顺序返回并区分维度"""
+        self.assertEqual(
+            self.regions.regions_at(make_pos(15.0, 65.0, 15.0)),
+            ["spawn", "house", "world"],
+        )
+        self.assertEqual(
+            self.regions.regions_at(make_pos(15.0, 100.0, 15.0)),
+            ["spawn", "world"],
+        )
+        self.assertEqual(
+            self.regions.regions_at(make_pos(1000.0, 100.0, 15.0)), ["world"]
+        )
+        self.assertEqual(
+            self.regions.regions_at(make_pos(0.0, 64.0, 0.0, "the_nether")),
+            ["hub"],
+        )
+        self.assertEqual(
+            self.regions.regions_at(make_pos(0.0, 64.0, 0.0, "the_end")), []
+        )
+
+    def test_infinite_box(self):
+        """测试无限大的区域在每次查询中都被检查，并能删除"""
+        self.regions.add(
+            "everywhere",
+            BoundingBox(
+                -math.inf, -math.inf, -math.inf, math.inf, math.inf, math.inf
+            ),
+            "overworld",
+        )
+        self.regions.add(
+            "east",
+            BoundingBox(0.0, -64.0, -math.inf, math.inf, 320.0, math.inf),
+            "overworld",
+        )
+        self.assertEqual(
+            self.regions.regions_at(make_pos(15.0, 65.0, 15.0)),
+            ["spawn", "house", "world", "everywhere", "east"],
+        )
+        self.assertEqual(
+            self.regions.regions_at(make_pos(-1e7, 65.0, 1e7)), ["everywhere"]
+        )
+        self.regions.remove("everywhere")
+        self.regions.remove("east")
+        self.assertEqual(
+            self.regions.regions_at(make_pos(-1e7, 65.0, 1e7)), []
+        )
+
+    def test_container_protocol(self):
+        """测试长度、成员判断、遍历与获取"""
+        self.assertEqual(len(self.regions), 4)
+        self.assertIn("house", self.regions)
+        self.assertEqual(
+            list(self.regions), ["spawn", "house", "hub", "world"]
+        )
+        _, dimension = self.regions.get("hub")  # ty: ignore[not-iterable]
+        self.assertEqual(dimension, "minecraft:the_nether")
+        self.assertIsNone(self.regions.get("nowhere"))
+
+    def test_duplicate_name(self):
+        """测试重复名称引发ValueError"""
+        with self.assertRaises(ValueError):
+            self.regions.add(
+                "house", BoundingBox(0, 0, 0, 1, 1, 1), "overworld"
+            )
+
+    def test_remove_and_clear(self):
+        """测试删除与清空区域"""
+        self.regions.remove("house")
+        self.regions.remove("world")
+        self.assertEqual(
+            self.regions.regions_at(make_pos(15.0, 65.0, 15.0)), ["spawn"]
+        )
+        with self.assertRaises(KeyError):
+            self.regions.remove("house")
+        self.regions.remove("spawn")
+        self.assertEqual(
+            self.regions.regions_at(make_pos(15.0, 65.0, 15.0)), []
+        )
+        self.assertEqual(
+            self.regions._buckets.keys(), {"minecraft:the_nether"}
+        )
+        self.regions.clear()
+        self.assertEqual(len(self.regions), 0)
+
+    def test_matches_linear_scan(self):
+        """测试与逐个检测的结果一致"""
+        rng = random.Random(0)
+        regions = RegionSet(max_chunks=64)
+        boxes = {}
+        for i in range(200):
+            corner = Point3D(
+                rng.uniform(-500, 500),
+                rng.uniform(0, 100),
+                rng.uniform(-500, 500),
+            )
+            size = rng.choice((5.0, 40.0, 300.0))
+            box = BoundingBox.from_corners(
+                corner,
+                Point3D(corner.x + size, corner.y + 50, corner.z + size),
+            )
+            boxes[f"r{i}"] = box
+            regions.add(f"r{i}", box, "overworld")
+        for _ in range(500):
+            position = make_pos(
+                rng.uniform(-600, 600),
+                rng.uniform(0, 150),
+                rng.uniform(-600, 600),
+            )
+            expected = [
+                name for name, box in boxes.items() if box.contains(position)
+            ]
+            self.assertEqual(regions.regions_at(position), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+"""location_api.snbt模块中SNBT解析函数的测试"""
+
+import unittest
+
+from location_api.snbt import SNBTError, parse_snbt, parse_snbt_prefix
+
+PLAYER_DATA = (
+    "{Brain: {memories: {}}, HurtByTimestamp: 0, SleepTimer: 0s, "
+    'Attributes: [{Base: 0.10000000149011612d, Name: "minecraft:movement_speed"}], '
+    "Invulnerable: 0b, FallFlying: 0b, PortalCooldown: 0, AbsorptionAmount: 0.0f, "
+    "UUID: [I; -1434523422, 1119634394, -1550706427, 1187358117], "
+    'Inventory: [{Slot: 0b, id: "minecraft:written_book", Count: 1b, '
+    "tag: {title: 'It\\'s [not] {a} list', author: \"Cle\\\"Mooling\"}}], "
+    "Motion: [0.0d, -0.0784000015258789d, 0.0d], "
+    'Pos: [-524.5d, 71.0d, -66.5d], Dimension: "minecraft:the_nether", '
+    "Rotation: [90.0f, -12.5f], OnGround: 1b}"
+)
+
+
+class TestSNBTParsing(unittest.TestCase):
+    """SNBT解析函数的测试用例"""
+
+    def test_parse_snbt_numbers(self):
+        """测试带有不同后缀的数字"""
+        self.assertEqual(parse_snbt("1b"), 1)
+        self.assertEqual(parse_snbt("-3s"), -3)
+        self.assertEqual(parse_snbt("12L"), 12)
+        self.assertEqual(parse_snbt("42"), 42)
+        self.assertIsInstance(parse_snbt("42"), int)
+        self.assertEqual(parse_snbt("1.5f"), 1.5)
+        self.assertEqual(parse_snbt("-524.5d"), -524.5)
+        self.assertIsInstance(parse_snbt("71d"), float)
+        self.assertEqual(parse_snbt("0.5"), 0.5)
+
+    def test_parse_snbt_strings(self):
+        """测试带引号和不带引号的字符串"""
+        self.assertEqual(
+            parse_snbt('"minecraft:overworld"'), "minecraft:overworld"
+        )
+        self.assertEqual(parse_snbt("'single'"), "single")
+        self.assertEqual(parse_snbt('"a\\"b\\\\c"'), 'a"b\\c')
+        self.assertEqual(parse_snbt("plain_word"), "plain_word")
+        self.assertIs(parse_snbt("true"), True)
+
+    def test_parse_snbt_lists_and_arrays(self):
+        """测试列表和类型数组"""
+        self.assertEqual(parse_snbt("[1.0d, 2.0d, 3.0d]"), [1.0, 2.0, 3.0])
+        self.assertEqual(parse_snbt("[I; 1, -2, 3]"), [1, -2, 3])
+        self.assertEqual(parse_snbt("[B;]"), [])
+        self.assertEqual(parse_snbt("[]"), [])
+
+    def test_parse_snbt_compound(self):
+        """测试嵌套复合标签"""
+        self.assertEqual(
+            parse_snbt('{a: {b: [1b, 2b]}, "quoted key": "v"}'),
+            {"a": {"b": [1, 2]}, "quoted key": "v"},
+        )
+        self.assertEqual(parse_snbt("{}"), {})
+
+    def test_parse_snbt_player_data_with_keys(self):
+        """测试只保留指定键时解析完整的玩家数据"""
+        data = parse_snbt(
+            PLAYER_DATA, keys=("Pos", "Dimension", "Rotation", "Motion")
+        )
+        self.assertEqual(
+            data,
+            {
+                "Motion": [0.0, -0.0784000015258789, 0.0],
+                "Pos": [-524.5, 71.0, -66.5],
+                "Dimension": "minecraft:the_nether",
+                "Rotation": [90.0, -12.5],
+            },
+        )
+
+    def test_parse_snbt_player_data_without_keys(self):
+        """测试不指定键时解析完整的玩家数据"""
+        data = parse_snbt(PLAYER_DATA)
+        self.assertEqual(
+            data["Inventory"][0]["tag"],  # ty: ignore[not-subscriptable]
+            {"title": "It's [not] {a} list", "author": 'Cle"Mooling'},
+        )
+        self.assertEqual(data["OnGround"], 1)  # ty: ignore[not-subscriptable]
+
+    def test_parse_snbt_prefix(self):
+        """测试解析文本中间的值并返回结束位置"""
+        text = "A: [1d, 2d, 3d] B: [4d, 5d, 6d]"
+        value, end = parse_snbt_prefix(text, 3)
+        self.assertEqual(value, [1.0, 2.0, 3.0])
+        value, _ = parse_snbt_prefix(text, text.index("[", end))
+        self.assertEqual(value, [4.0, 5.0, 6.0])
+
+    def test_parse_snbt_invalid(self):
+        """测试无效的SNBT文本引发SNBTError"""
+        for text in [
+            "{Pos: [1d, 2d",
+            "{Pos 1}",
+            '"unterminated',
+            "[1, 2] x",
+            "",
+        ]:
+            with self.subTest(text=text):
+                with self.assertRaises(SNBTError):
+                    parse_snbt(text)
+
+    def test_parse_snbt_invalid_skipped_value(self):
+        """测试被跳过的值不完整时也引发SNBTError"""
+        with self.assertRaises(SNBTError):
+            parse_snbt("{Brain: {memories: {}", keys=("Pos",))
+
+
+if __name__ == "__main__":
+    unittest.main()
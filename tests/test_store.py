@@ -0,0 +1,130 @@
+"""location_api.store模块中位置存储的测试"""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from location_api.store import LocationStore
+from tests.factories import make_location
+
+
+class TestLocationStore(unittest.TestCase):
+    """LocationStore类的测试用例"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "locations.json")
+        self.store = LocationStore(
+            [
+                make_location("spawn", other={"owner": "Alice"}),
+                make_location("farm"),
+                make_location("fortress", dimension="the_nether"),
+            ],
+            path=self.path,
+        )
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_lookup_by_name(self):
+        """测试按名称查找位置"""
+        self.assertEqual(len(self.store), 3)
+        self.assertIn("farm", self.store)
+        self.assertEqual(self.store.get("farm"), make_location("farm"))
+        self.assertIsNone(self.store.get("home"))
+        self.assertEqual(self.store.names, ["spawn", "farm", "fortress"])
+
+    def test_filter_by_dimension(self):
+        """测试按维度筛选位置"""
+        self.assertEqual(
+            [loc.name for loc in self.store.in_dimension("overworld")],
+            ["spawn", "farm"],
+        )
+        self.assertEqual(self.store.in_dimension("the_end"), [])
+        self.assertEqual(
+            self.store.dimensions,
+            frozenset({"minecraft:overworld", "minecraft:the_nether"}),
+        )
+
+    def test_add_and_remove(self):
+        """测试添加、覆盖和删除位置"""
+        with self.assertRaises(ValueError):
+            self.store.add(make_location("farm"))
+        self.store.add(
+            make_location("farm", dimension="the_end"), overwrite=True
+        )
+        self.assertEqual(
+            [loc.name for loc in self.store.in_dimension("overworld")],
+            ["spawn"],
+        )
+        self.assertEqual(
+            self.store.get("farm").dimension,  # ty: ignore[possibly-missing-attribute]
+            "minecraft:the_end",
+        )
+
+        removed = self.store.remove("fortress")
+        self.assertEqual(removed.name, "fortress")
+        self.assertNotIn("minecraft:the_nether", self.store.dimensions)
+        with self.assertRaises(KeyError):
+            self.store.remove("fortress")
+
+    def test_load_many_is_all_or_nothing(self):
+        """测试批量添加时有重复名称则不添加任何位置"""
+        with self.assertRaises(ValueError):
+            self.store.load_many(
+                [make_location("home"), make_location("spawn")]
+            )
+        self.assertNotIn("home", self.store)
+        self.store.load_many([make_location("home").asdict()])
+        self.assertEqual(self.store.get("home"), make_location("home"))
+
+    def test_save_and_load(self):
+        """测试保存到文件后重新加载"""
+        self.store.save_many()
+        loaded = LocationStore.load(self.path)
+        self.assertEqual(list(loaded), list(self.store))
+        self.assertEqual(loaded.path, self.path)
+        self.assertEqual(os.listdir(self.directory.name), ["locations.json"])
+
+    @unittest.skipIf(os.name == "nt", "POSIX permissions only")
+    def test_save_keeps_file_mode(self):
+        """测试保存后文件保留原有权限，新文件使用默认权限"""
+        with patch("location_api.utils._UMASK", 0o022):
+            self.store.save_many()
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o644)
+        os.chmod(self.path, 0o640)
+        self.store.save_many()
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o640)
+
+    def test_load_missing_file(self):
+        """测试加载不存在的文件得到空存储"""
+        store = LocationStore.load(self.path)
+        self.assertEqual(len(store), 0)
+
+    def test_load_invalid_file(self):
+        """测试加载格式错误的文件引发ValueError"""
+        with open(self.path, "w", encoding="utf-8") as file:
+            json.dump({"spawn": {}}, file)
+        with self.assertRaises(ValueError):
+            LocationStore.load(self.path)
+
+    def test_failed_save_keeps_old_file(self):
+        """测试保存失败时保留原文件且不留下临时文件"""
+        self.store.save_many()
+        self.store.add(make_location("home"))
+        with patch("location_api.store.json.dumps", side_effect=OSError):
+            with self.assertRaises(OSError):
+                self.store.save_many()
+        self.assertEqual(len(LocationStore.load(self.path)), 3)
+        self.assertEqual(os.listdir(self.directory.name), ["locations.json"])
+
+    def test_save_without_path(self):
+        """测试没有路径时保存引发ValueError"""
+        with self.assertRaises(ValueError):
+            LocationStore().save_many()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,209 @@
+"""location_api.tracker模块中位置追踪服务的测试"""
+
+import asyncio
+import unittest
+from unittest.mock import Mock, patch
+
+from returns.result import Failure, Success
+
+# Mock ServerInterface.psi before importing location_api modules
+mock_psi = Mock()
+
+with patch("mcdreforged.api.all.ServerInterface.psi", return_value=mock_psi):
+    from location_api.history import PositionHistory
+    from location_api.tracker import PositionTracker
+    from tests.factories import make_pos
+
+
+class TestPositionTracker(unittest.IsolatedAsyncioTestCase):
+    """PositionTracker类的测试用例"""
+
+    def setUp(self):
+        self.polled = []
+
+        async def get_players_pos(players, **_kwargs):
+            players = sorted(players)
+            self.polled.append(players)
+            return {
+                player: Success(make_pos(float(len(self.polled))))
+                if player != "Ghost"
+                else Failure(ValueError("No data received for Ghost!"))
+                for player in players
+            }
+
+        self.patcher = patch(
+            "location_api.tracker.get_players_pos", get_players_pos
+        )
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    async def test_poll_updates_table(self):
+        """测试轮询后可以同步读取位置"""
+        tracker = PositionTracker()
+        tracker.add_player("Alice")
+        tracker.add_player("Ghost")
+        self.assertIsNone(tracker.get("Alice"))
+
+        await tracker.poll()
+
+        tracked = tracker.get("Alice")
+        self.assertIsNotNone(tracked)
+        self.assertEqual(tracked.position, make_pos(1.0))  # ty: ignore[possibly-missing-attribute]
+        self.assertIsNone(tracker.get("Ghost"))
+        self.assertEqual(self.polled, [["Alice", "Ghost"]])
+
+    async def test_failed_poll_keeps_previous_sample(self):
+        """测试获取失败时保留上一次的位置"""
+        tracker = PositionTracker()
+        tracker.add_player("Alice")
+        await tracker.poll()
+
+        async def failing(players, **_kwargs):
+            return {player: Failure(TimeoutError()) for player in players}
+
+        with patch("location_api.tracker.get_players_pos", failing):
+            await tracker.poll()
+
+        self.assertEqual(tracker.get("Alice").position, make_pos(1.0))  # ty: ignore[possibly-missing-attribute]
+
+    async def test_poll_with_snapshot_query(self):
+        """测试使用选择器快照轮询，只记录追踪中的玩家"""
+        tracker = PositionTracker(snapshot_query=True)
+        tracker.add_player("Alice")
+
+        async def snapshot_all_positions():
+            return Success({"Alice": make_pos(5.0), "Bob": make_pos(6.0)})
+
+        with patch(
+            "location_api.tracker.snapshot_all_positions",
+            snapshot_all_positions,
+        ):
+            await tracker.poll()
+
+        self.assertEqual(tracker.get("Alice").position, make_pos(5.0))  # ty: ignore[possibly-missing-attribute]
+        self.assertIsNone(tracker.get("Bob"))
+        self.assertEqual(self.polled, [])
+
+    async def test_poll_records_history(self):
+        """测试轮询结果记录到历史，移除玩家时删除其历史"""
+        tracker = PositionTracker(history=PositionHistory())
+        tracker.add_player("Alice")
+        tracker.add_player("Ghost")
+        await tracker.poll()
+        await tracker.poll()
+
+        history = tracker.history
+        self.assertEqual(
+            [s.position for s in history.last("Alice", 5)],  # ty: ignore[possibly-missing-attribute]
+            [make_pos(1.0), make_pos(2.0)],
+        )
+        self.assertNotIn("Ghost", history)  # ty: ignore[unsupported-operator]
+        tracker.remove_player("Alice")
+        self.assertNotIn("Alice", history)  # ty: ignore[unsupported-operator]
+
+    async def test_get_with_max_age(self):
+        """测试max_age过滤过期的位置"""
+        tracker = PositionTracker()
+        tracker.add_player("Alice")
+        with patch("location_api.tracker.time.monotonic", return_value=100.0):
+            await tracker.poll()
+        with patch("location_api.tracker.time.monotonic", return_value=103.0):
+            self.assertIsNone(tracker.get("Alice", max_age=1))
+            self.assertIsNotNone(tracker.get("Alice", max_age=5))
+            self.assertEqual(tracker.get("Alice").age, 3.0)  # ty: ignore[possibly-missing-attribute]
+
+    async def test_remove_player(self):
+        """测试玩家离开后不再追踪并清除位置"""
+        tracker = PositionTracker()
+        tracker.set_players(["Alice", "Bob"])
+        await tracker.poll()
+        tracker.remove_player("Alice")
+
+        self.assertIsNone(tracker.get("Alice"))
+        self.assertEqual(tracker.players, frozenset({"Bob"}))
+        self.assertEqual(set(tracker.snapshot()), {"Bob"})
+
+        tracker.clear()
+        self.assertEqual(tracker.snapshot(), {})
+
+    async def test_players_near(self):
+        """测试查询附近的玩家，按距离排序并考虑维度"""
+        positions = {
+            "Alice": make_pos(3.0, 64.0, 4.0, "overworld"),
+            "Bob": make_pos(1.0, 64.0, 0.0, "overworld"),
+            "Carol": make_pos(0.0, 100.0, 0.0, "overworld"),
+            "Dave": make_pos(0.0, 64.0, 0.0, "the_nether"),
+            "Eve": make_pos(50.0, 64.0, 0.0, "overworld"),
+        }
+
+        async def get_players_pos(players, **_kwargs):
+            return {player: Success(positions[player]) for player in players}
+
+        tracker = PositionTracker()
+        tracker.set_players(positions)
+        with patch("location_api.tracker.get_players_pos", get_players_pos):
+            await tracker.poll()
+
+        center = make_pos(0.0, 64.0, 0.0, "minecraft:overworld")
+        self.assertEqual(
+            list(tracker.players_near(center, 5.0)), ["Bob", "Alice"]
+        )
+        self.assertEqual(
+            list(tracker.players_near(center, 5.0, horizontal=True)),
+            ["Carol", "Bob", "Alice"],
+        )
+        self.assertEqual(
+            tracker.players_near(center, 1.0)["Bob"].position, positions["Bob"]
+        )
+        self.assertEqual(tracker.players_near(center, -1.0), {})
+        with patch("location_api.tracker.time.monotonic", return_value=1e12):
+            self.assertEqual(tracker.players_near(center, 5.0, max_age=1), {})
+
+    async def test_poll_without_players(self):
+        """测试没有玩家时不查询服务器"""
+        tracker = PositionTracker()
+        await tracker.poll()
+        self.assertEqual(self.polled, [])
+
+    async def test_start_and_stop(self):
+        """测试后台轮询的启动和停止"""
+        tracker = PositionTracker(interval=0.01)
+        tracker.add_player("Alice")
+        tracker.start()
+        self.assertTrue(tracker.running)
+        await asyncio.sleep(0.05)
+        tracker.stop()
+        await asyncio.sleep(0.01)
+
+        self.assertFalse(tracker.running)
+        self.assertGreaterEqual(len(self.polled), 2)
+        polled = len(self.polled)
+        await asyncio.sleep(0.03)
+        self.assertEqual(len(self.polled), polled)
+
+    async def test_failed_poll_keeps_running(self):
+        """测试轮询引发异常时记录日志并继续轮询"""
+        calls = []
+
+        async def poll():
+            calls.append(None)
+            if len(calls) == 1:
+                raise RuntimeError("transport broke")
+
+        tracker = PositionTracker(interval=0.01)
+        tracker.poll = poll
+        with self.assertLogs("location_api.tracker", "ERROR") as logs:
+            tracker.start()
+            await asyncio.sleep(0.05)
+            tracker.stop()
+            await asyncio.sleep(0.01)
+
+        self.assertFalse(tracker.running)
+        self.assertGreaterEqual(len(calls), 2)
+        self.assertIn("transport broke", logs.output[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
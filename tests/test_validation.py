@@ -0,0 +1,121 @@
+"""location_api.validation模块中运行时类型检查模式的测试"""
+
+import os
+import tempfile
+import unittest
+
+from beartype.roar import BeartypeCallHintViolation
+
+from location_api import (
+    FrozenPoint3D,
+    Location,
+    MCPosition,
+    Point2D,
+    Point3D,
+)
+from location_api.store import LocationStore
+from location_api.validation import (
+    ValidationMode,
+    get_validation_mode,
+    set_validation_mode,
+    validation_mode,
+)
+
+
+class TestValidationMode(unittest.TestCase):
+    """运行时类型检查模式的测试用例"""
+
+    def tearDown(self):
+        set_validation_mode(ValidationMode.METHODS)
+
+    def test_default_mode_checks_methods_only(self):
+        """测试默认模式只检查方法调用，不检查构造"""
+        self.assertIs(get_validation_mode(), ValidationMode.METHODS)
+        point = Point3D("1", 2.0, 3.0)  # ty: ignore[invalid-argument-type]
+        self.assertEqual(point.x, "1")
+        with self.assertRaises(BeartypeCallHintViolation):
+            Point2D(1.0, 2.0).distance_to("point")  # ty: ignore[invalid-argument-type]
+
+    def test_strict_mode_checks_construction_and_methods(self):
+        """测试严格模式下检查构造和方法调用"""
+        set_validation_mode(ValidationMode.STRICT)
+        with self.assertRaises(BeartypeCallHintViolation):
+            Point3D("1", 2.0, 3.0)  # ty: ignore[invalid-argument-type]
+        with self.assertRaises(BeartypeCallHintViolation):
+            Point2D(1.0, 2.0).distance_to("point")  # ty: ignore[invalid-argument-type]
+
+    def test_strict_mode_accepts_int_as_float(self):
+        """测试严格模式下整数可以作为浮点数使用"""
+        set_validation_mode(ValidationMode.STRICT)
+        point = Point3D(1, 64, 3)
+        self.assertEqual(point.y, 64)
+
+    def test_boundary_mode_skips_internal_checks(self):
+        """测试边界模式下跳过构造和方法的检查"""
+        set_validation_mode("boundary")
+        point = Point3D("1", 2.0, 3.0)  # ty: ignore[invalid-argument-type]
+        self.assertEqual(point.x, "1")
+        self.assertAlmostEqual(
+            Point3D(0.0, 0.0, 0.0).distance_to(Point3D(3.0, 4.0, 0.0)),
+            5.0,
+            places=3,
+        )
+
+    def test_boundary_mode_keeps_from_dict_checked(self):
+        """测试边界模式下from_dict仍然被检查"""
+        set_validation_mode(ValidationMode.BOUNDARY)
+        with self.assertRaises(BeartypeCallHintViolation):
+            MCPosition.from_dict([("x", 1.0)])  # ty: ignore[invalid-argument-type]
+
+    def test_validation_mode_context_manager(self):
+        """测试临时切换模式后恢复原模式"""
+        with validation_mode("strict"):
+            self.assertIs(get_validation_mode(), ValidationMode.STRICT)
+            with self.assertRaises(BeartypeCallHintViolation):
+                Point3D("1", 2.0, 3.0)  # ty: ignore[invalid-argument-type]
+        self.assertIs(get_validation_mode(), ValidationMode.METHODS)
+        Point3D("1", 2.0, 3.0)  # ty: ignore[invalid-argument-type]
+
+    def test_unknown_mode(self):
+        """测试未知模式名称引发ValueError"""
+        with self.assertRaises(ValueError):
+            set_validation_mode("lenient")
+
+    def test_trusted_constructors(self):
+        """测试trusted构造方法在任何模式下都不检查"""
+        set_validation_mode(ValidationMode.STRICT)
+        point3d = Point3D.trusted(1.0, 2.0, 3.0)
+        point2d = Point2D.trusted(1.0, 3.0)
+        frozen = FrozenPoint3D.trusted(1.0, 2.0, 3.0)
+
+        self.assertEqual(point3d, Point3D(1.0, 2.0, 3.0))
+        self.assertEqual(point2d, Point2D(1.0, 3.0))
+        self.assertIsInstance(frozen, FrozenPoint3D)
+        self.assertEqual(hash(frozen), hash(FrozenPoint3D(1.0, 2.0, 3.0)))
+        self.assertEqual(Point3D.trusted("1", 2, 3).x, "1")  # ty: ignore[invalid-argument-type]
+
+    def test_data_classes_check_only_from_dict(self):
+        """测试MCPosition与Location在任何模式下只检查from_dict"""
+        set_validation_mode(ValidationMode.STRICT)
+        location = Location(MCPosition(Point3D(1.0, 2.0, 3.0), None), 1)  # ty: ignore[invalid-argument-type]
+        self.assertEqual(location.asdict()["name"], 1)
+        with self.assertRaises(BeartypeCallHintViolation):
+            Location.from_dict([("name", "a")])  # ty: ignore[invalid-argument-type]
+
+    def test_location_without_dimension(self):
+        """测试没有维度的Location可以序列化并存取"""
+        location = Location.from_dict(
+            {"x": 1.0, "y": 2.0, "z": 3.0, "name": "a"}
+        )
+        self.assertIsNone(location.dimension)
+        self.assertIsNone(location.asdict()["dimension"])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "locations.json")
+            LocationStore([location], path=path).save_many()
+            loaded = LocationStore.load(path)
+        self.assertEqual(loaded.get("a"), location)
+        self.assertEqual(list(loaded.in_dimension(None)), [location])  # ty: ignore[invalid-argument-type]
+
+
+if __name__ == "__main__":
+    unittest.main()